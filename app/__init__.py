@@ -22,23 +22,58 @@ def create_app(config_class=Config):
     db.init_app(app)
 
     with app.app_context():
+        
+        #PRAGMAs de SQLite del perfil activo (WAL, busy_timeout, ...)
+        from app.infrastructure.queries.connection import registrar_pragmas_sqlite
+        registrar_pragmas_sqlite(db.engine, app.config.get('SQLITE_PRAGMAS'))
        
         #Importo modelos
         from app.infrastructure.models.tarea_model import TareaModel
         from app.infrastructure.models.miembro_model import MiembroModel
         from app.infrastructure.models.proyecto_model import ProyectoModel
+        from app.infrastructure.models.proyecto_estadistica_model import ProyectoEstadisticaModel
+        from app.infrastructure.models.marca_tabla_model import MarcaTablaModel
+        from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
         
         #Importo rutas 
         from .presentation.routes.main import main as main_blueprint
         from .presentation.routes.proyecto_routes import proyectos_bp as proyecto_blueprint
         from .presentation.routes.tarea_routes import tareas_bp as tarea_blueprint
         from .presentation.routes.miembro_routes import miembros_bp as miembro_blueprint
+        from .presentation.routes.api_routes import api_bp as api_blueprint
+        from .presentation.routes.importacion_routes import importaciones_bp as importacion_blueprint
+        from .presentation.routes.exportacion_routes import exportaciones_bp as exportacion_blueprint
         
         #Reguistro las rutas en la app
         app.register_blueprint(main_blueprint)
         app.register_blueprint(proyecto_blueprint)
         app.register_blueprint(tarea_blueprint)
         app.register_blueprint(miembro_blueprint)
+        app.register_blueprint(api_blueprint)
+        app.register_blueprint(importacion_blueprint)
+        app.register_blueprint(exportacion_blueprint)
+        
+        #Métricas Prometheus (/metrics) agregadas entre procesos, antes de la instrumentación SQL
+        #para leer el tiempo en la base que esta deja en g
+        from .infrastructure.metricas.metricas import registrar_metricas
+        registrar_metricas(app)
+        
+        #Instrumentación SQL por petición (Server-Timing y /estado/sql), antes de la unidad de
+        #trabajo para que su after_request corra después del commit y cuente el flush final
+        from .infrastructure.queries.instrumentacion import registrar_instrumentacion_sql
+        registrar_instrumentacion_sql(app)
+        
+        #Una unidad de trabajo por petición: un solo commit al final
+        from .infrastructure.repositories.unidad_de_trabajo import registrar_unidad_de_trabajo_por_peticion
+        registrar_unidad_de_trabajo_por_peticion(app)
+        
+        #Caché de proyectos y miembros, invalidada por generación de tabla al confirmar escrituras
+        from .infrastructure.cache.cache_versionado import registrar_cache_referencia
+        registrar_cache_referencia(app)
+        
+        #Registro los comandos de consola (flask migrar-db, ...)
+        from .presentation.comandos import registrar_comandos
+        registrar_comandos(app)
         
     
     return app
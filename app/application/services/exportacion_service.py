@@ -0,0 +1,33 @@
+from typing import Iterator, Optional
+from app.domain.exceptions.proyecto_exceptions import NoEncontradoError
+from app.infrastructure.archivos.escritores import csv_gzip
+from app.infrastructure.repositories.tarea_repository import TareaRepository
+from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
+
+
+class ExportacionService:
+    """
+    Servicio de aplicación para exportar tareas y proyectos como CSV comprimido (gzip).
+    Las filas se leen con un cursor en lotes y se comprimen a medida que se generan,
+    así la memoria no depende de la cantidad de filas.
+    """
+    
+    def __init__(self):
+        self.tarea_repo = TareaRepository()
+        self.proyecto_repo = ProyectoRepository()
+    
+    def exportar_tareas(self, id_proyecto: Optional[int] = None) -> Iterator[bytes]:
+        """Caso de uso: Exportar todas las tareas (o las de un proyecto) con nombres de proyecto y miembro"""
+        if id_proyecto is not None and not self.proyecto_repo.obtener_ids_existentes([id_proyecto]):
+            raise NoEncontradoError("Proyecto", id_proyecto)
+        return csv_gzip(
+            self.tarea_repo.encabezado_exportacion(),
+            self.tarea_repo.iterar_exportacion(id_proyecto)
+        )
+    
+    def exportar_proyectos(self) -> Iterator[bytes]:
+        """Caso de uso: Exportar el reporte de proyectos (tareas por estado y cantidad de miembros)"""
+        return csv_gzip(
+            self.proyecto_repo.encabezado_reporte(),
+            self.proyecto_repo.iterar_reporte()
+        )
@@ -0,0 +1,148 @@
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, TextIO
+from app.application.services.tarea_service import TareaService
+from app.application.services.miembro_service import MiembroService
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError, NoEncontradoError
+from app.infrastructure.archivos.lectores import en_bloques, leer_registros
+from app.infrastructure.archivos.registro_errores import RegistroErrores
+from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
+from app.infrastructure.repositories.miembro_repository import MiembroRepository
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+
+
+class ImportacionService:
+    """
+    Servicio de aplicación para importar tareas y miembros desde CSV o NDJSON.
+    
+    El archivo se lee fila a fila y se procesa en bloques de TAMANO_BLOQUE: cada bloque
+    se valida con los casos de uso en lote (TareaValidator / MiembroValidator) y se
+    inserta en su propia transacción, de modo que la memoria no depende del tamaño del
+    archivo y un bloque fallido no deshace los anteriores. Las filas rechazadas se
+    escriben en un CSV de errores con su número de línea.
+    """
+    
+    TAMANO_BLOQUE = 1000
+    
+    def __init__(self):
+        self.tarea_service = TareaService()
+        self.miembro_service = MiembroService()
+        self.proyecto_repo = ProyectoRepository()
+        self.miembro_repo = MiembroRepository()
+    
+    def importar_miembros(
+        self,
+        flujo: BinaryIO,
+        formato: str,
+        destino_errores: TextIO,
+        al_progresar: Optional[Callable[[Dict], None]] = None,
+        tamano_bloque: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Caso de uso: Importar miembros (nombre, apellido, email, rol, fecha_ingreso).
+        Devuelve {'procesadas', 'creadas', 'errores'}.
+        """
+        return self._importar(
+            flujo, formato, destino_errores,
+            preparar=dict,
+            crear=self.miembro_service.crear_miembros_en_lote,
+            clave_creadas='creados',
+            al_progresar=al_progresar,
+            tamano_bloque=tamano_bloque
+        )
+    
+    def importar_tareas(
+        self,
+        flujo: BinaryIO,
+        formato: str,
+        destino_errores: TextIO,
+        al_progresar: Optional[Callable[[Dict], None]] = None,
+        tamano_bloque: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Caso de uso: Importar tareas (titulo, descripcion, prioridad, fecha_vencimiento).
+        El proyecto se indica con id_proyecto o por nombre (columna proyecto) y el miembro
+        con id_miembro_asignado o por email (columna email_miembro); nombres y emails se
+        resuelven con mapas cargados una sola vez al comenzar.
+        Devuelve {'procesadas', 'creadas', 'errores'}.
+        """
+        proyectos_por_nombre = self.proyecto_repo.obtener_mapa_nombres()
+        miembros_por_email = self.miembro_repo.obtener_mapa_emails()
+        return self._importar(
+            flujo, formato, destino_errores,
+            preparar=lambda fila: self._resolver_referencias(fila, proyectos_por_nombre, miembros_por_email),
+            crear=self.tarea_service.crear_tareas_en_lote,
+            clave_creadas='creadas',
+            al_progresar=al_progresar,
+            tamano_bloque=tamano_bloque
+        )
+    
+    def _importar(
+        self,
+        flujo: BinaryIO,
+        formato: str,
+        destino_errores: TextIO,
+        preparar: Callable[[Dict], Dict],
+        crear: Callable[[List[Dict]], Dict[str, list]],
+        clave_creadas: str,
+        al_progresar: Optional[Callable[[Dict], None]],
+        tamano_bloque: Optional[int]
+    ) -> Dict[str, int]:
+        """Lee, valida e inserta bloque por bloque; cada bloque es una transacción"""
+        tamano_bloque = min(tamano_bloque or self.TAMANO_BLOQUE, self.tarea_service.LIMITE_LOTE)
+        errores = RegistroErrores(destino_errores)
+        resumen = {'procesadas': 0, 'creadas': 0, 'errores': 0}
+        
+        for bloque in en_bloques(leer_registros(flujo, formato), tamano_bloque):
+            # 1. Filas legibles y con referencias resueltas
+            lineas, originales, preparadas = [], [], []
+            for linea, fila, error in bloque:
+                if error is None:
+                    try:
+                        preparadas.append(preparar(fila))
+                        lineas.append(linea)
+                        originales.append(fila)
+                        continue
+                    except (DatoInvalidoError, NoEncontradoError) as e:
+                        error = str(e)
+                errores.agregar(linea, error, fila)
+            
+            # 2. Validación e inserción del bloque en su propia transacción
+            if preparadas:
+                try:
+                    with UnidadDeTrabajo(independiente=True):
+                        resultado = crear(preparadas)
+                    resumen['creadas'] += len(resultado[clave_creadas])
+                    for error in resultado['errores']:
+                        errores.agregar(lineas[error['fila']], error['error'], originales[error['fila']])
+                except DatoInvalidoError as e:
+                    # El bloque se revirtió entero: todas sus filas quedan como error
+                    for linea, fila in zip(lineas, originales):
+                        errores.agregar(linea, str(e), fila)
+            
+            resumen['procesadas'] += len(bloque)
+            resumen['errores'] = errores.cantidad
+            if al_progresar:
+                al_progresar(dict(resumen))
+        
+        return resumen
+    
+    @staticmethod
+    def _resolver_referencias(fila: Dict[str, Any], proyectos_por_nombre: Dict[str, Optional[int]],
+                              miembros_por_email: Dict[str, int]) -> Dict[str, Any]:
+        """Completa id_proyecto / id_miembro_asignado a partir de nombre de proyecto / email"""
+        fila = dict(fila)
+        nombre_proyecto = fila.pop('proyecto', None)
+        if fila.get('id_proyecto') is None and nombre_proyecto is not None:
+            if nombre_proyecto not in proyectos_por_nombre:
+                raise NoEncontradoError("Proyecto", nombre_proyecto)
+            if proyectos_por_nombre[nombre_proyecto] is None:
+                raise DatoInvalidoError(
+                    f"Hay varios proyectos llamados '{nombre_proyecto}': indique id_proyecto"
+                )
+            fila['id_proyecto'] = proyectos_por_nombre[nombre_proyecto]
+        
+        email_miembro = fila.pop('email_miembro', None)
+        if fila.get('id_miembro_asignado') is None and email_miembro is not None:
+            if email_miembro not in miembros_por_email:
+                raise NoEncontradoError("Miembro", email_miembro)
+            fila['id_miembro_asignado'] = miembros_por_email[email_miembro]
+        return fila
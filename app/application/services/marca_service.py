@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Optional
+from app.infrastructure.repositories.marca_repository import MarcaRepository
+
+
+class Marca:
+    """Validador de una respuesta: firma de las versiones leídas y fecha de última modificación"""
+    
+    __slots__ = ('firma', 'ultima_modificacion')
+    
+    def __init__(self, firma: str, ultima_modificacion: Optional[datetime]):
+        self.firma = firma
+        self.ultima_modificacion = ultima_modificacion
+
+
+class MarcaService:
+    """Servicio de aplicación que calcula las marcas de modificación usadas en GET condicionales"""
+    
+    def __init__(self):
+        self.marca_repo = MarcaRepository()
+    
+    def marca_listado(self, *tablas: str) -> Marca:
+        """Marca de un listado: cambia con cualquier escritura (incluidos borrados) en las tablas indicadas"""
+        versiones = self.marca_repo.versiones(tablas)
+        return Marca(
+            firma=self._firmar(versiones),
+            ultima_modificacion=self._mas_reciente(m for _, m in versiones.values())
+        )
+    
+    def marca_entidad(self, entidad: str, id_entidad: int, *tablas_relacionadas: str) -> Optional[Marca]:
+        """
+        Marca de un detalle: updated_at de la entidad más las versiones de las tablas
+        relacionadas que se muestran en la página. None si la entidad no existe.
+        """
+        updated_at = self.marca_repo.updated_at(entidad, id_entidad)
+        if updated_at is None:
+            return None
+        versiones = self.marca_repo.versiones(tablas_relacionadas)
+        return Marca(
+            firma=f"{entidad}:{id_entidad}:{updated_at.isoformat()}|{self._firmar(versiones)}",
+            ultima_modificacion=self._mas_reciente(
+                [updated_at, *(m for _, m in versiones.values())]
+            )
+        )
+    
+    @staticmethod
+    def _firmar(versiones: dict) -> str:
+        # La fecha distingue versiones iguales de una base recreada
+        return ",".join(
+            f"{tabla}={version}@{modificado_en}" for tabla, (version, modificado_en) in sorted(versiones.items())
+        )
+    
+    @staticmethod
+    def _mas_reciente(fechas) -> Optional[datetime]:
+        fechas = [f for f in fechas if f is not None]
+        return max(fechas) if fechas else None
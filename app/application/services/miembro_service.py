@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from app.domain.entities.miembro import Miembro
 from app.domain.exceptions.proyecto_exceptions import (
     DatoInvalidoError, 
@@ -9,10 +9,16 @@ from app.domain.exceptions.proyecto_exceptions import (
 from app.application.validators.miembro_validator import MiembroValidator
 from app.infrastructure.repositories.miembro_repository import MiembroRepository
 from app.infrastructure.models.miembro_model import MiembroModel
+from app.infrastructure.repositories.paginacion import Pagina
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+from app.infrastructure.cache.cache_versionado import en_cache
 
 class MiembroService:
     """Servicio de aplicación para gestionar miembros con Flask-SQLAlchemy"""
     
+    # Máximo de filas por llamada a crear_miembros_en_lote
+    LIMITE_LOTE = 5000
+    
     def __init__(self):
         self.miembro_repo = MiembroRepository()
         self.validator = MiembroValidator()
@@ -63,10 +69,71 @@ class MiembroService:
             # Log del error aquí si es necesario
             raise DatoInvalidoError(f"Error al crear miembro: {str(e)}")
     
+    def crear_miembros_en_lote(self, filas: List[Dict[str, Any]]) -> Dict[str, list]:
+        """
+        Caso de uso: Crear muchos miembros en una sola transacción.
+        Los emails se verifican con una consulta para todo el lote (y contra el propio lote);
+        las filas inválidas se informan por índice sin detener el resto.
+        Devuelve {'creados': [{'fila', 'id_miembro'}], 'errores': [{'fila', 'error'}]}.
+        """
+        try:
+            if not isinstance(filas, list) or not filas:
+                raise DatoInvalidoError("El lote debe ser una lista con al menos un miembro")
+            if len(filas) > self.LIMITE_LOTE:
+                raise DatoInvalidoError(f"El lote no puede superar {self.LIMITE_LOTE} miembros")
+            
+            # 1. Construir y validar cada fila (sin acceder a la BD)
+            candidatos, errores = [], []
+            for indice, fila in enumerate(filas):
+                try:
+                    if not isinstance(fila, dict):
+                        raise DatoInvalidoError("Cada fila debe ser un objeto")
+                    miembro = Miembro(
+                        nombre=fila.get('nombre'),
+                        apellido=fila.get('apellido'),
+                        email=fila.get('email'),
+                        rol=fila.get('rol'),
+                        fecha_ingreso=fila.get('fecha_ingreso')
+                    )
+                    self.validator.validar(miembro)
+                    candidatos.append((indice, miembro))
+                except Exception as e:
+                    errores.append({'fila': indice, 'error': str(e)})
+            
+            # 2. Email único: una consulta para el lote y un conjunto para repetidos dentro del lote
+            registrados = self.miembro_repo.obtener_emails_existentes(m.email for _, m in candidatos)
+            validos = []
+            for indice, miembro in candidatos:
+                if miembro.email in registrados:
+                    errores.append({
+                        'fila': indice,
+                        'error': str(EmailDuplicadoError(f"El email '{miembro.email}' ya está registrado"))
+                    })
+                else:
+                    registrados.add(miembro.email)
+                    validos.append((indice, miembro))
+            
+            # 3. Insertar en una transacción
+            with UnidadDeTrabajo():
+                ids = self.miembro_repo.crear_en_lote(
+                    [MiembroModel.valores_desde_entity(miembro) for _, miembro in validos]
+                )
+            
+            return {
+                'creados': [{'fila': indice, 'id_miembro': id_miembro} for (indice, _), id_miembro in zip(validos, ids)],
+                'errores': sorted(errores, key=lambda e: e['fila'])
+            }
+            
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al crear miembros en lote: {str(e)}")
+    
     def listar_todos(self) -> List[Miembro]:
         """Lista todos los miembros (alias para compatibilidad)"""
         return self.listar_miembros()
     
+    @en_cache('miembros')
     def obtener_miembro(self, id_miembro: int) -> Optional[Miembro]:
         """Obtiene un miembro por ID"""
         miembro_model = self.miembro_repo.obtener_por_id(id_miembro)
@@ -74,6 +141,27 @@ class MiembroService:
             raise NoEncontradoError("Miembro", id_miembro)
         return miembro_model.to_entity()
     
+    def obtener_miembro_detalle(self, id_miembro: int) -> Dict:
+        """
+        Obtiene un miembro con sus proyectos y tareas para la vista de detalle.
+        Usa el perfil de carga 'miembro_con_tareas_y_proyectos': el número de
+        consultas es fijo sin importar cuántos proyectos o tareas tenga.
+        """
+        miembro_model = self.miembro_repo.obtener_por_id(
+            id_miembro, perfil='miembro_con_tareas_y_proyectos'
+        )
+        if not miembro_model:
+            raise NoEncontradoError("Miembro", id_miembro)
+        
+        return {
+            'miembro': miembro_model.to_entity(),
+            'proyectos': [pm.to_entity() for pm in miembro_model.proyectos],
+            'tareas': [tm.to_entity() for tm in miembro_model.tareas],
+            'nombres_proyecto': {
+                tm.proyecto.id_proyecto: tm.proyecto.nombre for tm in miembro_model.tareas
+            }
+        }
+    
     def obtener_miembro_por_email(self, email: str) -> Optional[Miembro]:
         """Obtiene un miembro por email"""
         try:
@@ -82,6 +170,7 @@ class MiembroService:
         except Exception as e:
             raise NoEncontradoError("Miembro", f"email: {email}")
     
+    @en_cache('miembros')
     def listar_miembros(self, rol: str = None) -> List[Miembro]:
         """Lista todos los miembros, opcionalmente filtrados por rol"""
         try:
@@ -99,6 +188,53 @@ class MiembroService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar miembros: {str(e)}")
     
+    def listar_miembros_paginados(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        rol: str = None
+    ) -> Pagina:
+        """Lista una página de miembros (paginación por cursor), opcionalmente por rol"""
+        try:
+            if rol:
+                self.validator.validar_rol(rol)
+            pagina = self.miembro_repo.obtener_pagina(cursor=cursor, limite=limite, rol=rol)
+            return pagina.transformar(lambda mm: mm.to_entity())
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al listar miembros: {str(e)}")
+    
+    def listar_campos_paginados(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        rol: str = None
+    ) -> Pagina:
+        """Página de miembros como diccionarios con solo los campos pedidos (API)"""
+        if rol:
+            self.validator.validar_rol(rol)
+        return self.miembro_repo.obtener_pagina_campos(campos, cursor, limite, rol=rol)
+    
+    def recorrer_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        rol: str = None
+    ) -> Iterator[Dict]:
+        """Todos los miembros desde el cursor, en streaming, con solo los campos pedidos (API)"""
+        if rol:
+            self.validator.validar_rol(rol)
+        return self.miembro_repo.iterar_campos(campos, cursor, rol=rol)
+    
+    def obtener_campos(self, id_miembro: int, campos: Optional[List[str]] = None) -> Dict:
+        """Un miembro como diccionario con solo los campos pedidos (API)"""
+        fila = self.miembro_repo.obtener_campos(id_miembro, campos)
+        if fila is None:
+            raise NoEncontradoError("Miembro", id_miembro)
+        return fila
+    
     def actualizar_miembro(
         self,
         id_miembro: int,
@@ -1,5 +1,6 @@
 # app/application/services/proyecto_service.py
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
 from app.domain.entities.proyecto import Proyecto
 from app.domain.entities.miembro import Miembro
 from app.application.validators.proyecto_validator import ProyectoValidator
@@ -12,13 +13,21 @@ from app.domain.exceptions.proyecto_exceptions import (
 from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
 from app.infrastructure.repositories.miembro_repository import MiembroRepository
 from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.repositories.estadistica_repository import EstadisticaRepository
+from app.infrastructure.repositories.paginacion import Pagina
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+from app.infrastructure.cache.cache_versionado import en_cache
 
 class ProyectoService:
     """Servicio de aplicación para gestionar proyectos con Flask-SQLAlchemy"""
     
+    # Tareas borradas por transacción al eliminar un proyecto grande
+    TAMANO_BLOQUE_BORRADO = 5000
+    
     def __init__(self):
         self.proyecto_repo = ProyectoRepository()
         self.miembro_repo = MiembroRepository()
+        self.estadistica_repo = EstadisticaRepository()
         self.validator = ProyectoValidator()
     
     def crear_proyecto(
@@ -56,6 +65,7 @@ class ProyectoService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al crear proyecto: {str(e)}")
     
+    @en_cache('proyectos')
     def obtener_proyecto(self, id_proyecto: int) -> Optional[Proyecto]:
         """Obtiene un proyecto por ID"""
         proyecto_model = self.proyecto_repo.obtener_por_id(id_proyecto)
@@ -63,6 +73,31 @@ class ProyectoService:
             raise NoEncontradoError("Proyecto", id_proyecto)
         return proyecto_model.to_entity()
     
+    def obtener_proyecto_detalle(self, id_proyecto: int) -> Dict:
+        """
+        Obtiene un proyecto con sus miembros y tareas para la vista de detalle.
+        Usa el perfil de carga 'proyecto_completo': el número de consultas es
+        fijo sin importar cuántos miembros o tareas tenga el proyecto.
+        """
+        proyecto_model = self.proyecto_repo.obtener_por_id(id_proyecto, perfil='proyecto_completo')
+        if not proyecto_model:
+            raise NoEncontradoError("Proyecto", id_proyecto)
+        
+        tareas_model = proyecto_model.tareas
+        return {
+            'proyecto': proyecto_model.to_entity(),
+            'miembros': [mm.to_entity() for mm in proyecto_model.miembros],
+            'tareas': [tm.to_entity() for tm in tareas_model],
+            'nombres_miembro': {
+                tm.asignado_a.id_miembro: f"{tm.asignado_a.nombre} {tm.asignado_a.apellido}"
+                for tm in tareas_model if tm.asignado_a
+            },
+            'tareas_por_miembro': dict(Counter(
+                tm.id_miembro_asignado for tm in tareas_model if tm.id_miembro_asignado
+            ))
+        }
+    
+    @en_cache('proyectos')
     def listar_proyectos(self, estado: str = None) -> List[Proyecto]:
         """Lista todos los proyectos, opcionalmente filtrados por estado"""
         try:
@@ -79,6 +114,79 @@ class ProyectoService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar proyectos: {str(e)}")
     
+    def listar_proyectos_paginados(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        estado: str = None
+    ) -> Pagina:
+        """Lista una página de proyectos (paginación por cursor), opcionalmente por estado"""
+        try:
+            if estado:
+                self.validator.validar_estado(estado)
+            pagina = self.proyecto_repo.obtener_pagina(cursor=cursor, limite=limite, estado=estado)
+            return pagina.transformar(lambda pm: pm.to_entity())
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al listar proyectos: {str(e)}")
+    
+    def listar_proyectos_con_progreso(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        estado: str = None
+    ) -> Pagina:
+        """
+        Página de proyectos con su avance: cada elemento es {'proyecto', 'progreso'}.
+        El progreso de toda la página sale de una sola consulta agregada, no de una por proyecto.
+        """
+        try:
+            pagina = self.listar_proyectos_paginados(cursor=cursor, limite=limite, estado=estado)
+            progreso = self.proyecto_repo.obtener_progreso(p.id_proyecto for p in pagina)
+            vacio = {'total': 0, 'completadas': 0, 'bloqueadas': 0, 'vencidas': 0, 'miembros': 0}
+            
+            def _con_progreso(proyecto: Proyecto) -> Dict:
+                datos = dict(progreso.get(proyecto.id_proyecto, vacio))
+                datos['porcentaje'] = round(100 * datos['completadas'] / datos['total']) if datos['total'] else 0
+                return {'proyecto': proyecto, 'progreso': datos}
+            
+            return pagina.transformar(_con_progreso)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al listar proyectos: {str(e)}")
+    
+    def listar_campos_paginados(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        estado: str = None
+    ) -> Pagina:
+        """Página de proyectos como diccionarios con solo los campos pedidos (API)"""
+        if estado:
+            self.validator.validar_estado(estado)
+        return self.proyecto_repo.obtener_pagina_campos(campos, cursor, limite, estado=estado)
+    
+    def recorrer_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        estado: str = None
+    ) -> Iterator[Dict]:
+        """Todos los proyectos desde el cursor, en streaming, con solo los campos pedidos (API)"""
+        if estado:
+            self.validator.validar_estado(estado)
+        return self.proyecto_repo.iterar_campos(campos, cursor, estado=estado)
+    
+    def obtener_campos(self, id_proyecto: int, campos: Optional[List[str]] = None) -> Dict:
+        """Un proyecto como diccionario con solo los campos pedidos (API)"""
+        fila = self.proyecto_repo.obtener_campos(id_proyecto, campos)
+        if fila is None:
+            raise NoEncontradoError("Proyecto", id_proyecto)
+        return fila
+    
     def actualizar_proyecto(
         self,
         id_proyecto: int,
@@ -127,14 +235,26 @@ class ProyectoService:
             raise DatoInvalidoError(f"Error al actualizar proyecto: {str(e)}")
     
     def eliminar_proyecto(self, id_proyecto: int) -> bool:
-        """Elimina un proyecto"""
+        """
+        Elimina un proyecto con sus tareas y membresías.
+        Las tareas se borran en bloques de TAMANO_BLOQUE_BORRADO, cada uno en su propia
+        transacción, para no retener el bloqueo de escritura durante todo el borrado;
+        el último bloque, las membresías y el proyecto se confirman juntos.
+        Los contadores se borran con cada bloque: si se leen a mitad del borrado
+        se recalculan sobre las tareas que quedan.
+        """
         try:
             # Verificar que existe
             proyecto = self.obtener_proyecto(id_proyecto)
             if not proyecto:
                 raise NoEncontradoError("Proyecto", id_proyecto)
             
-            return self.proyecto_repo.eliminar(id_proyecto)
+            while True:
+                with UnidadDeTrabajo(independiente=True):
+                    borradas = self.proyecto_repo.eliminar_tareas(id_proyecto, self.TAMANO_BLOQUE_BORRADO)
+                    self.estadistica_repo.eliminar(id_proyecto)
+                    if borradas < self.TAMANO_BLOQUE_BORRADO:
+                        return self.proyecto_repo.eliminar(id_proyecto)
             
         except (NoEncontradoError, DatoInvalidoError):
             raise
@@ -171,6 +291,37 @@ class ProyectoService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al agregar miembro al proyecto: {str(e)}")
     
+    def sincronizar_miembros(self, id_proyecto: int, ids_miembro: Iterable[int]) -> Dict:
+        """
+        Caso de uso: dejar como miembros del proyecto exactamente los indicados.
+        La diferencia se calcula en SQL y se aplica con un DELETE y un INSERT en lote,
+        en una sola transacción. En un proyecto inactivo no se permiten altas: si las hubiera,
+        lanza ProyectoInactivoError sin modificar nada.
+        Devuelve {'agregados', 'removidos', 'inexistentes'} (IDs de miembro ignorados).
+        """
+        try:
+            proyecto = self.obtener_proyecto(id_proyecto)
+            ids_miembro = {int(id_miembro) for id_miembro in ids_miembro}
+            existentes = self.miembro_repo.obtener_ids_existentes(ids_miembro)
+            
+            if not proyecto.esta_activo() and self.proyecto_repo.contar_miembros_faltantes(id_proyecto, existentes):
+                raise ProyectoInactivoError(id_proyecto, proyecto.estado)
+            
+            with UnidadDeTrabajo():
+                agregados, removidos = self.proyecto_repo.sincronizar_miembros(id_proyecto, existentes)
+            
+            return {
+                'agregados': agregados,
+                'removidos': removidos,
+                'inexistentes': sorted(ids_miembro - existentes)
+            }
+        except (NoEncontradoError, ProyectoInactivoError, DatoInvalidoError):
+            raise
+        except (TypeError, ValueError):
+            raise DatoInvalidoError("Los IDs de miembro deben ser números enteros")
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al sincronizar miembros del proyecto: {str(e)}")
+    
     def remover_miembro_de_proyecto(
         self,
         id_proyecto: int,
@@ -182,6 +333,7 @@ class ProyectoService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al remover miembro del proyecto: {str(e)}")
     
+    @en_cache('proyectos', 'proyecto_miembro', 'miembros')
     def obtener_miembros_del_proyecto(self, id_proyecto: int) -> List[Miembro]:
         """Obtiene todos los miembros de un proyecto"""
         try:
@@ -1,7 +1,9 @@
 # app/application/services/tarea_service.py
-from typing import List, Optional, Dict
+from collections import Counter, defaultdict
+from typing import Any, Iterator, List, Optional, Dict
 from datetime import date
 from app.domain.entities.tarea import Tarea
+from app.domain.consultas.tarea_filtro import TareaFiltro
 from app.application.validators.tarea_validator import TareaValidator
 from app.domain.exceptions.proyecto_exceptions import (
     DatoInvalidoError,
@@ -13,14 +15,36 @@ from app.infrastructure.repositories.tarea_repository import TareaRepository
 from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
 from app.infrastructure.repositories.miembro_repository import MiembroRepository
 from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.repositories.estadistica_repository import EstadisticaRepository
+from app.infrastructure.repositories.paginacion import Pagina
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+from app.infrastructure.metricas.metricas import (
+    TAREAS_CREADAS,
+    TAREAS_ELIMINADAS,
+    TAREAS_TRANSICIONES,
+    contar_al_confirmar
+)
 
 class TareaService:
     """Servicio de aplicación para gestionar tareas con Flask-SQLAlchemy"""
     
+    # Máximo de filas por llamada a los casos de uso en lote
+    LIMITE_LOTE = 5000
+    
+    # Campos que actualizar_tareas_en_lote copia tal cual a la entidad
+    CAMPOS_ACTUALIZABLES = ('titulo', 'descripcion', 'prioridad', 'estado', 'fecha_vencimiento')
+    
+    # Las tareas completadas de proyectos en estos estados se mueven a tareas_archivadas
+    ESTADOS_PROYECTO_ARCHIVABLES = ('finalizado', 'cancelado')
+    
+    # Tareas movidas por transacción al archivar o restaurar
+    TAMANO_BLOQUE_ARCHIVO = 5000
+    
     def __init__(self):
         self.tarea_repo = TareaRepository()
         self.proyecto_repo = ProyectoRepository()
         self.miembro_repo = MiembroRepository()
+        self.estadistica_repo = EstadisticaRepository()
         self.validator = TareaValidator()
     
     def crear_tarea(
@@ -43,15 +67,7 @@ class TareaService:
             
             # Validar que el miembro existe y pertenece al proyecto (si se asigna)
             if id_miembro_asignado:
-                miembro = self.miembro_repo.obtener_por_id(id_miembro_asignado)
-                if not miembro:
-                    raise NoEncontradoError("Miembro", id_miembro_asignado)
-                
-                # Validar que el miembro está en el proyecto
-                if miembro not in proyecto.miembros:
-                    raise AsignacionInvalidaError(
-                        f"El miembro {id_miembro_asignado} no pertenece al proyecto {id_proyecto}"
-                    )
+                self._validar_miembro_del_proyecto(id_proyecto, id_miembro_asignado)
             
             # Crear entidad
             tarea = Tarea(
@@ -70,7 +86,10 @@ class TareaService:
             
             # Convertir a modelo y persistir
             tarea_model = TareaModel.from_entity(tarea)
-            tarea_model = self.tarea_repo.crear(tarea_model)
+            with UnidadDeTrabajo():
+                tarea_model = self.tarea_repo.crear(tarea_model)
+                self.estadistica_repo.ajustar(id_proyecto, None, tarea_model.estado)
+                contar_al_confirmar(TAREAS_CREADAS)
             
             return tarea_model.to_entity()
             
@@ -79,39 +98,326 @@ class TareaService:
         except Exception as e:
             raise DatoInvalidoError(f"Error al crear tarea: {str(e)}")
     
+    def crear_tareas_en_lote(self, filas: List[Dict[str, Any]]) -> Dict[str, list]:
+        """
+        Caso de uso: Crear muchas tareas en una sola transacción.
+        Proyectos, miembros y membresías se resuelven con una consulta cada uno para
+        todo el lote; las filas válidas se insertan con un INSERT en lote y las
+        inválidas se informan por índice sin detener el resto.
+        Devuelve {'creadas': [{'fila', 'id_tarea'}], 'errores': [{'fila', 'error'}]}.
+        """
+        try:
+            self._validar_tamano_lote(filas)
+            hoy = date.today().isoformat()
+            
+            # 1. Construir y validar cada fila (sin acceder a la BD)
+            candidatas, errores = [], []
+            for indice, fila in enumerate(filas):
+                try:
+                    if not isinstance(fila, dict):
+                        raise DatoInvalidoError("Cada fila debe ser un objeto")
+                    id_miembro = self._entero_opcional(fila.get('id_miembro_asignado'), 'id_miembro_asignado')
+                    tarea = Tarea(
+                        titulo=fila.get('titulo'),
+                        id_proyecto=self._entero_opcional(fila.get('id_proyecto'), 'id_proyecto'),
+                        descripcion=fila.get('descripcion') or "",
+                        id_miembro_asignado=id_miembro,
+                        prioridad=fila.get('prioridad') or "media",
+                        estado="en_progreso" if id_miembro else "pendiente",
+                        fecha_creacion=hoy,
+                        fecha_vencimiento=fila.get('fecha_vencimiento') or None
+                    )
+                    self.validator.validar(tarea)
+                    candidatas.append((indice, tarea))
+                except Exception as e:
+                    errores.append({'fila': indice, 'error': str(e)})
+            
+            # 2. Resolver referencias una vez por lote
+            ids_proyecto = {t.id_proyecto for _, t in candidatas}
+            proyectos = self.proyecto_repo.obtener_ids_existentes(ids_proyecto)
+            miembros = self.miembro_repo.obtener_ids_existentes(
+                {t.id_miembro_asignado for _, t in candidatas if t.id_miembro_asignado}
+            )
+            membresias = self.proyecto_repo.obtener_membresias(proyectos)
+            
+            validas = []
+            for indice, tarea in candidatas:
+                error = self._error_de_referencias(tarea, tarea.id_miembro_asignado, proyectos, miembros, membresias)
+                if error:
+                    errores.append({'fila': indice, 'error': str(error)})
+                else:
+                    validas.append((indice, tarea))
+            
+            # 3. Insertar y ajustar contadores en una transacción
+            deltas = defaultdict(Counter)
+            for _, tarea in validas:
+                deltas[tarea.id_proyecto][tarea.estado] += 1
+            
+            with UnidadDeTrabajo():
+                ids = self.tarea_repo.crear_en_lote(
+                    [TareaModel.valores_desde_entity(tarea) for _, tarea in validas]
+                )
+                self.estadistica_repo.ajustar_en_lote(deltas)
+                contar_al_confirmar(TAREAS_CREADAS, len(ids))
+            
+            return {
+                'creadas': [{'fila': indice, 'id_tarea': id_tarea} for (indice, _), id_tarea in zip(validas, ids)],
+                'errores': sorted(errores, key=lambda e: e['fila'])
+            }
+            
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al crear tareas en lote: {str(e)}")
+    
+    def actualizar_tareas_en_lote(self, filas: List[Dict[str, Any]]) -> Dict[str, list]:
+        """
+        Caso de uso: Actualizar muchas tareas en una sola transacción.
+        Cada fila lleva id_tarea y los campos a cambiar (titulo, descripcion, prioridad,
+        estado, fecha_vencimiento, id_miembro_asignado; null en este último desasigna).
+        Devuelve {'actualizadas': [{'fila', 'id_tarea'}], 'errores': [{'fila', 'error'}]}.
+        """
+        try:
+            self._validar_tamano_lote(filas)
+            
+            # 1. Cargar todas las tareas del lote con una consulta
+            modelos = {
+                tm.id_tarea: tm
+                for tm in self.tarea_repo.obtener_por_ids(list(self._ids_del_lote(filas, 'id_tarea')))
+            }
+            
+            # 2. Resolver referencias una vez por lote
+            proyectos = {tm.id_proyecto for tm in modelos.values()}
+            miembros = self.miembro_repo.obtener_ids_existentes(
+                self._ids_del_lote(filas, 'id_miembro_asignado')
+            )
+            membresias = self.proyecto_repo.obtener_membresias(proyectos)
+            
+            # 3. Aplicar y validar cada fila
+            cambios, actualizadas, errores = [], [], []
+            deltas = defaultdict(Counter)
+            transiciones = Counter()
+            vistas = set()
+            for indice, fila in enumerate(filas):
+                try:
+                    if not isinstance(fila, dict):
+                        raise DatoInvalidoError("Cada fila debe ser un objeto")
+                    id_tarea = self._entero_opcional(fila.get('id_tarea'), 'id_tarea')
+                    if id_tarea not in modelos:
+                        raise NoEncontradoError("Tarea", id_tarea)
+                    if id_tarea in vistas:
+                        raise DatoInvalidoError(f"La tarea {id_tarea} aparece más de una vez en el lote")
+                    vistas.add(id_tarea)
+                    
+                    tarea = modelos[id_tarea].to_entity()
+                    estado_anterior = tarea.estado
+                    for campo in self.CAMPOS_ACTUALIZABLES:
+                        if campo in fila:
+                            setattr(tarea, campo, fila[campo])
+                    
+                    if 'id_miembro_asignado' in fila:
+                        id_miembro = self._entero_opcional(fila['id_miembro_asignado'], 'id_miembro_asignado')
+                        if id_miembro is None:
+                            tarea.desasignar_miembro()
+                        else:
+                            self.validator.validar_asignacion(tarea, id_miembro)
+                            error = self._error_de_referencias(tarea, id_miembro, proyectos, miembros, membresias)
+                            if error:
+                                raise error
+                            tarea.asignar_miembro(id_miembro)
+                    
+                    self.validator.validar(tarea)
+                    
+                    cambios.append({'id_tarea': id_tarea, **TareaModel.valores_desde_entity(tarea)})
+                    actualizadas.append({'fila': indice, 'id_tarea': id_tarea})
+                    deltas[tarea.id_proyecto][estado_anterior] -= 1
+                    deltas[tarea.id_proyecto][tarea.estado] += 1
+                    if tarea.estado != estado_anterior:
+                        transiciones[(estado_anterior, tarea.estado)] += 1
+                except Exception as e:
+                    errores.append({'fila': indice, 'error': str(e)})
+            
+            # 4. Escribir y ajustar contadores en una transacción
+            with UnidadDeTrabajo():
+                self.tarea_repo.actualizar_en_lote(cambios)
+                self.estadistica_repo.ajustar_en_lote(deltas)
+                for (desde, hacia), cantidad in transiciones.items():
+                    contar_al_confirmar(TAREAS_TRANSICIONES, cantidad, desde=desde, hacia=hacia)
+            
+            return {'actualizadas': actualizadas, 'errores': errores}
+            
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al actualizar tareas en lote: {str(e)}")
+    
     def obtener_tarea(self, id_tarea: int) -> Optional[Tarea]:
-        """Obtiene una tarea por ID"""
-        tarea_model = self.tarea_repo.obtener_por_id(id_tarea)
+        """Obtiene una tarea por ID (también si está archivada)"""
+        tarea_model = self.tarea_repo.obtener_por_id(id_tarea, incluir_archivadas=True)
         if not tarea_model:
             raise NoEncontradoError("Tarea", id_tarea)
         return tarea_model.to_entity()
     
+    def obtener_tarea_detalle(self, id_tarea: int) -> Dict:
+        """Obtiene una tarea (también si está archivada) con su proyecto y miembro asignado"""
+        tarea_model = self.tarea_repo.obtener_por_id(id_tarea, perfil='tarea_completa', incluir_archivadas=True)
+        if not tarea_model:
+            raise NoEncontradoError("Tarea", id_tarea)
+        return {
+            'tarea': tarea_model.to_entity(),
+            'proyecto': tarea_model.proyecto.to_entity() if tarea_model.proyecto else None,
+            'miembro_asignado': tarea_model.asignado_a.to_entity() if tarea_model.asignado_a else None,
+            'archivada': not isinstance(tarea_model, TareaModel)
+        }
+    
     def listar_tareas(self) -> List[Tarea]:
         """Lista todas las tareas"""
         try:
             
-            tareas_model = self.tarea_repo.obtener_todas()
+            filas = self.tarea_repo.obtener_filas()
             
-            return [tm.to_entity() for tm in tareas_model]
+            return [TareaModel.entity_desde_fila(fila) for fila in filas]
             
         except DatoInvalidoError:
             raise
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar tareas: {str(e)}")
     
+    def listar_tareas_paginadas(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Pagina:
+        """Lista una página de tareas (paginación por cursor), con filtros opcionales"""
+        try:
+            if estado:
+                self.validator.validar_estado(estado)
+            pagina = self.tarea_repo.obtener_pagina_filas(
+                cursor=cursor,
+                limite=limite,
+                id_proyecto=id_proyecto,
+                id_miembro=id_miembro,
+                estado=estado
+            )
+            return pagina.transformar(TareaModel.entity_desde_fila)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al listar tareas: {str(e)}")
+    
+    def listar_tareas_filtradas(
+        self,
+        filtro: TareaFiltro,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        con_nombres: bool = False
+    ) -> Pagina:
+        """
+        Lista una página de tareas que cumplen un TareaFiltro (filtros combinados y orden).
+        Con con_nombres devuelve TareaVista (nombre del proyecto y del responsable, misma consulta).
+        """
+        try:
+            filtro.validar()
+            pagina = self.tarea_repo.obtener_pagina_filtrada(
+                filtro, cursor=cursor, limite=limite, con_nombres=con_nombres
+            )
+            return pagina.transformar(
+                TareaModel.vista_desde_fila if con_nombres else TareaModel.entity_desde_fila
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al listar tareas: {str(e)}")
+    
+    def listar_campos_paginados(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        filtros: Optional[Dict] = None
+    ) -> Pagina:
+        """Página de tareas como diccionarios con solo los campos pedidos (API)"""
+        filtros = self._filtros_api(filtros)
+        return self.tarea_repo.obtener_pagina_campos(campos, cursor, limite, **filtros)
+    
+    def recorrer_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        filtros: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """Todas las tareas desde el cursor, en streaming, con solo los campos pedidos (API)"""
+        filtros = self._filtros_api(filtros)
+        return self.tarea_repo.iterar_campos(campos, cursor, **filtros)
+    
+    def obtener_campos(self, id_tarea: int, campos: Optional[List[str]] = None) -> Dict:
+        """Una tarea como diccionario con solo los campos pedidos (API)"""
+        fila = self.tarea_repo.obtener_campos(id_tarea, campos)
+        if fila is None:
+            raise NoEncontradoError("Tarea", id_tarea)
+        return fila
+    
+    def _filtros_api(self, filtros: Optional[Dict]) -> Dict:
+        """Valida los filtros de la API y los devuelve con los nombres del repositorio"""
+        filtros = filtros or {}
+        if filtros.get('estado'):
+            self.validator.validar_estado(filtros['estado'])
+        if filtros.get('prioridad'):
+            self.validator.validar_prioridad(filtros['prioridad'])
+        return {
+            'id_proyecto': filtros.get('id_proyecto'),
+            'id_miembro': filtros.get('id_miembro'),
+            'estado': filtros.get('estado'),
+            'prioridad': filtros.get('prioridad'),
+        }
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: Optional[TareaFiltro] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        con_nombres: bool = False
+    ) -> Pagina:
+        """
+        Busca tareas por texto en título y descripción, ordenadas por relevancia.
+        filtro admite las mismas condiciones que listar_tareas_filtradas, salvo orden
+        y archivadas. Con con_nombres devuelve TareaVista.
+        """
+        try:
+            filtro = filtro or TareaFiltro()
+            filtro.validar_busqueda()
+            pagina = self.tarea_repo.buscar(
+                texto,
+                filtro,
+                cursor=cursor,
+                limite=limite,
+                con_nombres=con_nombres
+            )
+            if con_nombres:
+                return pagina.transformar(TareaModel.vista_desde_fila)
+            return pagina.transformar(lambda tm: tm.to_entity())
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al buscar tareas: {str(e)}")
+    
     def listar_tareas_por_proyecto(self, id_proyecto: int) -> List[Tarea]:
         """Lista todas las tareas de un proyecto"""
         try:
-            tareas_model = self.tarea_repo.obtener_por_proyecto(id_proyecto)
-            return [tm.to_entity() for tm in tareas_model]
+            filas = self.tarea_repo.obtener_filas(id_proyecto=id_proyecto)
+            return [TareaModel.entity_desde_fila(fila) for fila in filas]
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar tareas del proyecto: {str(e)}")
     
     def listar_tareas_por_miembro(self, id_miembro: int) -> List[Tarea]:
         """Lista todas las tareas asignadas a un miembro"""
         try:
-            tareas_model = self.tarea_repo.obtener_por_miembro(id_miembro)
-            return [tm.to_entity() for tm in tareas_model]
+            filas = self.tarea_repo.obtener_filas(id_miembro=id_miembro)
+            return [TareaModel.entity_desde_fila(fila) for fila in filas]
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar tareas del miembro: {str(e)}")
     
@@ -119,8 +425,8 @@ class TareaService:
         """Lista tareas filtradas por estado"""
         try:
             self.validator.validar_estado(estado)
-            tareas_model = self.tarea_repo.obtener_por_estado(estado)
-            return [tm.to_entity() for tm in tareas_model]
+            filas = self.tarea_repo.obtener_filas(estado=estado)
+            return [TareaModel.entity_desde_fila(fila) for fila in filas]
         except Exception as e:
             raise DatoInvalidoError(f"Error al listar tareas por estado: {str(e)}")
     
@@ -175,8 +481,7 @@ class TareaService:
             self.validator.validar(tarea)
             
             # Actualizar modelo y persistir
-            tarea_model.actualizar_desde_entity(tarea)
-            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            tarea_model = self._persistir_cambios(tarea_model, tarea)
             
             return tarea_model.to_entity()
             
@@ -193,18 +498,8 @@ class TareaService:
             if not tarea_model:
                 raise NoEncontradoError("Tarea", id_tarea)
             
-            # Obtener proyecto
-            proyecto = self.proyecto_repo.obtener_por_id(tarea_model.id_proyecto)
-            
             # Validar que el miembro existe y pertenece al proyecto
-            miembro = self.miembro_repo.obtener_por_id(id_miembro)
-            if not miembro:
-                raise NoEncontradoError("Miembro", id_miembro)
-            
-            if miembro not in proyecto.miembros:
-                raise AsignacionInvalidaError(
-                    f"El miembro {id_miembro} no pertenece al proyecto de la tarea"
-                )
+            self._validar_miembro_del_proyecto(tarea_model.id_proyecto, id_miembro)
             
             # Convertir a entidad y asignar
             tarea = tarea_model.to_entity()
@@ -212,8 +507,7 @@ class TareaService:
             tarea.asignar_miembro(id_miembro)
             
             # Actualizar modelo y persistir
-            tarea_model.actualizar_desde_entity(tarea)
-            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            tarea_model = self._persistir_cambios(tarea_model, tarea)
             
             return tarea_model.to_entity()
             
@@ -232,8 +526,7 @@ class TareaService:
             tarea = tarea_model.to_entity()
             tarea.desasignar_miembro()
             
-            tarea_model.actualizar_desde_entity(tarea)
-            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            tarea_model = self._persistir_cambios(tarea_model, tarea)
             
             return tarea_model.to_entity()
             
@@ -253,8 +546,7 @@ class TareaService:
             self.validator.validar_completado(tarea)
             tarea.completar()
             
-            tarea_model.actualizar_desde_entity(tarea)
-            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            tarea_model = self._persistir_cambios(tarea_model, tarea)
             
             return tarea_model.to_entity()
             
@@ -273,8 +565,7 @@ class TareaService:
             tarea = tarea_model.to_entity()
             tarea.bloquear()
             
-            tarea_model.actualizar_desde_entity(tarea)
-            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            tarea_model = self._persistir_cambios(tarea_model, tarea)
             
             return tarea_model.to_entity()
             
@@ -291,25 +582,154 @@ class TareaService:
             if not tarea:
                 raise NoEncontradoError("Tarea", id_tarea)
             
-            return self.tarea_repo.eliminar(id_tarea)
+            with UnidadDeTrabajo():
+                eliminada = self.tarea_repo.eliminar(id_tarea)
+                if eliminada:
+                    self.estadistica_repo.ajustar(tarea.id_proyecto, tarea.estado, None)
+                    contar_al_confirmar(TAREAS_ELIMINADAS)
+            return eliminada
             
         except (NoEncontradoError, DatoInvalidoError):
             raise
         except Exception as e:
             raise DatoInvalidoError(f"Error al eliminar tarea: {str(e)}")
     
+    def archivar_tareas(self, tamano_bloque: Optional[int] = None) -> int:
+        """
+        Mueve a tareas_archivadas las tareas completadas de los proyectos en
+        ESTADOS_PROYECTO_ARCHIVABLES, en bloques de TAMANO_BLOQUE_ARCHIVO, cada uno en su
+        propia transacción. Los contadores del proyecto no cambian: las siguen contando.
+        Devuelve la cantidad de tareas archivadas.
+        """
+        try:
+            tamano_bloque = tamano_bloque or self.TAMANO_BLOQUE_ARCHIVO
+            total = 0
+            while True:
+                with UnidadDeTrabajo(independiente=True):
+                    movidas = self.tarea_repo.archivar_bloque(self.ESTADOS_PROYECTO_ARCHIVABLES, tamano_bloque)
+                total += movidas
+                if movidas < tamano_bloque:
+                    return total
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al archivar tareas: {str(e)}")
+    
+    def restaurar_tareas(
+        self,
+        id_proyecto: Optional[int] = None,
+        ids_tarea: Optional[List[int]] = None,
+        tamano_bloque: Optional[int] = None
+    ) -> int:
+        """
+        Devuelve a tareas las tareas archivadas de un proyecto o con los ids dados,
+        en bloques como archivar_tareas. Devuelve la cantidad de tareas restauradas.
+        """
+        try:
+            if id_proyecto is None and not ids_tarea:
+                raise DatoInvalidoError("Indique el proyecto o las tareas a restaurar")
+            if id_proyecto is not None and not self.proyecto_repo.obtener_por_id(id_proyecto):
+                raise NoEncontradoError("Proyecto", id_proyecto)
+            tamano_bloque = tamano_bloque or self.TAMANO_BLOQUE_ARCHIVO
+            total = 0
+            while True:
+                with UnidadDeTrabajo(independiente=True):
+                    movidas = self.tarea_repo.restaurar_bloque(tamano_bloque, id_proyecto, ids_tarea)
+                total += movidas
+                if movidas < tamano_bloque:
+                    return total
+        except (NoEncontradoError, DatoInvalidoError):
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al restaurar tareas: {str(e)}")
+    
+    def _persistir_cambios(self, tarea_model: TareaModel, tarea: Tarea) -> TareaModel:
+        """Persiste la entidad y ajusta los contadores del proyecto en la misma transacción"""
+        estado_anterior = tarea_model.estado
+        with UnidadDeTrabajo():
+            tarea_model.actualizar_desde_entity(tarea)
+            tarea_model = self.tarea_repo.actualizar(tarea_model)
+            self.estadistica_repo.ajustar(tarea_model.id_proyecto, estado_anterior, tarea_model.estado)
+            if tarea_model.estado != estado_anterior:
+                contar_al_confirmar(TAREAS_TRANSICIONES, desde=estado_anterior, hacia=tarea_model.estado)
+        return tarea_model
+    
+    def _validar_tamano_lote(self, filas: List[Dict[str, Any]]) -> None:
+        """Valida que el lote sea una lista no vacía de tamaño acotado"""
+        if not isinstance(filas, list) or not filas:
+            raise DatoInvalidoError("El lote debe ser una lista con al menos una tarea")
+        if len(filas) > self.LIMITE_LOTE:
+            raise DatoInvalidoError(f"El lote no puede superar {self.LIMITE_LOTE} tareas")
+    
+    @staticmethod
+    def _entero_opcional(valor: Any, campo: str) -> Optional[int]:
+        """Convierte un valor de entrada a entero (None se mantiene)"""
+        if valor is None or valor == "":
+            return None
+        if isinstance(valor, bool):
+            raise DatoInvalidoError(f"El campo {campo} debe ser un número entero")
+        try:
+            return int(valor)
+        except (TypeError, ValueError):
+            raise DatoInvalidoError(f"El campo {campo} debe ser un número entero")
+    
+    @classmethod
+    def _ids_del_lote(cls, filas: List[Dict[str, Any]], campo: str) -> set:
+        """IDs válidos de un campo en todas las filas (las filas inválidas se informan después)"""
+        ids = set()
+        for fila in filas:
+            try:
+                valor = cls._entero_opcional(fila.get(campo), campo)
+            except Exception:
+                continue
+            if valor:
+                ids.add(valor)
+        return ids
+    
+    @staticmethod
+    def _error_de_referencias(tarea: Tarea, id_miembro: Optional[int], proyectos: set,
+                              miembros: set, membresias: set) -> Optional[Exception]:
+        """Comprueba proyecto, miembro y membresía contra los conjuntos precargados del lote"""
+        if tarea.id_proyecto not in proyectos:
+            return NoEncontradoError("Proyecto", tarea.id_proyecto)
+        if id_miembro:
+            if id_miembro not in miembros:
+                return NoEncontradoError("Miembro", id_miembro)
+            if (tarea.id_proyecto, id_miembro) not in membresias:
+                return AsignacionInvalidaError(
+                    f"El miembro {id_miembro} no pertenece al proyecto {tarea.id_proyecto}"
+                )
+        return None
+    
+    def _validar_miembro_del_proyecto(self, id_proyecto: int, id_miembro: int) -> None:
+        """
+        Valida que el miembro pertenezca al proyecto con un único EXISTS.
+        Solo si no pertenece se consulta si el miembro existe, para informar el error correcto.
+        """
+        if self.proyecto_repo.es_miembro(id_proyecto, id_miembro):
+            return
+        
+        if not self.miembro_repo.obtener_por_id(id_miembro):
+            raise NoEncontradoError("Miembro", id_miembro)
+        
+        raise AsignacionInvalidaError(
+            f"El miembro {id_miembro} no pertenece al proyecto {id_proyecto}"
+        )
+    
     def obtener_estadisticas_proyecto(self, id_proyecto: int) -> Dict[str, int]:
-        """Obtiene estadísticas de tareas de un proyecto"""
+        """Obtiene estadísticas de tareas de un proyecto (contadores mantenidos, sin COUNT)"""
         try:
-            conteo = self.tarea_repo.contar_por_estado(id_proyecto)
-            total = sum(conteo.values())
-            
-            return {
-                'total': total,
-                'pendiente': conteo.get('pendiente', 0),
-                'en_progreso': conteo.get('en_progreso', 0),
-                'completada': conteo.get('completada', 0),
-                'bloqueada': conteo.get('bloqueada', 0)
-            }
+            return self.estadistica_repo.obtener(id_proyecto)
         except Exception as e:
-            raise DatoInvalidoError(f"Error al obtener estadísticas: {str(e)}")
\ No newline at end of file
+            raise DatoInvalidoError(f"Error al obtener estadísticas: {str(e)}")
+    
+    def obtener_estadisticas_proyectos(self, ids_proyecto: List[int]) -> Dict[int, Dict[str, int]]:
+        """Obtiene las estadísticas de varios proyectos en una sola consulta"""
+        try:
+            return self.estadistica_repo.obtener_varios(ids_proyecto)
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener estadísticas: {str(e)}")
+    
+    def recalcular_estadisticas(self) -> List[dict]:
+        """Recalcula todos los contadores desde las tareas y devuelve la deriva encontrada"""
+        return self.estadistica_repo.recalcular_todo()
\ No newline at end of file
@@ -1,17 +1,11 @@
 from app.domain.entities.miembro import Miembro
+from app.domain.entities.catalogo import ROLES_MIEMBRO
 from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
 
 class MiembroValidator:
     """Responsable de validar las reglas de negocio de Miembro"""
     
-    ROLES_PERMITIDOS = [
-        "administrador", 
-        "desarrollador", 
-        "diseñador", 
-        "tester",  
-        "líder", 
-        "colaborador"
-    ]
+    ROLES_PERMITIDOS = list(ROLES_MIEMBRO.valores)
 
     @staticmethod
     def validar(miembro: Miembro) -> None:
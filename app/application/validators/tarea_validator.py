@@ -10,8 +10,8 @@ from app.domain.exceptions.proyecto_exceptions import (
 class TareaValidator:
     """Responsable de validar las reglas de negocio de Tarea"""
     
-    ESTADOS_VALIDOS = ('pendiente', 'en_progreso', 'completada', 'bloqueada')
-    PRIORIDADES_VALIDAS = ('baja', 'media', 'alta', 'urgente')
+    ESTADOS_VALIDOS = Tarea.ESTADOS_VALIDOS
+    PRIORIDADES_VALIDAS = Tarea.PRIORIDADES_VALIDAS
     
     @staticmethod
     def validar(tarea: Tarea) -> None:
@@ -0,0 +1,133 @@
+from datetime import date
+from typing import Iterable, Optional, Tuple
+from app.domain.entities.tarea import Tarea
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+
+class TareaFiltro:
+    """
+    Objeto de consulta para listar tareas: filtros combinables (todos con AND) y orden.
+    El repositorio lo traduce a una única consulta SQL.
+    """
+    
+    # Orden natural de cada criterio; con '-' delante se invierte
+    #   id: más antiguas primero | vencimiento: vencen antes primero
+    #   prioridad: más urgentes primero y, a igual prioridad, las que vencen antes
+    ORDENES_VALIDOS = ('id', 'vencimiento', '-vencimiento', 'prioridad', '-prioridad')
+    
+    __slots__ = (
+        'id_proyecto', 'id_miembro', 'sin_asignar', 'estados', 'prioridades',
+        'vence_desde', 'vence_hasta', 'orden', 'incluir_archivadas'
+    )
+    
+    def __init__(
+        self,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        sin_asignar: bool = False,
+        estados: Iterable[str] = (),
+        prioridades: Iterable[str] = (),
+        vence_desde: Optional[str] = None,
+        vence_hasta: Optional[str] = None,
+        orden: str = 'id',
+        incluir_archivadas: bool = False
+    ):
+        self.id_proyecto = id_proyecto
+        self.id_miembro = id_miembro
+        self.sin_asignar = sin_asignar
+        self.estados: Tuple[str, ...] = tuple(dict.fromkeys(estados))
+        self.prioridades: Tuple[str, ...] = tuple(dict.fromkeys(prioridades))
+        self.vence_desde = vence_desde
+        self.vence_hasta = vence_hasta
+        self.orden = orden or 'id'
+        self.incluir_archivadas = incluir_archivadas
+    
+    @classmethod
+    def desde_parametros(cls, parametros) -> 'TareaFiltro':
+        """
+        Construye el filtro desde los parámetros de la URL (request.args):
+        proyecto, miembro, sin_asignar, estado, prioridad, vence_desde, vence_hasta, orden, archivadas.
+        estado y prioridad admiten varios valores (?estado=a&estado=b o ?estado=a,b).
+        """
+        return cls(
+            id_proyecto=parametros.get('proyecto', type=int),
+            id_miembro=parametros.get('miembro', type=int),
+            sin_asignar=cls._booleano(parametros.get('sin_asignar')),
+            estados=cls._lista(parametros.getlist('estado')),
+            prioridades=cls._lista(parametros.getlist('prioridad')),
+            vence_desde=parametros.get('vence_desde') or None,
+            vence_hasta=parametros.get('vence_hasta') or None,
+            orden=parametros.get('orden') or 'id',
+            incluir_archivadas=cls._booleano(parametros.get('archivadas'))
+        )
+    
+    @staticmethod
+    def _booleano(valor: Optional[str]) -> bool:
+        return (valor or '').lower() in ('1', 'true', 'si', 'on')
+    
+    @staticmethod
+    def _lista(valores: Iterable[str]) -> list:
+        return [v.strip() for valor in valores for v in valor.split(',') if v.strip()]
+    
+    def validar(self) -> None:
+        """Valida valores y combinaciones. Lanza DatoInvalidoError"""
+        for estado in self.estados:
+            if estado not in Tarea.ESTADOS_VALIDOS:
+                raise DatoInvalidoError(
+                    f"Estado '{estado}' inválido. Debe ser: {', '.join(Tarea.ESTADOS_VALIDOS)}"
+                )
+        for prioridad in self.prioridades:
+            if prioridad not in Tarea.PRIORIDADES_VALIDAS:
+                raise DatoInvalidoError(
+                    f"Prioridad '{prioridad}' inválida. Debe ser: {', '.join(Tarea.PRIORIDADES_VALIDAS)}"
+                )
+        if self.sin_asignar and self.id_miembro is not None:
+            raise DatoInvalidoError("No se puede filtrar por miembro y por tareas sin asignar a la vez")
+        
+        desde = self._fecha(self.vence_desde, 'vence_desde')
+        hasta = self._fecha(self.vence_hasta, 'vence_hasta')
+        if desde and hasta and desde > hasta:
+            raise DatoInvalidoError("vence_desde no puede ser posterior a vence_hasta")
+        
+        if self.orden not in self.ORDENES_VALIDOS:
+            raise DatoInvalidoError(
+                f"Orden '{self.orden}' inválido. Debe ser: {', '.join(self.ORDENES_VALIDOS)}"
+            )
+    
+    def validar_busqueda(self) -> None:
+        """
+        Valida el filtro para una búsqueda por texto, que se ordena por relevancia y
+        no recorre tareas archivadas (no están en el índice de búsqueda). Lanza DatoInvalidoError
+        """
+        self.validar()
+        if self.orden != 'id':
+            raise DatoInvalidoError("La búsqueda por texto se ordena por relevancia: no admite el parámetro orden")
+        if self.incluir_archivadas:
+            raise DatoInvalidoError("La búsqueda por texto no incluye tareas archivadas")
+    
+    @staticmethod
+    def _fecha(valor: Optional[str], campo: str) -> Optional[date]:
+        if valor is None:
+            return None
+        try:
+            return date.fromisoformat(valor)
+        except (TypeError, ValueError):
+            raise DatoInvalidoError(f"{campo} debe tener formato YYYY-MM-DD")
+    
+    @property
+    def excluye_completadas(self) -> bool:
+        """True si ninguna tarea completada puede cumplir el filtro"""
+        return bool(self.estados) and 'completada' not in self.estados
+    
+    @property
+    def busca_archivadas(self) -> bool:
+        """True si hay que leer también tareas_archivadas (solo guarda tareas completadas)"""
+        return self.incluir_archivadas and not self.excluye_completadas
+    
+    @property
+    def activo(self) -> bool:
+        """True si hay al menos un filtro (el orden no cuenta)"""
+        return any((
+            self.id_proyecto is not None, self.id_miembro is not None, self.sin_asignar,
+            self.estados, self.prioridades, self.vence_desde, self.vence_hasta
+        ))
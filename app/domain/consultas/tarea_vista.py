@@ -0,0 +1,30 @@
+from typing import Optional
+from app.domain.entities.tarea import Tarea
+
+
+class TareaVista:
+    """
+    Modelo de lectura para listados: una tarea junto con el nombre de su proyecto
+    y el nombre completo de su responsable, leídos en la misma consulta.
+    Los atributos de la tarea se leen directamente (vista.titulo, vista.estado, ...).
+    """
+
+    __slots__ = ('tarea', 'nombre_proyecto', 'nombre_miembro')
+
+    def __init__(self, tarea: Tarea, nombre_proyecto: Optional[str] = None, nombre_miembro: Optional[str] = None):
+        self.tarea = tarea
+        self.nombre_proyecto = nombre_proyecto
+        self.nombre_miembro = nombre_miembro
+
+    def __getattr__(self, nombre: str):
+        # Solo se llama para lo que no es un slot propio: se delega en la entidad
+        if nombre in TareaVista.__slots__:
+            raise AttributeError(nombre)
+        return getattr(self.tarea, nombre)
+
+    def to_dict(self) -> dict:
+        return {
+            **self.tarea.to_dict(),
+            'nombre_proyecto': self.nombre_proyecto,
+            'nombre_miembro': self.nombre_miembro
+        }
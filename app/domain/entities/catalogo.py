@@ -0,0 +1,55 @@
+"""
+Catálogos de valores enumerados - Domain Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+from typing import Dict, Tuple
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+
+class Catalogo:
+    """
+    Valores válidos de un campo enumerado y su código entero.
+    El código es la posición del valor en la tupla: es lo que se guarda en la base,
+    y su orden es el orden natural del campo. No reordenar; agregar valores al final.
+    """
+
+    __slots__ = ('campo', 'valores', '_codigos')
+
+    def __init__(self, campo: str, valores: Tuple[str, ...]):
+        self.campo = campo
+        self.valores = tuple(valores)
+        self._codigos: Dict[str, int] = {valor: codigo for codigo, valor in enumerate(self.valores)}
+
+    def codigo(self, valor: str) -> int:
+        """Código entero de un valor (sin distinguir mayúsculas). Lanza DatoInvalidoError"""
+        codigo = self._codigos.get(valor)
+        if codigo is None and isinstance(valor, str):
+            codigo = self._codigos.get(valor.strip().lower())
+        if codigo is None:
+            raise DatoInvalidoError(
+                f"{self.campo.capitalize()} '{valor}' inválido. Debe ser: {', '.join(self.valores)}"
+            )
+        return codigo
+
+    def valor(self, codigo: int) -> str:
+        """Valor de texto de un código guardado. Lanza DatoInvalidoError si no es un código del catálogo"""
+        # Sin la comprobación explícita, un -1 corrupto indexaría el último valor
+        if isinstance(codigo, bool) or not isinstance(codigo, int) or not 0 <= codigo < len(self.valores):
+            raise DatoInvalidoError(f"Código de {self.campo} desconocido: {codigo!r}")
+        return self.valores[codigo]
+
+    def __contains__(self, valor) -> bool:
+        return valor in self._codigos
+
+    def __iter__(self):
+        return iter(self.valores)
+
+
+ESTADOS_TAREA = Catalogo('estado', ('pendiente', 'en_progreso', 'completada', 'bloqueada'))
+
+# Ordenadas de más a menos urgente: ORDER BY prioridad pone primero las urgentes
+PRIORIDADES_TAREA = Catalogo('prioridad', ('urgente', 'alta', 'media', 'baja'))
+
+ROLES_MIEMBRO = Catalogo('rol', (
+    'administrador', 'desarrollador', 'diseñador', 'tester', 'líder', 'colaborador'
+))
@@ -6,6 +6,9 @@ Sistema de Gestión de Proyectos y Tareas
 class Miembro:
     """Entidad Miembro - Solo representa datos del dominio"""
     
+    # Atributos en slots fijos, sin __dict__ por instancia
+    __slots__ = ('_id_miembro', '_nombre', '_apellido', '_email', '_rol', '_fecha_ingreso')
+    
     def __init__(self, nombre: str, apellido: str, email: str, rol: str, 
                  fecha_ingreso: str, id_miembro: int = None):
         self._id_miembro = id_miembro
@@ -10,6 +10,9 @@ class Proyecto:
     
     ESTADOS_VALIDOS = ('activo', 'finalizado', 'cancelado')
     
+    # Atributos en slots fijos, sin __dict__ por instancia
+    __slots__ = ('_id_proyecto', '_nombre', '_descripcion', '_fecha_inicio', '_fecha_fin', '_estado')
+    
     def __init__(
         self, 
         nombre: str,
@@ -1,11 +1,18 @@
 from datetime import date
 from typing import Optional
+from app.domain.entities.catalogo import ESTADOS_TAREA, PRIORIDADES_TAREA
 
 class Tarea:
     """Entidad pura de dominio para Tarea - Solo datos y lógica básica"""
     
-    ESTADOS_VALIDOS = ('pendiente', 'en_progreso', 'completada', 'bloqueada')
-    PRIORIDADES_VALIDAS = ('baja', 'media', 'alta', 'urgente')
+    ESTADOS_VALIDOS = ESTADOS_TAREA.valores
+    PRIORIDADES_VALIDAS = PRIORIDADES_TAREA.valores
+    
+    # Atributos en slots fijos, sin __dict__ por instancia (los listados crean miles)
+    __slots__ = (
+        '_id_tarea', '_titulo', '_descripcion', '_id_proyecto', '_id_miembro_asignado',
+        '_prioridad', '_estado', '_fecha_creacion', '_fecha_vencimiento'
+    )
     
     def __init__(
         self,
@@ -0,0 +1,34 @@
+"""
+Escritura en streaming de CSV comprimido con gzip - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import csv
+import io
+import zlib
+from typing import Iterable, Iterator, Sequence
+
+# Bytes de CSV sin comprimir que se acumulan antes de pasarlos al compresor
+TAMANO_BUFFER = 64 * 1024
+
+
+def csv_gzip(encabezado: Sequence[str], filas: Iterable[Sequence]) -> Iterator[bytes]:
+    """
+    Genera un archivo .csv.gz en trozos a medida que consume las filas:
+    en memoria solo hay un buffer de TAMANO_BUFFER y el estado del compresor.
+    """
+    # wbits=31: formato gzip (cabecera y CRC), legible con gunzip / pandas.read_csv
+    compresor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(encabezado)
+
+    for fila in filas:
+        escritor.writerow(fila)
+        if buffer.tell() >= TAMANO_BUFFER:
+            comprimido = compresor.compress(buffer.getvalue().encode('utf-8'))
+            buffer.seek(0)
+            buffer.truncate()
+            if comprimido:
+                yield comprimido
+
+    yield compresor.compress(buffer.getvalue().encode('utf-8')) + compresor.flush()
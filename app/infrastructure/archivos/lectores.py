@@ -0,0 +1,82 @@
+"""
+Lectura en streaming de archivos CSV y NDJSON - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import csv
+import io
+import json
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+FORMATOS = ('csv', 'ndjson')
+
+# (número de línea en el archivo, fila leída o None, error de lectura o None)
+Registro = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detectar_formato(nombre_archivo: Optional[str], formato: Optional[str] = None) -> str:
+    """Formato indicado explícitamente o deducido de la extensión del archivo"""
+    if not formato and nombre_archivo:
+        extension = nombre_archivo.rsplit('.', 1)[-1].lower()
+        formato = {'jsonl': 'ndjson', 'json': 'ndjson'}.get(extension, extension)
+    if formato not in FORMATOS:
+        raise DatoInvalidoError(f"Formato '{formato}' no soportado. Debe ser: {', '.join(FORMATOS)}")
+    return formato
+
+
+def leer_registros(flujo: BinaryIO, formato: str) -> Iterator[Registro]:
+    """
+    Recorre un archivo binario fila a fila, sin cargarlo entero en memoria.
+    Las líneas ilegibles se devuelven con su error en lugar de detener la lectura.
+    """
+    # utf-8-sig descarta el BOM que agregan las planillas al exportar CSV
+    texto = io.TextIOWrapper(flujo, encoding='utf-8-sig', newline='')
+    try:
+        if formato == 'csv':
+            yield from _leer_csv(texto)
+        else:
+            yield from _leer_ndjson(texto)
+    except UnicodeDecodeError:
+        raise DatoInvalidoError("El archivo debe estar codificado en UTF-8")
+    finally:
+        # Sin esto, al liberar el wrapper se cerraría también el archivo del llamador
+        texto.detach()
+
+
+def _leer_csv(texto) -> Iterator[Registro]:
+    lector = csv.DictReader(texto)
+    if not lector.fieldnames:
+        return
+    for fila in lector:
+        if None in fila:
+            yield lector.line_num, None, "La fila tiene más columnas que el encabezado"
+            continue
+        # Celdas vacías como ausentes, igual que una clave omitida en NDJSON
+        yield lector.line_num, {k.strip(): (v if v != '' else None) for k, v in fila.items()}, None
+
+
+def _leer_ndjson(texto) -> Iterator[Registro]:
+    for numero, linea in enumerate(texto, start=1):
+        if not linea.strip():
+            continue
+        try:
+            fila = json.loads(linea)
+        except ValueError as e:
+            yield numero, None, f"JSON inválido: {e}"
+            continue
+        if not isinstance(fila, dict):
+            yield numero, None, "Cada línea debe ser un objeto JSON"
+            continue
+        yield numero, fila, None
+
+
+def en_bloques(registros: Iterable, tamano: int) -> Iterator[List]:
+    """Agrupa un iterable en listas de hasta `tamano` elementos, consumiéndolo de a un bloque"""
+    iterador = iter(registros)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
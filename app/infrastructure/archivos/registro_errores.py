@@ -0,0 +1,26 @@
+"""
+Archivo de errores por fila de una importación - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import csv
+import json
+from typing import Optional, TextIO
+
+
+class RegistroErrores:
+    """
+    Escribe un CSV con una línea por fila rechazada: número de línea del archivo
+    original, motivo y la fila tal como se leyó (JSON), para corregirla y reimportarla.
+    """
+
+    COLUMNAS = ('linea', 'error', 'registro')
+
+    def __init__(self, destino: TextIO):
+        self._escritor = csv.writer(destino)
+        self._escritor.writerow(self.COLUMNAS)
+        self.cantidad = 0
+
+    def agregar(self, linea: int, error: str, registro: Optional[dict]) -> None:
+        registro_json = json.dumps(registro, ensure_ascii=False, default=str) if registro is not None else ''
+        self._escritor.writerow((linea, error, registro_json))
+        self.cantidad += 1
@@ -0,0 +1,196 @@
+"""
+Caché versionada de datos de referencia - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+LRU acotada con TTL por entrada. Cada clave incluye la generación actual de
+las tablas de las que depende el resultado: su versión en marcas_tabla, que
+los triggers de la base incrementan en cada INSERT, UPDATE o DELETE. Al ser
+una fila de la base y no un contador en memoria, una escritura confirmada por
+cualquier proceso invalida las entradas de todos; las anteriores dejan de ser
+alcanzables y salen por LRU o TTL. Cada lectura cacheada cuesta una consulta
+por clave primaria a marcas_tabla.
+
+La generación se lee antes de ejecutar la lectura, así que una entrada nunca
+es más antigua que su generación. Mientras la sesión tiene escrituras sin
+confirmar las lecturas no usan la caché.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import db
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.metricas.metricas import CACHE_CONSULTAS
+from app.infrastructure.repositories.marca_repository import MarcaRepository
+
+_CLAVE_TABLAS_MODIFICADAS = '_tablas_modificadas'
+_NO_ENCONTRADO = object()
+
+
+class CacheLRU:
+    """Caché LRU con capacidad máxima y expiración por antigüedad (thread-safe)"""
+
+    def __init__(self, capacidad: int = 512, ttl_segundos: float = 300,
+                 reloj: Callable[[], float] = time.monotonic):
+        self._capacidad = capacidad
+        self._ttl = ttl_segundos
+        self._reloj = reloj
+        self._entradas: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._candado = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+        self._expiradas = 0
+
+    def configurar(self, capacidad: int, ttl_segundos: float) -> None:
+        """Cambia capacidad y TTL (vacía la caché)"""
+        with self._candado:
+            self._capacidad = capacidad
+            self._ttl = ttl_segundos
+            self._entradas.clear()
+
+    def obtener(self, clave: Hashable) -> Any:
+        """Devuelve el valor o _NO_ENCONTRADO si no está o expiró"""
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self._fallos += 1
+                return _NO_ENCONTRADO
+            guardado_en, valor = entrada
+            if self._reloj() - guardado_en > self._ttl:
+                del self._entradas[clave]
+                self._expiradas += 1
+                self._fallos += 1
+                return _NO_ENCONTRADO
+            self._entradas.move_to_end(clave)
+            self._aciertos += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """Guarda un valor, desalojando la entrada menos usada si se supera la capacidad"""
+        if self._capacidad <= 0:
+            return
+        with self._candado:
+            self._entradas[clave] = (self._reloj(), valor)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self._capacidad:
+                self._entradas.popitem(last=False)
+                self._desalojos += 1
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia las estadísticas"""
+        with self._candado:
+            self._entradas.clear()
+            self._aciertos = self._fallos = self._desalojos = self._expiradas = 0
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Aciertos, fallos, desalojos, expiradas, tamaño y ratio de aciertos"""
+        with self._candado:
+            consultas = self._aciertos + self._fallos
+            return {
+                'aciertos': self._aciertos,
+                'fallos': self._fallos,
+                'ratio_aciertos': round(self._aciertos / consultas, 4) if consultas else 0.0,
+                'desalojos': self._desalojos,
+                'expiradas': self._expiradas,
+                'tamano': len(self._entradas),
+                'capacidad': self._capacidad,
+                'ttl_segundos': self._ttl,
+            }
+
+
+cache_referencia = CacheLRU()
+_marcas = MarcaRepository()
+
+
+def generaciones(tablas: Sequence[str]) -> Tuple[tuple, ...]:
+    """
+    (versión, modificado_en) de cada tabla en marcas_tabla, en una consulta.
+    modificado_en distingue versiones iguales de una base recreada.
+    """
+    versiones = _marcas.versiones(tablas)
+    return tuple(versiones[tabla] for tabla in tablas)
+
+
+def en_cache(*tablas: str):
+    """
+    Decorador para lecturas de servicio que dependen solo de las tablas indicadas.
+    La clave es (método, argumentos, generación de cada tabla). Las listas se
+    devuelven como copia; las entidades cacheadas deben tratarse como de solo lectura.
+    """
+    def decorador(metodo: Callable) -> Callable:
+        @wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            if _hay_escrituras_pendientes():
+                return metodo(self, *args, **kwargs)
+            try:
+                clave = (metodo.__qualname__, args, tuple(sorted(kwargs.items())))
+                hash(clave)
+            except TypeError:
+                return metodo(self, *args, **kwargs)
+            try:
+                clave += (generaciones(tablas),)
+            except DatoInvalidoError:
+                # Base sin marcas_tabla (sin migrar): no hay con qué invalidar
+                return metodo(self, *args, **kwargs)
+
+            valor = cache_referencia.obtener(clave)
+            if valor is _NO_ENCONTRADO:
+                CACHE_CONSULTAS.incrementar(resultado='fallo')
+                valor = metodo(self, *args, **kwargs)
+                cache_referencia.guardar(clave, valor)
+            else:
+                CACHE_CONSULTAS.incrementar(resultado='acierto')
+            return list(valor) if isinstance(valor, list) else valor
+        return envoltura
+    return decorador
+
+
+def _hay_escrituras_pendientes() -> bool:
+    """Indica si la sesión actual tiene escrituras sin confirmar"""
+    return bool(db.session().info.get(_CLAVE_TABLAS_MODIFICADAS))
+
+
+def _marcar(session: Session, tablas: Iterable[str]) -> None:
+    session.info.setdefault(_CLAVE_TABLAS_MODIFICADAS, set()).update(tablas)
+
+
+def _tablas_de_flush(session: Session, flush_context) -> None:
+    _marcar(session, {
+        obj.__table__.name
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if hasattr(obj, '__table__')
+    })
+
+
+def _tablas_de_sentencia(estado_ejecucion) -> None:
+    # INSERT/UPDATE/DELETE ejecutados con session.execute (operaciones en lote)
+    if estado_ejecucion.is_insert or estado_ejecucion.is_update or estado_ejecucion.is_delete:
+        tabla = getattr(estado_ejecucion.statement, 'table', None)
+        if tabla is not None and getattr(tabla, 'name', None):
+            _marcar(estado_ejecucion.session, {tabla.name})
+
+
+def _transaccion_terminada(session: Session) -> None:
+    # Confirmadas, los triggers ya incrementaron marcas_tabla; revertidas, no cambió nada
+    session.info.pop(_CLAVE_TABLAS_MODIFICADAS, None)
+
+
+def registrar_cache_referencia(app) -> None:
+    """Configura la caché desde app.config y engancha a las sesiones el seguimiento de escrituras pendientes"""
+    cache_referencia.configurar(
+        app.config.get('CACHE_REFERENCIA_CAPACIDAD', 512),
+        app.config.get('CACHE_REFERENCIA_TTL', 300)
+    )
+    for nombre, funcion in (('after_flush', _tablas_de_flush),
+                            ('do_orm_execute', _tablas_de_sentencia),
+                            ('after_commit', _transaccion_terminada),
+                            ('after_rollback', _transaccion_terminada)):
+        if not event.contains(Session, nombre, funcion):
+            event.listen(Session, nombre, funcion)
@@ -0,0 +1,151 @@
+"""
+Almacén de métricas compartido entre procesos - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+Cada proceso suma sus valores en su propio archivo (metricas_<pid>.db) mapeado
+en memoria, así que no hay bloqueos entre procesos y dentro del proceso solo un
+threading.Lock sin contención. /metrics lee todos los archivos del directorio
+y suma los valores con la misma clave.
+
+Formato del archivo: 8 bytes de cabecera con los bytes usados, y luego
+entradas [largo de la clave: uint32][clave UTF-8][relleno hasta 8][valor: float64].
+El escritor escribe la entrada completa antes de actualizar la cabecera, de modo
+que un lector de otro proceso nunca ve una entrada a medio escribir.
+"""
+import glob
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+
+TAMANO_INICIAL = 64 * 1024
+_CABECERA = struct.Struct('<Q')
+_LARGO_CLAVE = struct.Struct('<I')
+_VALOR = struct.Struct('<d')
+
+
+def _alinear(posicion: int) -> int:
+    return (posicion + 7) & ~7
+
+
+def _entradas(datos, usados: int) -> Iterator[Tuple[str, int]]:
+    """Recorre (clave, posición del valor) de las entradas escritas"""
+    posicion = _CABECERA.size
+    while posicion < usados:
+        (largo,) = _LARGO_CLAVE.unpack_from(datos, posicion)
+        inicio_clave = posicion + _LARGO_CLAVE.size
+        clave = bytes(datos[inicio_clave:inicio_clave + largo]).decode('utf-8')
+        posicion_valor = _alinear(inicio_clave + largo)
+        yield clave, posicion_valor
+        posicion = posicion_valor + _VALOR.size
+
+
+class ArchivoMetricas:
+    """Valores float64 por clave en un archivo mapeado en memoria, escrito por un solo proceso"""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._candado = threading.Lock()
+        self._archivo = open(ruta, 'a+b')
+        if os.fstat(self._archivo.fileno()).st_size < TAMANO_INICIAL:
+            self._archivo.truncate(TAMANO_INICIAL)
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0)
+        (self._usados,) = _CABECERA.unpack_from(self._mapa, 0)
+        if self._usados == 0:
+            self._usados = _CABECERA.size
+            _CABECERA.pack_into(self._mapa, 0, self._usados)
+        # Un archivo de un proceso anterior con el mismo pid se continúa
+        self._posiciones: Dict[str, int] = dict(_entradas(self._mapa, self._usados))
+
+    def sumar(self, clave: str, valor: float) -> None:
+        with self._candado:
+            posicion = self._posiciones.get(clave)
+            if posicion is None:
+                posicion = self._agregar(clave)
+            (actual,) = _VALOR.unpack_from(self._mapa, posicion)
+            _VALOR.pack_into(self._mapa, posicion, actual + valor)
+
+    def _agregar(self, clave: str) -> int:
+        codificada = clave.encode('utf-8')
+        inicio_clave = self._usados + _LARGO_CLAVE.size
+        posicion_valor = _alinear(inicio_clave + len(codificada))
+        fin = posicion_valor + _VALOR.size
+        if fin > len(self._mapa):
+            self._crecer(fin)
+
+        _LARGO_CLAVE.pack_into(self._mapa, self._usados, len(codificada))
+        self._mapa[inicio_clave:inicio_clave + len(codificada)] = codificada
+        _VALOR.pack_into(self._mapa, posicion_valor, 0.0)
+        # La cabecera se actualiza al final: recién ahí los lectores ven la entrada
+        self._usados = fin
+        _CABECERA.pack_into(self._mapa, 0, self._usados)
+        self._posiciones[clave] = posicion_valor
+        return posicion_valor
+
+    def _crecer(self, minimo: int) -> None:
+        tamano = len(self._mapa)
+        while tamano < minimo:
+            tamano *= 2
+        self._mapa.close()
+        self._archivo.truncate(tamano)
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0)
+
+    def cerrar(self) -> None:
+        self._mapa.close()
+        self._archivo.close()
+
+
+def leer_archivo(ruta: str) -> Iterator[Tuple[str, float]]:
+    """(clave, valor) de un archivo de métricas, escrito por este u otro proceso"""
+    with open(ruta, 'rb') as archivo:
+        datos = archivo.read()
+    if len(datos) < _CABECERA.size:
+        return
+    (usados,) = _CABECERA.unpack_from(datos, 0)
+    for clave, posicion in _entradas(datos, min(usados, len(datos))):
+        yield clave, _VALOR.unpack_from(datos, posicion)[0]
+
+
+class AlmacenMetricas:
+    """
+    Directorio de archivos de métricas. El archivo del proceso se abre al primer
+    uso y se vuelve a abrir si cambia el pid (workers creados con fork).
+    """
+
+    def __init__(self):
+        self.directorio: Optional[str] = None
+        self._archivo: Optional[ArchivoMetricas] = None
+        self._pid: Optional[int] = None
+        self._candado = threading.Lock()
+
+    def configurar(self, directorio: str) -> None:
+        os.makedirs(directorio, exist_ok=True)
+        with self._candado:
+            self.directorio = directorio
+            self._archivo = None
+            self._pid = None
+
+    def _archivo_del_proceso(self) -> Optional[ArchivoMetricas]:
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._candado:
+                if self._pid != pid and self.directorio is not None:
+                    self._archivo = ArchivoMetricas(os.path.join(self.directorio, f'metricas_{pid}.db'))
+                    self._pid = pid
+        return self._archivo
+
+    def sumar(self, clave: str, valor: float) -> None:
+        archivo = self._archivo_del_proceso()
+        if archivo is not None:
+            archivo.sumar(clave, valor)
+
+    def totales(self) -> Dict[str, float]:
+        """Suma de cada clave en los archivos de todos los procesos"""
+        totales: Dict[str, float] = {}
+        if self.directorio is None:
+            return totales
+        for ruta in sorted(glob.glob(os.path.join(self.directorio, 'metricas_*.db'))):
+            for clave, valor in leer_archivo(ruta):
+                totales[clave] = totales.get(clave, 0.0) + valor
+        return totales
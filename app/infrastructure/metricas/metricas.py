@@ -0,0 +1,221 @@
+"""
+Métricas en formato de texto de Prometheus - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+Contadores e histogramas guardados en AlmacenMetricas (un archivo mapeado por
+proceso), así que GET /metrics agrega correctamente todos los workers. Los
+contadores de casos de uso se suman recién cuando la transacción confirma.
+"""
+import json
+import tempfile
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import db
+from app.infrastructure.metricas.almacen import AlmacenMetricas
+
+PREFIJO = 'gestion_'
+_CLAVE_PENDIENTES = '_metricas_pendientes'
+
+# Límites superiores (segundos) de los buckets de latencia
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+almacen = AlmacenMetricas()
+_metricas: Dict[str, '_Metrica'] = {}
+
+
+class _Metrica:
+    tipo = ''
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        self.nombre = PREFIJO + nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        _metricas[self.nombre] = self
+
+    def _valores_etiquetas(self, etiquetas: Dict[str, object]) -> List[Tuple[str, str]]:
+        if set(etiquetas) != set(self.etiquetas):
+            raise ValueError(f"{self.nombre} espera las etiquetas {self.etiquetas}")
+        return [(nombre, str(etiquetas[nombre])) for nombre in self.etiquetas]
+
+    @staticmethod
+    def _clave(muestra: str, etiquetas: List[Tuple[str, str]]) -> str:
+        return json.dumps([muestra, etiquetas], ensure_ascii=False, separators=(',', ':'))
+
+
+class Contador(_Metrica):
+    """Contador monótono, opcionalmente con etiquetas"""
+
+    tipo = 'counter'
+
+    def incrementar(self, valor: float = 1, **etiquetas) -> None:
+        almacen.sumar(self._clave(self.nombre + '_total', self._valores_etiquetas(etiquetas)), valor)
+
+
+class Histograma(_Metrica):
+    """
+    Histograma con buckets fijos. Cada observación suma 1 en su bucket (no acumulado),
+    más _sum y _count; los buckets acumulados se calculan al exponer.
+    """
+
+    tipo = 'histogram'
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (),
+                 buckets: Sequence[float] = BUCKETS_LATENCIA):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.buckets = tuple(buckets)
+
+    def observar(self, valor: float, **etiquetas) -> None:
+        pares = self._valores_etiquetas(etiquetas)
+        indice = bisect_left(self.buckets, valor)
+        limite = _formatear(self.buckets[indice]) if indice < len(self.buckets) else '+Inf'
+        almacen.sumar(self._clave(self.nombre + '_bucket', pares + [('le', limite)]), 1)
+        almacen.sumar(self._clave(self.nombre + '_sum', pares), valor)
+        almacen.sumar(self._clave(self.nombre + '_count', pares), 1)
+
+
+# Peticiones HTTP
+PETICION_DURACION = Histograma(
+    'peticion_duracion_segundos', 'Duración de las peticiones por endpoint', ('endpoint', 'metodo')
+)
+PETICION_TIEMPO_DB = Histograma(
+    'peticion_db_segundos', 'Tiempo en la base de datos por petición', ('endpoint', 'metodo')
+)
+PETICION_SENTENCIAS = Contador(
+    'peticion_sentencias_sql', 'Sentencias SQL ejecutadas por las peticiones', ('endpoint',)
+)
+PETICIONES = Contador('peticiones', 'Peticiones respondidas por endpoint y código', ('endpoint', 'estado'))
+
+# Caché de proyectos y miembros
+CACHE_CONSULTAS = Contador('cache_consultas', 'Lecturas de la caché de referencia', ('resultado',))
+
+# Casos de uso (sumados al confirmar la transacción)
+TAREAS_CREADAS = Contador('tareas_creadas', 'Tareas creadas (formulario, lote o importación)')
+TAREAS_TRANSICIONES = Contador('tareas_transiciones', 'Cambios de estado de tareas', ('desde', 'hacia'))
+TAREAS_ELIMINADAS = Contador('tareas_eliminadas', 'Tareas eliminadas una a una')
+
+
+def _formatear(valor: float) -> str:
+    return repr(float(valor)) if valor != float('inf') else '+Inf'
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _linea(muestra: str, etiquetas: List[Tuple[str, str]], valor: float) -> str:
+    if etiquetas:
+        texto = ','.join(f'{nombre}="{_escapar(v)}"' for nombre, v in etiquetas)
+        return f'{muestra}{{{texto}}} {_formatear(valor)}'
+    return f'{muestra} {_formatear(valor)}'
+
+
+def exponer() -> str:
+    """Todas las métricas, sumadas entre procesos, en el formato de texto de Prometheus 0.0.4"""
+    por_muestra: Dict[str, List[Tuple[List[Tuple[str, str]], float]]] = {}
+    for clave, valor in almacen.totales().items():
+        muestra, etiquetas = json.loads(clave)
+        por_muestra.setdefault(muestra, []).append(([tuple(par) for par in etiquetas], valor))
+
+    lineas = []
+    for metrica in _metricas.values():
+        lineas.append(f'# HELP {metrica.nombre} {metrica.ayuda}')
+        lineas.append(f'# TYPE {metrica.nombre} {metrica.tipo}')
+        if isinstance(metrica, Histograma):
+            lineas.extend(_lineas_histograma(metrica, por_muestra))
+        else:
+            for etiquetas, valor in sorted(por_muestra.get(metrica.nombre + '_total', [])):
+                lineas.append(_linea(metrica.nombre + '_total', etiquetas, valor))
+
+    # Derivada de los contadores de la caché: es la de todos los procesos juntos
+    lecturas = {dict(e)['resultado']: v for e, v in por_muestra.get(CACHE_CONSULTAS.nombre + '_total', [])}
+    total = sum(lecturas.values())
+    lineas.append(f'# HELP {PREFIJO}cache_ratio_aciertos Aciertos sobre lecturas de la caché de referencia')
+    lineas.append(f'# TYPE {PREFIJO}cache_ratio_aciertos gauge')
+    lineas.append(_linea(f'{PREFIJO}cache_ratio_aciertos', [], lecturas.get('acierto', 0) / total if total else 0))
+    return '\n'.join(lineas) + '\n'
+
+
+def _lineas_histograma(metrica: Histograma, por_muestra) -> List[str]:
+    """Buckets acumulados (incluido +Inf), _sum y _count por combinación de etiquetas"""
+    conteos: Dict[tuple, Dict[str, float]] = {}
+    for etiquetas, valor in por_muestra.get(metrica.nombre + '_bucket', []):
+        limite = dict(etiquetas)['le']
+        pares = tuple(par for par in etiquetas if par[0] != 'le')
+        conteos.setdefault(pares, {})[limite] = valor
+    sumas = {tuple(e): v for e, v in por_muestra.get(metrica.nombre + '_sum', [])}
+
+    lineas = []
+    for pares in sorted(conteos):
+        acumulado = 0.0
+        for limite in [_formatear(b) for b in metrica.buckets] + ['+Inf']:
+            acumulado += conteos[pares].get(limite, 0.0)
+            lineas.append(_linea(metrica.nombre + '_bucket', list(pares) + [('le', limite)], acumulado))
+        lineas.append(_linea(metrica.nombre + '_sum', list(pares), sumas.get(pares, 0.0)))
+        lineas.append(_linea(metrica.nombre + '_count', list(pares), acumulado))
+    return lineas
+
+
+def contar_al_confirmar(contador: Contador, valor: float = 1, **etiquetas) -> None:
+    """
+    Suma en el contador cuando la sesión actual confirme (no si revierte).
+    Llamar dentro de la unidad de trabajo que hace la escritura.
+    """
+    if valor:
+        db.session().info.setdefault(_CLAVE_PENDIENTES, []).append((contador, valor, etiquetas))
+
+
+def _confirmado(session: Session) -> None:
+    for contador, valor, etiquetas in session.info.pop(_CLAVE_PENDIENTES, ()):
+        contador.incrementar(valor, **etiquetas)
+
+
+def _revertido(session: Session) -> None:
+    session.info.pop(_CLAVE_PENDIENTES, None)
+
+
+def registrar_metricas(app) -> None:
+    """
+    Configura el directorio compartido (METRICAS_DIRECTORIO; sin él, uno temporal
+    propio de este proceso y de los que cree con fork) y mide cada petición.
+    Registrar antes que la instrumentación SQL: su after_request corre después
+    y encuentra en g.medicion_sql el tiempo en la base de la petición.
+    """
+    if not app.config.get('METRICAS_HABILITADAS', False):
+        return
+    almacen.configurar(app.config.get('METRICAS_DIRECTORIO') or tempfile.mkdtemp(prefix='metricas_'))
+
+    for nombre, funcion in (('after_commit', _confirmado), ('after_rollback', _revertido)):
+        if not event.contains(Session, nombre, funcion):
+            event.listen(Session, nombre, funcion)
+
+    @app.before_request
+    def _iniciar_reloj():
+        g._inicio_peticion = time.perf_counter()
+
+    @app.after_request
+    def _medir_peticion(response):
+        inicio = g.pop('_inicio_peticion', None)
+        if inicio is None:
+            return response
+        endpoint, metodo = request.endpoint or 'sin_ruta', request.method
+        medicion = g.get('medicion_sql')
+
+        def _observar():
+            PETICION_DURACION.observar(time.perf_counter() - inicio, endpoint=endpoint, metodo=metodo)
+            PETICIONES.incrementar(endpoint=endpoint, estado=response.status_code)
+            if medicion is not None:
+                PETICION_TIEMPO_DB.observar(medicion.tiempo_db, endpoint=endpoint, metodo=metodo)
+                PETICION_SENTENCIAS.incrementar(medicion.sentencias, endpoint=endpoint)
+
+        # En streaming las consultas corren al enviar el cuerpo: se mide al cerrar la respuesta
+        if response.is_streamed:
+            response.call_on_close(_observar)
+        else:
+            _observar()
+        return response
@@ -0,0 +1,28 @@
+"""
+Migración 001: índices compuestos y parciales para las consultas frecuentes de tareas
+"""
+from app import db
+
+VERSION = 1
+DESCRIPCION = "Índices de tareas, proyectos, miembros y proyecto_miembro"
+
+TABLAS = ('tareas', 'proyectos', 'miembros', 'proyecto_miembro')
+
+
+def crear_indices_faltantes(conexion, tablas) -> None:
+    """
+    Crea los índices declarados en los modelos que no existan en la base.
+    Se compara por nombre en sqlite_master: checkfirst no refleja índices sobre expresiones.
+    """
+    existentes = {
+        fila[0] for fila in conexion.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    for nombre_tabla in tablas:
+        for indice in db.metadata.tables[nombre_tabla].indexes:
+            if indice.name not in existentes:
+                indice.create(conexion)
+
+
+def aplicar(conexion) -> None:
+    """Crea (si no existen) los índices declarados en los modelos"""
+    crear_indices_faltantes(conexion, TABLAS)
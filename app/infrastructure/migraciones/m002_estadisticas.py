@@ -0,0 +1,12 @@
+"""
+Migración 002: contadores de tareas por proyecto (proyecto_estadisticas)
+"""
+from app.infrastructure.repositories.estadistica_repository import sentencia_recalculo
+
+VERSION = 2
+DESCRIPCION = "Tabla proyecto_estadisticas calculada desde las tareas existentes"
+
+
+def aplicar(conexion) -> None:
+    """La tabla la crea create_all; aquí solo se cargan los contadores iniciales"""
+    conexion.execute(sentencia_recalculo())
@@ -0,0 +1,13 @@
+"""
+Migración 003: índice de texto completo (FTS5) sobre titulo y descripcion de tareas
+"""
+from app.infrastructure.queries.busqueda_texto import crear_indice_busqueda, reconstruir_indice_busqueda
+
+VERSION = 3
+DESCRIPCION = "Tabla tareas_fts con triggers de sincronización"
+
+
+def aplicar(conexion) -> None:
+    """Crea la tabla FTS5 y sus triggers e indexa las tareas existentes"""
+    crear_indice_busqueda(conexion)
+    reconstruir_indice_busqueda(conexion)
@@ -0,0 +1,29 @@
+"""
+Migración 004: columnas updated_at y tabla marcas_tabla con sus triggers
+"""
+from app.infrastructure.models.marca_tabla_model import TABLAS_CON_MARCA, crear_triggers_marcas
+
+VERSION = 4
+DESCRIPCION = "updated_at en tareas, proyectos y miembros; marcas_tabla para GET condicional"
+
+TABLAS_CON_UPDATED_AT = ('tareas', 'proyectos', 'miembros')
+
+
+def aplicar(conexion) -> None:
+    """Agrega updated_at donde falte, crea los triggers e inicializa una marca por tabla"""
+    for tabla in TABLAS_CON_UPDATED_AT:
+        columnas = {fila[1] for fila in conexion.exec_driver_sql(f"PRAGMA table_info({tabla})")}
+        if 'updated_at' not in columnas:
+            # SQLite no admite un DEFAULT no constante en ADD COLUMN: se agrega y luego se rellena
+            conexion.exec_driver_sql(f"ALTER TABLE {tabla} ADD COLUMN updated_at DATETIME")
+            conexion.exec_driver_sql(
+                f"UPDATE {tabla} SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') || '000' WHERE updated_at IS NULL"
+            )
+
+    crear_triggers_marcas(conexion)
+    for tabla in TABLAS_CON_MARCA:
+        conexion.exec_driver_sql(
+            "INSERT OR IGNORE INTO marcas_tabla (tabla, version, modificado_en) "
+            "VALUES (?, 0, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')",
+            (tabla,)
+        )
@@ -0,0 +1,81 @@
+"""
+Migración 005: estado, prioridad y rol guardados como códigos enteros (Catalogo)
+"""
+import re
+from app.domain.entities.catalogo import ESTADOS_TAREA, PRIORIDADES_TAREA, ROLES_MIEMBRO
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.migraciones.m001_indices import crear_indices_faltantes
+from app.infrastructure.repositories.estadistica_repository import sentencia_recalculo
+
+VERSION = 5
+DESCRIPCION = "estado y prioridad de tareas y rol de miembros como SMALLINT"
+
+# (tabla, columna, catálogo, valor para textos que no están en el catálogo)
+COLUMNAS = (
+    ('tareas', 'estado', ESTADOS_TAREA, 'pendiente'),
+    ('tareas', 'prioridad', PRIORIDADES_TAREA, 'media'),
+    ('miembros', 'rol', ROLES_MIEMBRO, 'colaborador'),
+)
+
+# Reemplazado por ix_tareas_prioridad_vencimiento
+INDICES_OBSOLETOS = ('ix_tareas_prioridad',)
+
+
+def _tipo_columna(conexion, tabla: str, columna: str) -> str:
+    for fila in conexion.exec_driver_sql(f"PRAGMA table_info({tabla})"):
+        if fila[1] == columna:
+            return (fila[2] or '').upper()
+    return ''
+
+
+def _indices_que_usan(conexion, tabla: str, columna: str) -> list:
+    """Índices explícitos de la tabla que nombran la columna (también en WHERE o en expresiones)"""
+    patron = re.compile(rf'\b{columna}\b')
+    filas = conexion.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (tabla,)
+    )
+    return [nombre for nombre, sql in filas if patron.search(sql)]
+
+
+def _convertir(conexion, tabla: str, columna: str, catalogo, por_defecto: str) -> None:
+    """
+    SQLite no cambia el tipo de una columna: se agrega la columna entera, se copia
+    cada texto convertido a su código y se reemplaza la original (DROP + RENAME COLUMN)
+    """
+    temporal = f"{columna}_codigo"
+    for indice in _indices_que_usan(conexion, tabla, columna):
+        conexion.exec_driver_sql(f"DROP INDEX {indice}")
+
+    conexion.exec_driver_sql(
+        f"ALTER TABLE {tabla} ADD COLUMN {temporal} SMALLINT NOT NULL "
+        f"DEFAULT {catalogo.codigo(por_defecto)}"
+    )
+    # Un UPDATE por texto distinto (unos pocos), con la misma normalización que Catalogo.codigo
+    textos = [fila[0] for fila in conexion.exec_driver_sql(f"SELECT DISTINCT {columna} FROM {tabla}")]
+    for texto in textos:
+        try:
+            codigo = catalogo.codigo(texto)
+        except DatoInvalidoError:
+            codigo = catalogo.codigo(por_defecto)
+        conexion.exec_driver_sql(
+            f"UPDATE {tabla} SET {temporal} = ? WHERE {columna} IS ?", (codigo, texto)
+        )
+
+    conexion.exec_driver_sql(f"ALTER TABLE {tabla} DROP COLUMN {columna}")
+    conexion.exec_driver_sql(f"ALTER TABLE {tabla} RENAME COLUMN {temporal} TO {columna}")
+
+
+def aplicar(conexion) -> None:
+    """Convierte las columnas que aún son texto y vuelve a crear sus índices"""
+    for tabla, columna, catalogo, por_defecto in COLUMNAS:
+        if _tipo_columna(conexion, tabla, columna) in ('SMALLINT', 'INTEGER'):
+            continue
+        _convertir(conexion, tabla, columna, catalogo, por_defecto)
+
+    for indice in INDICES_OBSOLETOS:
+        conexion.exec_driver_sql(f"DROP INDEX IF EXISTS {indice}")
+    crear_indices_faltantes(conexion, sorted({tabla for tabla, *_ in COLUMNAS}))
+
+    # Los contadores cargados por la migración 002 compararon contra los textos
+    conexion.execute(sentencia_recalculo())
@@ -0,0 +1,12 @@
+"""
+Migración 006: índice sobre la fecha de vencimiento ordenable (orden=vencimiento y -vencimiento)
+"""
+from app.infrastructure.migraciones.m001_indices import crear_indices_faltantes
+
+VERSION = 6
+DESCRIPCION = "Índice ix_tareas_vencimiento para ordenar tareas por vencimiento"
+
+
+def aplicar(conexion) -> None:
+    """Crea ix_tareas_vencimiento (y cualquier otro índice de tareas que falte)"""
+    crear_indices_faltantes(conexion, ('tareas',))
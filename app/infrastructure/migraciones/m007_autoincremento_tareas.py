@@ -0,0 +1,59 @@
+"""
+Migración 007: tareas con AUTOINCREMENT, para que los ids archivados no se reutilicen
+"""
+from app.infrastructure.models.marca_tabla_model import crear_triggers_marcas
+from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.queries.busqueda_texto import eliminar_indice_busqueda
+
+VERSION = 7
+DESCRIPCION = "tareas con AUTOINCREMENT y secuencia por encima de los ids archivados"
+
+TABLA_ANTERIOR = 'tareas_sin_autoincremento'
+
+
+def _tiene_autoincremento(conexion) -> bool:
+    sql = conexion.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tareas'"
+    ).scalar()
+    return 'AUTOINCREMENT' in (sql or '').upper()
+
+
+def _reconstruir(conexion) -> None:
+    """
+    SQLite no agrega AUTOINCREMENT a una tabla existente: se renombra, se crea la
+    tabla del modelo (con sus índices, la tabla FTS5 y sus triggers), se copian las
+    filas y se elimina la anterior
+    """
+    # Los índices y triggers se van con la tabla renombrada: se eliminan para recrearlos con su nombre
+    for tipo, nombre in conexion.exec_driver_sql(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE type IN ('index', 'trigger') AND tbl_name = 'tareas' AND sql IS NOT NULL"
+    ).fetchall():
+        conexion.exec_driver_sql(f"DROP {tipo.upper()} {nombre}")
+    # La tabla FTS5 se vuelve a crear vacía y los triggers de alta la llenan durante la copia
+    eliminar_indice_busqueda(conexion)
+    conexion.exec_driver_sql(f"ALTER TABLE tareas RENAME TO {TABLA_ANTERIOR}")
+
+    TareaModel.__table__.create(conexion)
+    columnas = ', '.join(columna.name for columna in TareaModel.__table__.columns)
+    conexion.exec_driver_sql(
+        f"INSERT INTO tareas ({columnas}) SELECT {columnas} FROM {TABLA_ANTERIOR} ORDER BY id_tarea"
+    )
+    conexion.exec_driver_sql(f"DROP TABLE {TABLA_ANTERIOR}")
+    crear_triggers_marcas(conexion)
+
+
+def aplicar(conexion) -> None:
+    """Reconstruye tareas si aún no tiene AUTOINCREMENT y lleva la secuencia al id más alto usado"""
+    if not _tiene_autoincremento(conexion):
+        _reconstruir(conexion)
+
+    # Una tarea archivada con el id más alto dejó ese id fuera de tareas: la secuencia debe superarlo
+    id_maximo = conexion.exec_driver_sql(
+        "SELECT max("
+        "(SELECT coalesce(max(seq), 0) FROM sqlite_sequence WHERE name = 'tareas'), "
+        "(SELECT coalesce(max(id_tarea), 0) FROM tareas), "
+        "(SELECT coalesce(max(id_tarea), 0) FROM tareas_archivadas))"
+    ).scalar()
+    conexion.exec_driver_sql("DELETE FROM sqlite_sequence WHERE name = 'tareas'")
+    conexion.exec_driver_sql("INSERT INTO sqlite_sequence (name, seq) VALUES ('tareas', ?)", (id_maximo,))
@@ -0,0 +1,16 @@
+"""
+Migración 008: marcas_tabla también para tareas_archivadas (borrar una tarea archivada invalida las páginas)
+"""
+from app.infrastructure.models.marca_tabla_model import crear_triggers_marcas
+
+VERSION = 8
+DESCRIPCION = "Triggers de marcas_tabla sobre tareas_archivadas"
+
+
+def aplicar(conexion) -> None:
+    """Crea los triggers que falten e inicializa la marca de tareas_archivadas"""
+    crear_triggers_marcas(conexion)
+    conexion.exec_driver_sql(
+        "INSERT OR IGNORE INTO marcas_tabla (tabla, version, modificado_en) "
+        "VALUES ('tareas_archivadas', 0, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+    )
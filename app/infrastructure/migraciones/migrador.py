@@ -0,0 +1,55 @@
+"""
+Migrador de esquema para bases SQLite existentes - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+La versión aplicada se guarda en PRAGMA user_version. Cada migración es un
+módulo con VERSION, DESCRIPCION y aplicar(conexion), y debe ser idempotente.
+"""
+from typing import List
+from app import db
+from app.infrastructure.migraciones import (
+    m001_indices,
+    m002_estadisticas,
+    m003_busqueda_texto,
+    m004_marcas_modificacion,
+    m005_codigos_enteros,
+    m006_indice_vencimiento,
+    m007_autoincremento_tareas,
+    m008_marcas_archivadas,
+)
+
+MIGRACIONES = [
+    m001_indices,
+    m002_estadisticas,
+    m003_busqueda_texto,
+    m004_marcas_modificacion,
+    m005_codigos_enteros,
+    m006_indice_vencimiento,
+    m007_autoincremento_tareas,
+    m008_marcas_archivadas,
+]
+
+
+def version_actual(conexion) -> int:
+    """Devuelve la versión de esquema registrada en la base"""
+    return conexion.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+
+def aplicar_migraciones() -> List[str]:
+    """
+    Crea las tablas que falten y aplica las migraciones pendientes.
+    Devuelve la descripción de cada migración aplicada.
+    """
+    aplicadas = []
+    with db.engine.begin() as conexion:
+        db.metadata.create_all(conexion)
+        version = version_actual(conexion)
+
+        for migracion in sorted(MIGRACIONES, key=lambda m: m.VERSION):
+            if migracion.VERSION <= version:
+                continue
+            migracion.aplicar(conexion)
+            conexion.exec_driver_sql(f"PRAGMA user_version = {int(migracion.VERSION)}")
+            aplicadas.append(f"{migracion.VERSION:03d} - {migracion.DESCRIPCION}")
+
+    return aplicadas
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from sqlalchemy import event
+from app import db
+
+# Tablas cuyas escrituras se registran en marcas_tabla (INSERT, UPDATE y DELETE)
+TABLAS_CON_MARCA = ('tareas', 'tareas_archivadas', 'proyectos', 'miembros', 'proyecto_miembro')
+
+
+def ahora_utc() -> datetime:
+    """Fecha y hora actual en UTC (naive, con microsegundos) para updated_at"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class MarcaTablaModel(db.Model):
+    """
+    Versión y fecha de última modificación de cada tabla, mantenidas por triggers.
+    A diferencia de MAX(updated_at), también cambian cuando se borran filas.
+    """
+    
+    __tablename__ = 'marcas_tabla'
+    
+    tabla = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    modificado_en = db.Column(db.DateTime, nullable=False, default=ahora_utc)
+
+
+def _sentencias_triggers() -> list:
+    # '%f' da milisegundos; se completa a 6 dígitos porque DateTime de SQLite los lee como microsegundos
+    sentencias = []
+    for tabla in TABLAS_CON_MARCA:
+        for operacion in ('INSERT', 'UPDATE', 'DELETE'):
+            sentencias.append(f"""
+            CREATE TRIGGER IF NOT EXISTS marca_{tabla}_{operacion.lower()} AFTER {operacion} ON {tabla} BEGIN
+                INSERT INTO marcas_tabla (tabla, version, modificado_en)
+                VALUES ('{tabla}', 1, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')
+                ON CONFLICT(tabla) DO UPDATE SET
+                    version = version + 1,
+                    modificado_en = excluded.modificado_en;
+            END
+            """)
+    return sentencias
+
+
+def crear_triggers_marcas(conexion) -> None:
+    """Crea (si no existen) los triggers que mantienen marcas_tabla"""
+    for sentencia in _sentencias_triggers():
+        conexion.exec_driver_sql(sentencia)
+
+
+# Los triggers referencian varias tablas: se crean cuando ya existen todas
+event.listen(
+    db.metadata,
+    'after_create',
+    lambda metadata, conexion, **kw: crear_triggers_marcas(conexion)
+)
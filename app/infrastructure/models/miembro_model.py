@@ -1,42 +1,57 @@
 from datetime import date
 from app import db
 from app.domain.entities.miembro import Miembro
+from app.domain.entities.catalogo import ROLES_MIEMBRO
+from app.infrastructure.models.tipos import CodigoCatalogo
 from app.infrastructure.models.proyecto_model import proyecto_miembro
+from app.infrastructure.models.marca_tabla_model import ahora_utc
 
 class MiembroModel(db.Model):
     """Modelo de persistencia para Miembro"""
     
     __tablename__ = 'miembros'
+    __table_args__ = (
+        db.Index('ix_miembros_rol', 'rol'),
+        db.Index('ix_miembros_apellido', 'apellido'),
+    )
     
     id_miembro = db.Column(db.Integer, primary_key=True, autoincrement=True)
     nombre = db.Column(db.String(50), nullable=False)
     apellido = db.Column(db.String(50), nullable=False)
     email = db.Column(db.String(100), nullable=False, unique=True)
-    rol = db.Column(db.String(30), nullable=False)
+    rol = db.Column(CodigoCatalogo(ROLES_MIEMBRO), nullable=False)
     fecha_ingreso = db.Column(db.Date, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=ahora_utc, onupdate=ahora_utc)
     
     # Relaciones
     proyectos = db.relationship(
         "ProyectoModel",
         secondary=proyecto_miembro,
-        back_populates="miembros"
+        back_populates="miembros",
+        passive_deletes=True
     )
+    # MiembroRepository.eliminar desasigna las tareas con un UPDATE por conjunto
     tareas = db.relationship(
         "TareaModel",
-        back_populates="asignado_a"
+        back_populates="asignado_a",
+        passive_deletes=True
     )
     
     @staticmethod
     def from_entity(miembro: Miembro) -> 'MiembroModel':
         """Convierte entidad de dominio a modelo de persistencia"""
-        return MiembroModel(
-            id_miembro=miembro.id_miembro,
-            nombre=miembro.nombre,
-            apellido=miembro.apellido,
-            email=miembro.email,
-            rol=miembro.rol,
-            fecha_ingreso=date.fromisoformat(miembro.fecha_ingreso)
-        )
+        return MiembroModel(id_miembro=miembro.id_miembro, **MiembroModel.valores_desde_entity(miembro))
+    
+    @staticmethod
+    def valores_desde_entity(miembro: Miembro) -> dict:
+        """Valores de columna de una entidad (sin id_miembro), para inserciones en lote"""
+        return {
+            'nombre': miembro.nombre,
+            'apellido': miembro.apellido,
+            'email': miembro.email,
+            'rol': miembro.rol,
+            'fecha_ingreso': date.fromisoformat(miembro.fecha_ingreso)
+        }
     
     def to_entity(self) -> Miembro:
         """Convierte modelo de persistencia a entidad de dominio"""
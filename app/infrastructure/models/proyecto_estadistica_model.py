@@ -0,0 +1,22 @@
+from app import db
+from app.domain.entities.tarea import Tarea
+
+
+class ProyectoEstadisticaModel(db.Model):
+    """Contadores de tareas por estado de un proyecto, mantenidos por TareaService"""
+    
+    __tablename__ = 'proyecto_estadisticas'
+    
+    id_proyecto = db.Column(db.Integer, db.ForeignKey('proyectos.id_proyecto'), primary_key=True)
+    pendiente = db.Column(db.Integer, nullable=False, default=0)
+    en_progreso = db.Column(db.Integer, nullable=False, default=0)
+    completada = db.Column(db.Integer, nullable=False, default=0)
+    bloqueada = db.Column(db.Integer, nullable=False, default=0)
+    
+    # Una columna por estado válido de Tarea
+    ESTADOS = Tarea.ESTADOS_VALIDOS
+    
+    def to_dict(self) -> dict:
+        """Convierte los contadores a diccionario, incluyendo el total"""
+        conteo = {estado: getattr(self, estado) or 0 for estado in self.ESTADOS}
+        return {'total': sum(conteo.values()), **conteo}
@@ -2,13 +2,16 @@
 from datetime import date
 from app import db
 from app.domain.entities.proyecto import Proyecto
+from app.infrastructure.models.marca_tabla_model import ahora_utc
 
 # Tabla de asociación para relación muchos a muchos
 proyecto_miembro = db.Table(
     'proyecto_miembro',
     db.metadata,
     db.Column('id_proyecto', db.Integer, db.ForeignKey('proyectos.id_proyecto'), primary_key=True),
-    db.Column('id_miembro', db.Integer, db.ForeignKey('miembros.id_miembro'), primary_key=True)
+    db.Column('id_miembro', db.Integer, db.ForeignKey('miembros.id_miembro'), primary_key=True),
+    # La PK cubre (id_proyecto, id_miembro); este índice cubre la consulta inversa
+    db.Index('ix_proyecto_miembro_miembro', 'id_miembro')
 )
 
 
@@ -16,6 +19,10 @@ class ProyectoModel(db.Model):
     """Modelo de persistencia para Proyecto"""
     
     __tablename__ = 'proyectos'
+    __table_args__ = (
+        db.Index('ix_proyectos_estado', 'estado'),
+        db.Index('ix_proyectos_nombre', 'nombre'),
+    )
     
     id_proyecto = db.Column(db.Integer, primary_key=True, autoincrement=True)
     nombre = db.Column(db.String(100), nullable=False)
@@ -23,18 +30,22 @@ class ProyectoModel(db.Model):
     fecha_inicio = db.Column(db.Date, nullable=False)
     fecha_fin = db.Column(db.Date, nullable=False)
     estado = db.Column(db.String(20), nullable=False, default="activo")
+    updated_at = db.Column(db.DateTime, nullable=False, default=ahora_utc, onupdate=ahora_utc)
     
     # Relaciones
     miembros = db.relationship(
         "MiembroModel",
         secondary=proyecto_miembro,
-        back_populates="proyectos"
+        back_populates="proyectos",
+        passive_deletes=True
     )
+    # Los borrados se hacen con DELETE por conjunto en ProyectoRepository.eliminar:
+    # passive_deletes evita que la sesión cargue las tareas para borrarlas una a una
     tareas = db.relationship(
         "TareaModel",
-        
         back_populates="proyecto",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     @staticmethod
@@ -0,0 +1,45 @@
+from app import db
+from app.domain.entities.catalogo import ESTADOS_TAREA, PRIORIDADES_TAREA
+from app.infrastructure.models.marca_tabla_model import ahora_utc
+from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.models.tipos import CodigoCatalogo
+
+
+class TareaArchivadaModel(db.Model):
+    """
+    Tareas completadas de proyectos finalizados o cancelados, movidas fuera de `tareas`.
+    Mismas columnas e id que en `tareas`: archivar y restaurar son INSERT ... SELECT + DELETE.
+    Sin índice FTS ni contadores propios (proyecto_estadisticas las sigue contando).
+    """
+
+    __tablename__ = 'tareas_archivadas'
+    __table_args__ = (
+        db.Index('ix_tareas_archivadas_proyecto', 'id_proyecto'),
+        db.Index('ix_tareas_archivadas_miembro', 'id_miembro_asignado'),
+    )
+
+    id_tarea = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    titulo = db.Column(db.String(150), nullable=False)
+    descripcion = db.Column(db.String(1000), nullable=True, default="")
+    id_proyecto = db.Column(db.Integer, db.ForeignKey('proyectos.id_proyecto'), nullable=False)
+    id_miembro_asignado = db.Column(db.Integer, db.ForeignKey('miembros.id_miembro'), nullable=True)
+    prioridad = db.Column(CodigoCatalogo(PRIORIDADES_TAREA), nullable=False)
+    estado = db.Column(CodigoCatalogo(ESTADOS_TAREA), nullable=False)
+    fecha_creacion = db.Column(db.Date, nullable=True)
+    fecha_vencimiento = db.Column(db.Date, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=False)
+    archivada_en = db.Column(db.DateTime, nullable=False, default=ahora_utc)
+
+    # Solo lectura: el detalle de una tarea archivada muestra su proyecto y responsable
+    proyecto = db.relationship("ProyectoModel", viewonly=True)
+    asignado_a = db.relationship("MiembroModel", viewonly=True)
+
+    # Columnas que se copian entre `tareas` y `tareas_archivadas`, en el mismo orden
+    COLUMNAS_COPIADAS = (
+        'id_tarea', 'titulo', 'descripcion', 'id_proyecto', 'id_miembro_asignado',
+        'prioridad', 'estado', 'fecha_creacion', 'fecha_vencimiento', 'updated_at'
+    )
+
+    dias_restantes = TareaModel.dias_restantes
+    to_entity = TareaModel.to_entity
+    to_dict = TareaModel.to_dict
@@ -1,22 +1,63 @@
 from datetime import date
+from sqlalchemy import event
 from app import db
 from app.domain.entities.tarea import Tarea
+from app.domain.consultas.tarea_vista import TareaVista
+from app.domain.entities.catalogo import ESTADOS_TAREA, PRIORIDADES_TAREA
+from app.infrastructure.models.marca_tabla_model import ahora_utc
+from app.infrastructure.models.tipos import CodigoCatalogo
+from app.infrastructure.queries.busqueda_texto import crear_indice_busqueda, eliminar_indice_busqueda
+
+# Código guardado del estado 'completada' (literal en el índice parcial y en las consultas que lo usan)
+CODIGO_COMPLETADA = ESTADOS_TAREA.codigo('completada')
+
+# Las tareas sin vencimiento se ordenan después de todas las demás
+SIN_VENCIMIENTO = '9999-12-31'
 
 
 class TareaModel(db.Model):
     """Modelo de persistencia para Tarea"""
     
     __tablename__ = 'tareas'
+    __table_args__ = (
+        # Listados y conteos por proyecto (contar_por_estado se resuelve solo con el índice)
+        db.Index('ix_tareas_proyecto_estado', 'id_proyecto', 'estado'),
+        # Tareas de un miembro y tareas sin asignar (id_miembro_asignado IS NULL)
+        db.Index('ix_tareas_miembro_estado', 'id_miembro_asignado', 'estado'),
+        db.Index('ix_tareas_estado', 'estado'),
+        # Orden "más urgentes y, dentro de cada prioridad, las que vencen antes"
+        # resuelto recorriendo el índice (ver VENCIMIENTO_ORDENABLE)
+        db.Index(
+            'ix_tareas_prioridad_vencimiento',
+            'prioridad',
+            db.text(f"coalesce(fecha_vencimiento, '{SIN_VENCIMIENTO}')")
+        ),
+        # orden=vencimiento / -vencimiento: el mismo índice recorrido en uno u otro sentido
+        db.Index(
+            'ix_tareas_vencimiento',
+            db.text(f"coalesce(fecha_vencimiento, '{SIN_VENCIMIENTO}')")
+        ),
+        # Índice parcial: solo las tareas abiertas pueden estar vencidas
+        db.Index(
+            'ix_tareas_vencimiento_abiertas',
+            'fecha_vencimiento',
+            sqlite_where=db.text(f"estado != {CODIGO_COMPLETADA}")
+        ),
+        # AUTOINCREMENT: un id nunca se reutiliza, aunque la tarea de id más alto se borre
+        # o se archive (el id sigue vivo en tareas_archivadas y puede volver al restaurarla)
+        {'sqlite_autoincrement': True},
+    )
     
     id_tarea = db.Column(db.Integer, primary_key=True, autoincrement=True)
     titulo = db.Column(db.String(150), nullable=False)
     descripcion = db.Column(db.String(1000), nullable=True, default="")
     id_proyecto = db.Column(db.Integer, db.ForeignKey('proyectos.id_proyecto'), nullable=False)
     id_miembro_asignado = db.Column(db.Integer, db.ForeignKey('miembros.id_miembro'), nullable=True)
-    prioridad = db.Column(db.String(20), nullable=False, default="media")
-    estado = db.Column(db.String(20), nullable=False, default="pendiente")
+    prioridad = db.Column(CodigoCatalogo(PRIORIDADES_TAREA), nullable=False, default="media")
+    estado = db.Column(CodigoCatalogo(ESTADOS_TAREA), nullable=False, default="pendiente")
     fecha_creacion = db.Column(db.Date, nullable=True, default=date.today)
     fecha_vencimiento = db.Column(db.Date, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=False, default=ahora_utc, onupdate=ahora_utc)
     
     # Relaciones
     proyecto = db.relationship("ProyectoModel", back_populates="tareas")
@@ -32,17 +73,21 @@ class TareaModel(db.Model):
     @staticmethod
     def from_entity(tarea: Tarea) -> 'TareaModel':
         """Convierte entidad de dominio a modelo de persistencia"""
-        return TareaModel(
-            id_tarea=tarea.id_tarea,
-            titulo=tarea.titulo,
-            descripcion=tarea.descripcion,
-            id_proyecto=tarea.id_proyecto,
-            id_miembro_asignado=tarea.id_miembro_asignado,
-            prioridad=tarea.prioridad,
-            estado=tarea.estado,
-            fecha_creacion=date.fromisoformat(tarea.fecha_creacion) if tarea.fecha_creacion else None,
-            fecha_vencimiento=date.fromisoformat(tarea.fecha_vencimiento) if tarea.fecha_vencimiento else None
-        )
+        return TareaModel(id_tarea=tarea.id_tarea, **TareaModel.valores_desde_entity(tarea))
+    
+    @staticmethod
+    def valores_desde_entity(tarea: Tarea) -> dict:
+        """Valores de columna de una entidad (sin id_tarea), para inserciones y actualizaciones en lote"""
+        return {
+            'titulo': tarea.titulo,
+            'descripcion': tarea.descripcion,
+            'id_proyecto': tarea.id_proyecto,
+            'id_miembro_asignado': tarea.id_miembro_asignado,
+            'prioridad': tarea.prioridad,
+            'estado': tarea.estado,
+            'fecha_creacion': date.fromisoformat(tarea.fecha_creacion) if tarea.fecha_creacion else None,
+            'fecha_vencimiento': date.fromisoformat(tarea.fecha_vencimiento) if tarea.fecha_vencimiento else None
+        }
     
     def to_entity(self) -> Tarea:
         """Convierte modelo de persistencia a entidad de dominio"""
@@ -58,6 +103,23 @@ class TareaModel(db.Model):
             fecha_vencimiento=self.fecha_vencimiento.isoformat() if self.fecha_vencimiento else None
         )
     
+    @staticmethod
+    def entity_desde_fila(fila) -> Tarea:
+        """
+        Construye la entidad desde una fila de TareaRepository.COLUMNAS_ENTIDAD,
+        sin pasar por un objeto ORM (las fechas ya vienen como texto ISO)
+        """
+        return Tarea(**fila._mapping)
+    
+    @staticmethod
+    def vista_desde_fila(fila) -> TareaVista:
+        """Construye el modelo de lectura desde una fila de TareaRepository.COLUMNAS_VISTA"""
+        valores = dict(fila._mapping)
+        nombre_proyecto = valores.pop('nombre_proyecto')
+        nombre_miembro = valores.pop('nombre_miembro')
+        valores.pop('rango', None)
+        return TareaVista(Tarea(**valores), nombre_proyecto, nombre_miembro)
+    
     def actualizar_desde_entity(self, tarea: Tarea) -> None:
         """Actualiza el modelo desde una entidad validada"""
         self.titulo = tarea.titulo
@@ -83,3 +145,22 @@ class TareaModel(db.Model):
         }
 
 
+
+
+# Misma expresión que ix_tareas_vencimiento e ix_tareas_prioridad_vencimiento; el literal (no un parámetro) permite que SQLite use el índice
+VENCIMIENTO_ORDENABLE = db.func.coalesce(
+    TareaModel.fecha_vencimiento, db.literal_column(f"'{SIN_VENCIMIENTO}'")
+)
+
+
+# La tabla FTS5 y sus triggers se crean y eliminan junto con la tabla tareas
+event.listen(
+    TareaModel.__table__,
+    'after_create',
+    lambda tabla, conexion, **kw: crear_indice_busqueda(conexion)
+)
+event.listen(
+    TareaModel.__table__,
+    'before_drop',
+    lambda tabla, conexion, **kw: eliminar_indice_busqueda(conexion)
+)
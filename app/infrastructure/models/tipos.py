@@ -0,0 +1,38 @@
+"""
+Tipos de columna propios - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+from sqlalchemy.types import SmallInteger, TypeDecorator
+from app.domain.entities.catalogo import Catalogo
+
+
+class CodigoCatalogo(TypeDecorator):
+    """
+    Columna SMALLINT que guarda el código entero de un valor de Catalogo.
+    Las entidades, los filtros (==, IN) y los resultados siguen usando el texto:
+    la conversión se hace al enlazar parámetros y al leer filas.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, catalogo: Catalogo):
+        super().__init__()
+        self.catalogo = catalogo
+
+    def process_bind_param(self, valor, dialect):
+        if valor is None or isinstance(valor, int):
+            return valor
+        return self.catalogo.codigo(valor)
+
+    def process_literal_param(self, valor, dialect):
+        return str(self.process_bind_param(valor, dialect))
+
+    def process_result_value(self, codigo, dialect):
+        if codigo is None:
+            return None
+        return self.catalogo.valor(codigo)
+
+    @property
+    def python_type(self):
+        return str
@@ -0,0 +1,80 @@
+"""
+Búsqueda de texto completo sobre tareas (SQLite FTS5) - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+tareas_fts es una tabla FTS5 de contenido externo: guarda solo el índice
+invertido de titulo y descripcion y lee el texto de la tabla tareas. Los
+triggers la mantienen sincronizada en cada INSERT, UPDATE y DELETE.
+"""
+import re
+from typing import List
+
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+TABLA_FTS = 'tareas_fts'
+
+# Peso de cada columna en bm25: una coincidencia en el título vale más que en la descripción
+PESO_TITULO = 10.0
+PESO_DESCRIPCION = 1.0
+
+SENTENCIAS_FTS: List[str] = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLA_FTS} USING fts5(
+        titulo, descripcion,
+        content='tareas', content_rowid='id_tarea',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tareas_fts_insertar AFTER INSERT ON tareas BEGIN
+        INSERT INTO {TABLA_FTS}(rowid, titulo, descripcion)
+        VALUES (new.id_tarea, new.titulo, new.descripcion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tareas_fts_eliminar AFTER DELETE ON tareas BEGIN
+        INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, descripcion)
+        VALUES ('delete', old.id_tarea, old.titulo, old.descripcion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tareas_fts_actualizar AFTER UPDATE OF titulo, descripcion ON tareas BEGIN
+        INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, descripcion)
+        VALUES ('delete', old.id_tarea, old.titulo, old.descripcion);
+        INSERT INTO {TABLA_FTS}(rowid, titulo, descripcion)
+        VALUES (new.id_tarea, new.titulo, new.descripcion);
+    END
+    """,
+]
+
+# Palabra, opcionalmente terminada en * para buscar por prefijo
+_TERMINO = re.compile(r'(\w+)(\*?)', re.UNICODE)
+
+
+def crear_indice_busqueda(conexion) -> None:
+    """Crea (si no existen) la tabla FTS5 y sus triggers"""
+    for sentencia in SENTENCIAS_FTS:
+        conexion.exec_driver_sql(sentencia)
+
+
+def eliminar_indice_busqueda(conexion) -> None:
+    """Elimina la tabla FTS5 (los triggers se eliminan junto con la tabla tareas)"""
+    conexion.exec_driver_sql(f"DROP TABLE IF EXISTS {TABLA_FTS}")
+
+
+def reconstruir_indice_busqueda(conexion) -> None:
+    """Vuelve a indexar todas las tareas existentes"""
+    conexion.exec_driver_sql(f"INSERT INTO {TABLA_FTS}({TABLA_FTS}) VALUES ('rebuild')")
+
+
+def expresion_match(texto: str) -> str:
+    """
+    Convierte el texto del usuario en una expresión MATCH segura: cada palabra
+    entre comillas, todas obligatorias. Solo las palabras terminadas en * se
+    buscan por prefijo, porque un prefijo corto expande a miles de términos
+    y deja de ser una búsqueda de milisegundos.
+    """
+    terminos = _TERMINO.findall(texto or '')
+    if not terminos:
+        raise DatoInvalidoError("El texto de búsqueda no puede estar vacío")
+    return ' '.join(f'"{palabra}"{prefijo}' for palabra, prefijo in terminos)
@@ -0,0 +1,21 @@
+"""
+Configuración de conexiones SQLite - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+from typing import Dict
+from sqlalchemy import event
+
+
+def registrar_pragmas_sqlite(engine, pragmas: Dict[str, object]) -> None:
+    """Aplica los PRAGMA indicados a cada conexión nueva del engine (solo SQLite)"""
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _aplicar_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for nombre, valor in pragmas.items():
+                cursor.execute(f"PRAGMA {nombre} = {valor}")
+        finally:
+            cursor.close()
@@ -0,0 +1,219 @@
+"""
+Instrumentación SQL por petición - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+Con hooks before/after_cursor_execute del engine se mide, para cada petición
+muestreada: cantidad de sentencias, tiempo total en la base, la sentencia más
+lenta y las sentencias repetidas (el mismo SQL ejecutado muchas veces en una
+petición suele ser un N+1). El resultado sale en la cabecera Server-Timing y
+queda en un buffer circular en memoria (GET /estado/sql). Las respuestas en
+streaming (exportaciones, NDJSON) se miden hasta que se cierran y no llevan
+Server-Timing: sus cabeceras se envían antes de ejecutar las consultas.
+
+Las peticiones no muestreadas solo pagan una lectura de ContextVar por
+sentencia, así que puede quedar activa en producción con un muestreo bajo.
+Con las métricas habilitadas, las no muestreadas se miden en modo liviano
+(solo cantidad y tiempo total) para el histograma de tiempo en la base.
+"""
+import random
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from flask import g, request
+from sqlalchemy import event
+
+from app import db
+
+# Largo máximo del SQL guardado (sin parámetros: nunca se guardan datos de las filas)
+LARGO_MAXIMO_SQL = 500
+
+_medicion_actual: ContextVar[Optional['MedicionPeticion']] = ContextVar('medicion_sql', default=None)
+
+
+class MedicionPeticion:
+    """Contadores SQL de una petición"""
+
+    __slots__ = ('metodo', 'ruta', 'inicio', 'sentencias', 'tiempo_db', 'mas_lenta', 'tiempo_mas_lenta', 'por_sql')
+
+    def __init__(self, metodo: str, ruta: str, completa: bool = True):
+        self.metodo = metodo
+        self.ruta = ruta
+        self.inicio = time.perf_counter()
+        self.sentencias = 0
+        self.tiempo_db = 0.0
+        self.mas_lenta: Optional[str] = None
+        self.tiempo_mas_lenta = 0.0
+        # None en modo liviano: no se guarda el SQL
+        self.por_sql: Optional[Counter] = Counter() if completa else None
+
+    @property
+    def completa(self) -> bool:
+        return self.por_sql is not None
+
+    def registrar(self, sql: str, segundos: float) -> None:
+        self.sentencias += 1
+        self.tiempo_db += segundos
+        if self.por_sql is None:
+            return
+        self.por_sql[sql] += 1
+        if segundos > self.tiempo_mas_lenta:
+            self.tiempo_mas_lenta = segundos
+            self.mas_lenta = sql
+
+    def repetidas(self, umbral: int) -> List[Dict[str, Any]]:
+        """Sentencias ejecutadas al menos `umbral` veces (sospechosas de N+1), de más a menos"""
+        return [
+            {'sql': sql[:LARGO_MAXIMO_SQL], 'veces': veces}
+            for sql, veces in self.por_sql.most_common() if veces >= umbral
+        ]
+
+    def server_timing(self, umbral: int) -> str:
+        """Valor de la cabecera Server-Timing (duraciones en milisegundos)"""
+        partes = [
+            f'db;desc="{self.sentencias} sentencias";dur={self.tiempo_db * 1000:.2f}',
+            f'db-lenta;dur={self.tiempo_mas_lenta * 1000:.2f}',
+        ]
+        sospechosas = sum(1 for veces in self.por_sql.values() if veces >= umbral)
+        if sospechosas:
+            partes.append(f'db-repetidas;desc="posible N+1: {sospechosas}"')
+        return ', '.join(partes)
+
+    def resumen(self, estado: int, umbral: int) -> Dict[str, Any]:
+        return {
+            'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'metodo': self.metodo,
+            'ruta': self.ruta,
+            'estado': estado,
+            'duracion_ms': round((time.perf_counter() - self.inicio) * 1000, 2),
+            'sentencias': self.sentencias,
+            'tiempo_db_ms': round(self.tiempo_db * 1000, 2),
+            'mas_lenta': {
+                'sql': self.mas_lenta[:LARGO_MAXIMO_SQL],
+                'ms': round(self.tiempo_mas_lenta * 1000, 2)
+            } if self.mas_lenta else None,
+            'repetidas': self.repetidas(umbral),
+        }
+
+
+class RegistroPeticiones:
+    """Buffer circular (thread-safe) con el resumen de las últimas peticiones medidas"""
+
+    def __init__(self, capacidad: int = 200):
+        self._peticiones: deque = deque(maxlen=capacidad)
+        self._candado = threading.Lock()
+        self._medidas = 0
+
+    def configurar(self, capacidad: int) -> None:
+        """Cambia la capacidad (vacía el buffer)"""
+        with self._candado:
+            self._peticiones = deque(maxlen=max(capacidad, 1))
+            self._medidas = 0
+
+    def agregar(self, resumen: Dict[str, Any]) -> None:
+        with self._candado:
+            self._peticiones.append(resumen)
+            self._medidas += 1
+
+    def recientes(self, limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Las últimas peticiones medidas, de la más reciente a la más antigua"""
+        with self._candado:
+            peticiones = list(self._peticiones)
+        peticiones.reverse()
+        return peticiones[:limite] if limite else peticiones
+
+    def estadisticas(self) -> Dict[str, Any]:
+        with self._candado:
+            return {
+                'medidas': self._medidas,
+                'en_buffer': len(self._peticiones),
+                'capacidad': self._peticiones.maxlen,
+            }
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self._peticiones.clear()
+            self._medidas = 0
+
+
+registro_peticiones = RegistroPeticiones()
+
+
+def _antes_de_ejecutar(conexion, cursor, sql, parametros, contexto, executemany):
+    if _medicion_actual.get() is not None and contexto is not None:
+        contexto._inicio_instrumentacion = time.perf_counter()
+
+
+def _despues_de_ejecutar(conexion, cursor, sql, parametros, contexto, executemany):
+    medicion = _medicion_actual.get()
+    inicio = getattr(contexto, '_inicio_instrumentacion', None)
+    if medicion is not None and inicio is not None:
+        medicion.registrar(sql, time.perf_counter() - inicio)
+
+
+def registrar_instrumentacion_sql(app) -> None:
+    """
+    Engancha la medición al engine y a cada petición según app.config:
+    INSTRUMENTACION_SQL_MUESTREO (fracción de peticiones medidas, 0 la desactiva),
+    INSTRUMENTACION_SQL_CAPACIDAD (tamaño del buffer) e
+    INSTRUMENTACION_SQL_REPETIDAS (veces que debe repetirse un SQL para marcarlo).
+    La medición de cada petición queda en g.medicion_sql para las métricas.
+    """
+    muestreo = app.config.get('INSTRUMENTACION_SQL_MUESTREO', 0.0)
+    umbral = app.config.get('INSTRUMENTACION_SQL_REPETIDAS', 5)
+    medir_todas = app.config.get('METRICAS_HABILITADAS', False)
+    registro_peticiones.configurar(app.config.get('INSTRUMENTACION_SQL_CAPACIDAD', 200))
+    if muestreo <= 0 and not medir_todas:
+        return
+
+    for nombre, funcion in (('before_cursor_execute', _antes_de_ejecutar),
+                            ('after_cursor_execute', _despues_de_ejecutar)):
+        if not event.contains(db.engine, nombre, funcion):
+            event.listen(db.engine, nombre, funcion)
+
+    @app.before_request
+    def _iniciar_medicion():
+        muestreada = muestreo >= 1 or (muestreo > 0 and random.random() < muestreo)
+        if muestreada or medir_todas:
+            request.environ['_token_medicion_sql'] = _medicion_actual.set(
+                MedicionPeticion(request.method, request.full_path.rstrip('?'), completa=muestreada)
+            )
+
+    @app.after_request
+    def _publicar_medicion(response):
+        medicion = _medicion_actual.get()
+        if medicion is None:
+            return response
+        g.medicion_sql = medicion
+        if response.is_streamed:
+            # El cuerpo todavía no se generó: la medición sigue activa y se publica al cerrar
+            # la respuesta, sin Server-Timing porque las cabeceras salen antes que el cuerpo
+            token = request.environ.pop('_token_medicion_sql', None)
+            response.call_on_close(lambda: _publicar_al_cerrar(medicion, response.status_code, token))
+            return response
+        if medicion.completa:
+            response.headers.add('Server-Timing', medicion.server_timing(umbral))
+            registro_peticiones.agregar(medicion.resumen(response.status_code, umbral))
+        _medicion_actual.set(None)
+        return response
+
+    def _publicar_al_cerrar(medicion, estado, token):
+        if medicion.completa:
+            registro_peticiones.agregar(medicion.resumen(estado, umbral))
+        if token is not None:
+            _medicion_actual.reset(token)
+
+    @app.teardown_request
+    def _cerrar_medicion(exc):
+        token = request.environ.pop('_token_medicion_sql', None)
+        if token is None:
+            # Sin medición, o la cierra la respuesta en streaming
+            return
+        # Si la petición terminó con una excepción no manejada, after_request no corrió
+        medicion = _medicion_actual.get()
+        if medicion is not None and medicion.completa:
+            registro_peticiones.agregar(medicion.resumen(500, umbral))
+        _medicion_actual.reset(token)
@@ -0,0 +1,83 @@
+"""
+Verificación de planes de consulta (EXPLAIN QUERY PLAN) - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+Ejecuta cada método de repositorio, captura el SQL que emite y comprueba
+con EXPLAIN QUERY PLAN que SQLite accede a la tabla mediante un índice.
+"""
+from typing import Callable, List, Tuple
+from sqlalchemy import event
+from app import db
+from app.infrastructure.repositories.tarea_repository import TareaRepository
+from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
+from app.infrastructure.repositories.miembro_repository import MiembroRepository
+from app.domain.consultas.tarea_filtro import TareaFiltro
+
+
+def _capturar_sentencias(llamada: Callable) -> List[Tuple[str, tuple]]:
+    """Ejecuta la llamada y devuelve las sentencias SQL enviadas al driver"""
+    capturadas = []
+
+    def _escuchar(conn, cursor, statement, parameters, context, executemany):
+        capturadas.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', _escuchar)
+    try:
+        llamada()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _escuchar)
+    return capturadas
+
+
+def _casos() -> List[Tuple[str, Callable]]:
+    tarea_repo = TareaRepository()
+    proyecto_repo = ProyectoRepository()
+    miembro_repo = MiembroRepository()
+    return [
+        ('TareaRepository.obtener_por_proyecto', lambda: tarea_repo.obtener_por_proyecto(1)),
+        ('TareaRepository.obtener_por_miembro', lambda: tarea_repo.obtener_por_miembro(1)),
+        ('TareaRepository.obtener_por_estado', lambda: tarea_repo.obtener_por_estado('pendiente')),
+        ('TareaRepository.obtener_por_prioridad', lambda: tarea_repo.obtener_por_prioridad('alta')),
+        ('TareaRepository.obtener_vencidas', lambda: tarea_repo.obtener_vencidas()),
+        ('TareaRepository.obtener_sin_asignar', lambda: tarea_repo.obtener_sin_asignar()),
+        ('TareaRepository.contar_por_estado', lambda: tarea_repo.contar_por_estado(1)),
+        ('TareaRepository.obtener_filas (proyecto)', lambda: tarea_repo.obtener_filas(id_proyecto=1)),
+        ('TareaRepository.obtener_filas (miembro)', lambda: tarea_repo.obtener_filas(id_miembro=1)),
+        ('TareaRepository.obtener_filas (estado)', lambda: tarea_repo.obtener_filas(estado='pendiente')),
+        ('TareaRepository.obtener_pagina_filtrada (proyecto+estados+prioridad)', lambda: tarea_repo.obtener_pagina_filtrada(
+            TareaFiltro(id_proyecto=1, estados=['pendiente', 'bloqueada'], prioridades=['alta'], orden='prioridad'))),
+        ('TareaRepository.obtener_pagina_filtrada (sin asignar+vencimiento)', lambda: tarea_repo.obtener_pagina_filtrada(
+            TareaFiltro(sin_asignar=True, vence_hasta='2025-12-31', orden='vencimiento'))),
+        ('TareaRepository.obtener_pagina_filtrada (rango de vencimiento abiertas)', lambda: tarea_repo.obtener_pagina_filtrada(
+            TareaFiltro(estados=['pendiente', 'en_progreso'], vence_desde='2025-01-01', vence_hasta='2025-12-31'))),
+        ('TareaRepository.obtener_pagina_filtrada (proyecto+archivadas)', lambda: tarea_repo.obtener_pagina_filtrada(
+            TareaFiltro(id_proyecto=1, incluir_archivadas=True))),
+        ('ProyectoRepository.obtener_progreso', lambda: proyecto_repo.obtener_progreso([1, 2, 3])),
+        ('ProyectoRepository.obtener_por_estado', lambda: proyecto_repo.obtener_por_estado('activo')),
+        ('MiembroRepository.obtener_por_rol', lambda: miembro_repo.obtener_por_rol('tester')),
+        ('MiembroRepository.obtener_por_email', lambda: miembro_repo.obtener_por_email('a@b.com')),
+    ]
+
+
+def verificar_uso_de_indices() -> List[dict]:
+    """
+    Devuelve, por método de repositorio, el plan de cada sentencia y si
+    todos los accesos a tablas son búsquedas por índice (SEARCH ... USING).
+    """
+    resultados = []
+    for nombre, llamada in _casos():
+        for sql, parametros in _capturar_sentencias(llamada):
+            filas = db.session.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {sql}", parametros
+            ).fetchall()
+            detalles = [fila[-1] for fila in filas]
+            accesos = [d for d in detalles if d.startswith(('SCAN', 'SEARCH'))]
+            resultados.append({
+                'metodo': nombre,
+                'sql': sql,
+                'plan': detalles,
+                'usa_indice': bool(accesos) and all(
+                    d.startswith('SEARCH') and 'USING' in d for d in accesos
+                )
+            })
+    return resultados
@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+from app import db
+from app.infrastructure.models.proyecto_estadistica_model import ProyectoEstadisticaModel
+from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
+from app.infrastructure.repositories.unidad_de_trabajo import confirmar, revertir
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+ESTADOS = ProyectoEstadisticaModel.ESTADOS
+
+
+def sentencia_recalculo(id_proyecto: Optional[int] = None):
+    """
+    INSERT ... SELECT ... ON CONFLICT DO UPDATE que recalcula los contadores
+    desde la tabla tareas (de un proyecto o de todos), sumando a 'completada'
+    las tareas archivadas, que siempre son completadas
+    """
+    tabla = ProyectoEstadisticaModel.__table__
+    archivadas = select(func.count()).select_from(TareaArchivadaModel).where(
+        TareaArchivadaModel.id_proyecto == ProyectoModel.id_proyecto
+    ).scalar_subquery()
+    consulta = select(
+        ProyectoModel.id_proyecto,
+        *[
+            (
+                func.count(case((TareaModel.estado == estado, 1)))
+                + (archivadas if estado == 'completada' else 0)
+            ).label(estado)
+            for estado in ESTADOS
+        ]
+    ).select_from(ProyectoModel).outerjoin(
+        TareaModel, TareaModel.id_proyecto == ProyectoModel.id_proyecto
+    ).group_by(ProyectoModel.id_proyecto)
+    
+    if id_proyecto is not None:
+        consulta = consulta.where(ProyectoModel.id_proyecto == id_proyecto)
+    
+    sentencia = insert(tabla).from_select(['id_proyecto', *ESTADOS], consulta)
+    return sentencia.on_conflict_do_update(
+        index_elements=['id_proyecto'],
+        set_={estado: getattr(sentencia.excluded, estado) for estado in ESTADOS}
+    )
+
+
+class EstadisticaRepository:
+    """Repositorio para los contadores de tareas por proyecto (proyecto_estadisticas)"""
+    
+    def ajustar(self, id_proyecto: int, estado_anterior: Optional[str], estado_nuevo: Optional[str]) -> None:
+        """
+        Mueve una tarea de un contador a otro en la misma transacción que la escritura.
+        estado_anterior=None significa alta; estado_nuevo=None significa baja.
+        """
+        if estado_anterior == estado_nuevo:
+            return
+        try:
+            valores = {}
+            if estado_anterior is not None:
+                columna = getattr(ProyectoEstadisticaModel, estado_anterior)
+                valores[estado_anterior] = columna - 1
+            if estado_nuevo is not None:
+                columna = getattr(ProyectoEstadisticaModel, estado_nuevo)
+                valores[estado_nuevo] = columna + 1
+            
+            resultado = db.session.execute(
+                update(ProyectoEstadisticaModel)
+                .where(ProyectoEstadisticaModel.id_proyecto == id_proyecto)
+                .values(valores)
+                .execution_options(synchronize_session=False)
+            )
+            if resultado.rowcount == 0:
+                # Proyecto sin fila (base anterior a los contadores): se recalcula desde tareas
+                db.session.flush()
+                db.session.execute(sentencia_recalculo(id_proyecto))
+            confirmar()
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al actualizar estadísticas del proyecto: {str(e)}")
+    
+    def ajustar_en_lote(self, deltas: Dict[int, Dict[str, int]]) -> None:
+        """
+        Aplica variaciones acumuladas por proyecto y estado ({id_proyecto: {estado: +n/-n}})
+        con un UPDATE por proyecto, en lugar de uno por tarea.
+        """
+        try:
+            for id_proyecto, por_estado in deltas.items():
+                valores = {
+                    estado: getattr(ProyectoEstadisticaModel, estado) + cantidad
+                    for estado, cantidad in por_estado.items() if cantidad
+                }
+                if not valores:
+                    continue
+                resultado = db.session.execute(
+                    update(ProyectoEstadisticaModel)
+                    .where(ProyectoEstadisticaModel.id_proyecto == id_proyecto)
+                    .values(valores)
+                    .execution_options(synchronize_session=False)
+                )
+                if resultado.rowcount == 0:
+                    db.session.flush()
+                    db.session.execute(sentencia_recalculo(id_proyecto))
+            confirmar()
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al actualizar estadísticas de proyectos: {str(e)}")
+    
+    def obtener(self, id_proyecto: int) -> Dict[str, int]:
+        """Obtiene los contadores de un proyecto (lectura por clave primaria)"""
+        try:
+            estadistica = db.session.get(ProyectoEstadisticaModel, id_proyecto)
+            if estadistica is None:
+                db.session.execute(sentencia_recalculo(id_proyecto))
+                confirmar()
+                estadistica = db.session.get(ProyectoEstadisticaModel, id_proyecto)
+            if estadistica is None:
+                return {'total': 0, **{estado: 0 for estado in ESTADOS}}
+            return estadistica.to_dict()
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener estadísticas del proyecto: {str(e)}")
+    
+    def obtener_varios(self, ids_proyecto: List[int]) -> Dict[int, Dict[str, int]]:
+        """Obtiene los contadores de varios proyectos en una sola consulta"""
+        try:
+            if not ids_proyecto:
+                return {}
+            filas = ProyectoEstadisticaModel.query.filter(
+                ProyectoEstadisticaModel.id_proyecto.in_(ids_proyecto)
+            ).all()
+            return {fila.id_proyecto: fila.to_dict() for fila in filas}
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener estadísticas de proyectos: {str(e)}")
+    
+    def eliminar(self, id_proyecto: int) -> None:
+        """Elimina los contadores de un proyecto"""
+        try:
+            db.session.execute(
+                ProyectoEstadisticaModel.__table__.delete().where(
+                    ProyectoEstadisticaModel.id_proyecto == id_proyecto
+                )
+            )
+            confirmar()
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al eliminar estadísticas del proyecto: {str(e)}")
+    
+    def recalcular_todo(self) -> List[dict]:
+        """
+        Recalcula los contadores de todos los proyectos desde cero.
+        Devuelve los proyectos cuyos contadores guardados no coincidían (deriva).
+        """
+        try:
+            guardados = {
+                fila.id_proyecto: fila.to_dict() for fila in ProyectoEstadisticaModel.query.all()
+            }
+            db.session.execute(sentencia_recalculo())
+            confirmar()
+            db.session.expire_all()
+            
+            diferencias = []
+            for fila in ProyectoEstadisticaModel.query.all():
+                recalculado = fila.to_dict()
+                anterior = guardados.get(fila.id_proyecto)
+                if anterior != recalculado:
+                    diferencias.append({
+                        'id_proyecto': fila.id_proyecto,
+                        'guardado': anterior,
+                        'recalculado': recalculado
+                    })
+            return diferencias
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al recalcular estadísticas: {str(e)}")
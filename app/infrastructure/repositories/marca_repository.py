@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from app import db
+from app.infrastructure.models.marca_tabla_model import MarcaTablaModel
+from app.infrastructure.models.miembro_model import MiembroModel
+from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.models.tarea_model import TareaModel
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+
+class MarcaRepository:
+    """Repositorio de marcas de modificación (versión por tabla y updated_at por fila)"""
+    
+    # Entidades cuyo updated_at puede consultarse por clave primaria
+    COLUMNAS_UPDATED_AT = {
+        'tarea': (TareaModel.id_tarea, TareaModel.updated_at),
+        'proyecto': (ProyectoModel.id_proyecto, ProyectoModel.updated_at),
+        'miembro': (MiembroModel.id_miembro, MiembroModel.updated_at),
+    }
+    
+    def versiones(self, tablas: Iterable[str]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """Devuelve {tabla: (version, modificado_en)} en una consulta; las tablas sin escrituras valen (0, None)"""
+        try:
+            tablas = list(tablas)
+            filas = db.session.execute(
+                db.select(MarcaTablaModel.tabla, MarcaTablaModel.version, MarcaTablaModel.modificado_en)
+                .where(MarcaTablaModel.tabla.in_(tablas))
+            )
+            encontradas = {tabla: (version, modificado_en) for tabla, version, modificado_en in filas}
+            return {tabla: encontradas.get(tabla, (0, None)) for tabla in tablas}
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener marcas de modificación: {str(e)}")
+    
+    def updated_at(self, entidad: str, id_entidad: int) -> Optional[datetime]:
+        """Devuelve el updated_at de una fila (None si no existe), leyendo solo esa columna por PK"""
+        if entidad not in self.COLUMNAS_UPDATED_AT:
+            raise DatoInvalidoError(f"Entidad '{entidad}' no tiene marca de modificación")
+        try:
+            columna_id, columna_updated_at = self.COLUMNAS_UPDATED_AT[entidad]
+            return db.session.scalar(db.select(columna_updated_at).where(columna_id == id_entidad))
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener marca de modificación: {str(e)}")
@@ -1,32 +1,122 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from sqlalchemy import insert, update
+from sqlalchemy.orm import joinedload, selectinload
 from app import db
 from app.infrastructure.models.miembro_model import MiembroModel
+from app.infrastructure.models.proyecto_model import proyecto_miembro
+from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
+from app.infrastructure.repositories.paginacion import Pagina, paginar
+from app.infrastructure.repositories.proyeccion import columnas_solicitadas, iterar_proyectadas, pagina_proyectada
+from app.infrastructure.repositories.unidad_de_trabajo import confirmar, revertir
 from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
 
 class MiembroRepository:
     """Repositorio para acceso a datos de Miembro con Flask-SQLAlchemy"""
     
+    # Perfiles de carga: relaciones que se traen junto al miembro en un número fijo de consultas
+    PERFILES_CARGA = {
+        'miembro_con_proyectos': lambda: [selectinload(MiembroModel.proyectos)],
+        'miembro_con_tareas_y_proyectos': lambda: [
+            selectinload(MiembroModel.proyectos),
+            selectinload(MiembroModel.tareas).joinedload(TareaModel.proyecto),
+        ],
+    }
+    
+    # Campos que la API puede devolver (?fields=...), en el orden de salida
+    CAMPOS_API = {
+        'id_miembro': MiembroModel.id_miembro,
+        'nombre': MiembroModel.nombre,
+        'apellido': MiembroModel.apellido,
+        'email': MiembroModel.email,
+        'rol': MiembroModel.rol,
+        'fecha_ingreso': MiembroModel.fecha_ingreso,
+        'updated_at': MiembroModel.updated_at,
+    }
+    
+    def _opciones_perfil(self, perfil: Optional[str]) -> list:
+        """Devuelve las opciones de carga del perfil indicado"""
+        if perfil is None:
+            return []
+        if perfil not in self.PERFILES_CARGA:
+            raise DatoInvalidoError(f"Perfil de carga '{perfil}' no existe")
+        return self.PERFILES_CARGA[perfil]()
     
     def crear(self, miembro_model: MiembroModel) -> MiembroModel:
         """Crea un nuevo miembro en la BD"""
         try:
             db.session.add(miembro_model)
-            db.session.commit()
-            db.session.refresh(miembro_model)
+            confirmar()
             return miembro_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             if "unique constraint" in str(e).lower() and "email" in str(e).lower():
                 raise DatoInvalidoError("El email ya está registrado en el sistema")
             raise DatoInvalidoError(f"Error al crear miembro: {str(e)}")
     
-    def obtener_por_id(self, id_miembro: int) -> Optional[MiembroModel]:
-        """Obtiene un miembro por su ID"""
+    def crear_en_lote(self, filas: List[Dict]) -> List[int]:
+        """
+        Inserta muchos miembros con un único INSERT ejecutado en lote (executemany).
+        Devuelve los IDs generados en el mismo orden que las filas.
+        """
+        try:
+            if not filas:
+                return []
+            # IDs en el orden de las filas (ver TareaRepository.crear_en_lote)
+            ids = db.session.scalars(
+                insert(MiembroModel).returning(MiembroModel.id_miembro, sort_by_parameter_order=True),
+                filas
+            ).all()
+            confirmar()
+            return list(ids)
+        except Exception as e:
+            revertir()
+            if "unique constraint" in str(e).lower() and "email" in str(e).lower():
+                raise DatoInvalidoError("El email ya está registrado en el sistema")
+            raise DatoInvalidoError(f"Error al crear miembros en lote: {str(e)}")
+    
+    def obtener_por_id(self, id_miembro: int, perfil: Optional[str] = None) -> Optional[MiembroModel]:
+        """Obtiene un miembro por su ID, opcionalmente con un perfil de carga"""
         try:
-            return MiembroModel.query.filter_by(id_miembro=id_miembro).first()
+            return MiembroModel.query.options(
+                *self._opciones_perfil(perfil)
+            ).filter_by(id_miembro=id_miembro).first()
+        except DatoInvalidoError:
+            raise
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener miembro por ID: {str(e)}")
     
+    def obtener_ids_existentes(self, ids_miembro: Iterable[int]) -> Set[int]:
+        """Devuelve cuáles de los IDs indicados corresponden a miembros existentes (una consulta)"""
+        try:
+            ids_miembro = set(ids_miembro)
+            if not ids_miembro:
+                return set()
+            return set(db.session.scalars(
+                db.select(MiembroModel.id_miembro).where(MiembroModel.id_miembro.in_(ids_miembro))
+            ))
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener miembros: {str(e)}")
+    
+    def obtener_emails_existentes(self, emails: Iterable[str]) -> Set[str]:
+        """Devuelve cuáles de los emails indicados ya están registrados (una consulta)"""
+        try:
+            emails = set(emails)
+            if not emails:
+                return set()
+            return set(db.session.scalars(
+                db.select(MiembroModel.email).where(MiembroModel.email.in_(emails))
+            ))
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al verificar emails: {str(e)}")
+    
+    def obtener_mapa_emails(self) -> Dict[str, int]:
+        """Devuelve {email: id_miembro} de todos los miembros, leyendo solo esas dos columnas"""
+        try:
+            return dict(db.session.execute(db.select(MiembroModel.email, MiembroModel.id_miembro)).all())
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener emails de miembros: {str(e)}")
+    
     def obtener_por_email(self, email: str) -> Optional[MiembroModel]:
         """Obtiene un miembro por su email"""
         try:
@@ -41,6 +131,80 @@ class MiembroRepository:
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener todos los miembros: {str(e)}")
     
+    def _filtros_api(self, rol: Optional[str] = None) -> list:
+        """Condiciones WHERE de los filtros de la API (rol)"""
+        filtros = []
+        if rol:
+            filtros.append(MiembroModel.rol == rol)
+        return filtros
+    
+    def obtener_pagina_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        rol: Optional[str] = None
+    ) -> Pagina:
+        """Página de miembros como diccionarios con solo los campos pedidos (CAMPOS_API)"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_miembro')
+            return pagina_proyectada(
+                columnas, MiembroModel.id_miembro, self._filtros_api(rol), cursor, limite
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de miembros: {str(e)}")
+    
+    def iterar_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        rol: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Recorre en streaming (yield_per) todos los miembros desde el cursor, con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_miembro')
+            return iterar_proyectadas(
+                columnas, MiembroModel.id_miembro, self._filtros_api(rol), cursor
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al recorrer miembros: {str(e)}")
+    
+    def obtener_campos(self, id_miembro: int, campos: Optional[List[str]] = None) -> Optional[Dict]:
+        """Obtiene un miembro por ID como diccionario con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_miembro')
+            fila = db.session.execute(
+                db.select(*columnas).where(MiembroModel.id_miembro == id_miembro)
+            ).first()
+            return dict(fila._mapping) if fila else None
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener miembro: {str(e)}")
+    
+    def obtener_pagina(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        rol: Optional[str] = None
+    ) -> Pagina:
+        """Obtiene una página de miembros ordenados por (apellido, id)"""
+        try:
+            query = MiembroModel.query
+            if rol:
+                query = query.filter(MiembroModel.rol == rol)
+            return paginar(
+                query, [MiembroModel.apellido, MiembroModel.id_miembro], cursor, limite
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de miembros: {str(e)}")
+    
     def obtener_por_rol(self, rol: str) -> List[MiembroModel]:
         """Obtiene miembros filtrados por rol"""
         try:
@@ -51,28 +215,38 @@ class MiembroRepository:
     def actualizar(self, miembro_model: MiembroModel) -> MiembroModel:
         """Actualiza un miembro en la BD"""
         try:
-            db.session.commit()
-            db.session.refresh(miembro_model)
+            confirmar()
             return miembro_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             if "unique constraint" in str(e).lower() and "email" in str(e).lower():
                 raise DatoInvalidoError("El email ya está registrado en el sistema")
             raise DatoInvalidoError(f"Error al actualizar miembro: {str(e)}")
     
     def eliminar(self, id_miembro: int) -> bool:
-        """Elimina un miembro de la BD"""
+        """
+        Elimina un miembro de la BD con sentencias por conjunto: desasigna sus tareas
+        (también archivadas) con un UPDATE, borra sus membresías y luego el miembro,
+        sin cargar nada en la sesión
+        """
         try:
-            miembro = self.obtener_por_id(id_miembro)
-            if not miembro:
-                return False
-            
-            db.session.delete(miembro)
-            db.session.commit()
-            return True
+            for modelo in (TareaModel, TareaArchivadaModel):
+                db.session.execute(
+                    update(modelo.__table__)
+                    .where(modelo.id_miembro_asignado == id_miembro)
+                    .values(id_miembro_asignado=None)
+                )
+            db.session.execute(
+                proyecto_miembro.delete().where(proyecto_miembro.c.id_miembro == id_miembro)
+            )
+            resultado = db.session.execute(
+                MiembroModel.__table__.delete().where(MiembroModel.id_miembro == id_miembro)
+            )
+            confirmar()
+            return resultado.rowcount > 0
             
         except Exception as e:
-            db.session.rollback()
+            revertir()
             # Si hay error de integridad referencial (miembro con tareas)
             if "foreign key constraint" in str(e).lower():
                 raise DatoInvalidoError(
@@ -86,7 +260,7 @@ class MiembroRepository:
             query = MiembroModel.query.filter_by(email=email)
             
             if excluir_id:
-                query = query.filter(MiembroModel.id != excluir_id)
+                query = query.filter(MiembroModel.id_miembro != excluir_id)
             
             return query.first() is not None
             
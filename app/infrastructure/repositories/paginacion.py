@@ -0,0 +1,134 @@
+"""
+Paginación por cursor (keyset) - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import base64
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+
+LIMITE_POR_DEFECTO = 20
+LIMITE_MAXIMO = 100
+
+_SIGUIENTE = 's'
+_ANTERIOR = 'a'
+
+
+class Pagina:
+    """Página de resultados con cursores opacos hacia la página siguiente y anterior"""
+
+    def __init__(
+        self,
+        elementos: List[Any],
+        cursor_siguiente: Optional[str] = None,
+        cursor_anterior: Optional[str] = None
+    ):
+        self.elementos = elementos
+        self.cursor_siguiente = cursor_siguiente
+        self.cursor_anterior = cursor_anterior
+
+    @property
+    def hay_siguiente(self) -> bool:
+        return self.cursor_siguiente is not None
+
+    @property
+    def hay_anterior(self) -> bool:
+        return self.cursor_anterior is not None
+
+    def transformar(self, funcion: Callable[[Any], Any]) -> 'Pagina':
+        """Devuelve una página con los mismos cursores y los elementos transformados"""
+        return Pagina(
+            [funcion(e) for e in self.elementos],
+            self.cursor_siguiente,
+            self.cursor_anterior
+        )
+
+    def __iter__(self):
+        return iter(self.elementos)
+
+    def __len__(self) -> int:
+        return len(self.elementos)
+
+    def __bool__(self) -> bool:
+        return bool(self.elementos)
+
+
+def normalizar_limite(limite: Optional[int]) -> int:
+    """Acota el tamaño de página a un valor entre 1 y LIMITE_MAXIMO"""
+    if not limite or limite <= 0:
+        return LIMITE_POR_DEFECTO
+    return min(limite, LIMITE_MAXIMO)
+
+
+def codificar_cursor(direccion: str, valores: Sequence[Any]) -> str:
+    """Codifica la dirección y la clave de orden (clave, id) en un cursor opaco"""
+    payload = json.dumps([direccion, list(valores)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor: str, cantidad_valores: int) -> Tuple[str, list]:
+    """Decodifica un cursor opaco. Lanza DatoInvalidoError si está corrupto"""
+    try:
+        relleno = '=' * (-len(cursor) % 4)
+        direccion, valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (ValueError, TypeError):
+        raise DatoInvalidoError("El cursor de paginación no es válido")
+
+    if direccion not in (_SIGUIENTE, _ANTERIOR) or not isinstance(valores, list) \
+            or len(valores) != cantidad_valores:
+        raise DatoInvalidoError("El cursor de paginación no es válido")
+    return direccion, valores
+
+
+def paginar(query, columnas_orden: Sequence, cursor: Optional[str] = None,
+            limite: Optional[int] = None,
+            clave_de: Optional[Callable[[Any], list]] = None,
+            descendente: bool = False) -> Pagina:
+    """
+    Aplica paginación keyset a una query ordenada por columnas_orden.
+
+    La última columna debe ser la clave primaria para que el orden sea total.
+    Cada página se resuelve con un WHERE (clave, id) > (:clave, :id) ... LIMIT n,
+    por lo que la página N cuesta lo mismo que la primera.
+    Con descendente todas las columnas se ordenan DESC y la comparación es <,
+    así SQLite recorre el mismo índice en sentido inverso.
+    clave_de extrae los valores de orden de una fila cuando no son atributos
+    con el mismo nombre que las columnas (p. ej. filas con columnas calculadas).
+    """
+    limite = normalizar_limite(limite)
+    direccion, valores = (
+        decodificar_cursor(cursor, len(columnas_orden)) if cursor else (_SIGUIENTE, None)
+    )
+    hacia_atras = direccion == _ANTERIOR
+    # Sentido en el que se recorre el índice para esta página
+    invertir = hacia_atras != descendente
+
+    if valores is not None:
+        clave = tuple_(*columnas_orden)
+        limite_clave = tuple_(*valores)
+        query = query.filter(clave < limite_clave if invertir else clave > limite_clave)
+
+    orden = [c.desc() if invertir else c.asc() for c in columnas_orden]
+    filas = query.order_by(*orden).limit(limite + 1).all()
+
+    hay_mas = len(filas) > limite
+    filas = filas[:limite]
+    if hacia_atras:
+        filas.reverse()
+
+    hay_siguiente = (valores is not None) if hacia_atras else hay_mas
+    hay_anterior = hay_mas if hacia_atras else (valores is not None)
+
+    def _clave_de(fila) -> list:
+        if clave_de is not None:
+            return list(clave_de(fila))
+        return [getattr(fila, c.key) for c in columnas_orden]
+
+    return Pagina(
+        filas,
+        cursor_siguiente=codificar_cursor(_SIGUIENTE, _clave_de(filas[-1])) if filas and hay_siguiente else None,
+        cursor_anterior=codificar_cursor(_ANTERIOR, _clave_de(filas[0])) if filas and hay_anterior else None
+    )
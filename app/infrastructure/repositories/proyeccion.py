@@ -0,0 +1,69 @@
+"""
+Proyecciones de columnas para la API (campos a elección, streaming) - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app import db
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.repositories.paginacion import Pagina, _SIGUIENTE, decodificar_cursor, paginar
+
+# Filas que SQLite entrega por cada fetchmany al recorrer un resultado en streaming
+TAMANO_LOTE_STREAMING = 1000
+
+
+def columnas_solicitadas(disponibles: Dict[str, object], campos: Optional[Iterable[str]], clave: str) -> List:
+    """
+    Columnas de la proyección para los campos pedidos (todos si no se indican).
+    La clave primaria se incluye siempre: ordena el recorrido y forma los cursores.
+    """
+    if not campos:
+        return list(disponibles.values())
+
+    campos = list(dict.fromkeys(campos))
+    desconocidos = [c for c in campos if c not in disponibles]
+    if desconocidos:
+        raise DatoInvalidoError(
+            f"Campos no disponibles: {', '.join(desconocidos)}. "
+            f"Válidos: {', '.join(disponibles)}"
+        )
+    if clave not in campos:
+        campos.insert(0, clave)
+    return [disponibles[c] for c in campos]
+
+
+def pagina_proyectada(columnas: List, columna_clave, filtros: List, cursor: Optional[str] = None,
+                      limite: Optional[int] = None) -> Pagina:
+    """Página keyset (por clave primaria) de filas proyectadas, como diccionarios"""
+    query = db.session.query(*columnas).filter(*filtros)
+    return paginar(query, [columna_clave], cursor, limite).transformar(lambda fila: dict(fila._mapping))
+
+
+def iterar_proyectadas(columnas: List, columna_clave, filtros: List, cursor: Optional[str] = None,
+                       tamano_lote: int = TAMANO_LOTE_STREAMING) -> Iterator[Dict]:
+    """
+    Recorre todas las filas desde el cursor (por clave primaria ascendente) sin materializarlas:
+    el resultado se consume de a tamano_lote filas, así la memoria no depende del total.
+    El cursor se valida aquí, antes de empezar a iterar (y de enviar la respuesta).
+    """
+    consulta = db.select(*columnas).where(*filtros)
+    if cursor:
+        direccion, (ultima_clave,) = decodificar_cursor(cursor, 1)
+        if direccion != _SIGUIENTE:
+            raise DatoInvalidoError("El streaming solo admite cursores hacia adelante")
+        consulta = consulta.where(columna_clave > ultima_clave)
+    consulta = consulta.order_by(columna_clave).execution_options(yield_per=tamano_lote)
+    return _recorrer(consulta)
+
+
+def _recorrer(consulta) -> Iterator[Dict]:
+    # Solo columnas: se ejecuta en la conexión de la sesión, sin la capa de carga del ORM
+    for fila in db.session.connection().execute(consulta).mappings():
+        yield dict(fila)
+
+
+def recorrer_consulta(consulta, tamano_lote: int = TAMANO_LOTE_STREAMING) -> Iterator[tuple]:
+    """Filas (tuplas) de un SELECT de columnas, leídas de a tamano_lote sin materializar el resultado"""
+    resultado = db.session.connection().execute(consulta.execution_options(yield_per=tamano_lote))
+    for fila in resultado:
+        yield tuple(fila)
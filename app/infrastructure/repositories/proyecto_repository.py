@@ -1,30 +1,75 @@
-from typing import List, Optional
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import String, exists, func, literal_column, type_coerce
+from sqlalchemy.orm import joinedload, selectinload
 from app import db
-from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.models.proyecto_model import ProyectoModel, proyecto_miembro
 from app.infrastructure.models.miembro_model import MiembroModel
+from app.infrastructure.models.tarea_model import CODIGO_COMPLETADA, TareaModel
+from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
+from app.infrastructure.models.proyecto_estadistica_model import ProyectoEstadisticaModel
+from app.infrastructure.repositories.paginacion import Pagina, paginar
+from app.infrastructure.repositories.proyeccion import (
+    columnas_solicitadas,
+    iterar_proyectadas,
+    pagina_proyectada,
+    recorrer_consulta
+)
+from app.infrastructure.repositories.unidad_de_trabajo import confirmar, revertir
 from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
 
 class ProyectoRepository:
     """Repositorio para acceso a datos de Proyecto con Flask-SQLAlchemy"""
     
+    # Perfiles de carga: relaciones que se traen junto al proyecto en un número fijo de consultas
+    PERFILES_CARGA = {
+        'proyecto_con_miembros': lambda: [selectinload(ProyectoModel.miembros)],
+        'proyecto_completo': lambda: [
+            selectinload(ProyectoModel.miembros),
+            selectinload(ProyectoModel.tareas).joinedload(TareaModel.asignado_a),
+        ],
+    }
+    
+    # Campos que la API puede devolver (?fields=...), en el orden de salida
+    CAMPOS_API = {
+        'id_proyecto': ProyectoModel.id_proyecto,
+        'nombre': ProyectoModel.nombre,
+        'descripcion': ProyectoModel.descripcion,
+        'fecha_inicio': ProyectoModel.fecha_inicio,
+        'fecha_fin': ProyectoModel.fecha_fin,
+        'estado': ProyectoModel.estado,
+        'updated_at': ProyectoModel.updated_at,
+    }
+    
     def __init__(self):
         pass
     
+    def _opciones_perfil(self, perfil: Optional[str]) -> list:
+        """Devuelve las opciones de carga del perfil indicado"""
+        if perfil is None:
+            return []
+        if perfil not in self.PERFILES_CARGA:
+            raise DatoInvalidoError(f"Perfil de carga '{perfil}' no existe")
+        return self.PERFILES_CARGA[perfil]()
+    
     def crear(self, proyecto_model: ProyectoModel) -> ProyectoModel:
         """Crea un nuevo proyecto en la BD"""
         try:
             db.session.add(proyecto_model)
-            db.session.commit()
-            db.session.refresh(proyecto_model)
+            confirmar()
             return proyecto_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al crear proyecto: {str(e)}")
     
-    def obtener_por_id(self, id_proyecto: int) -> Optional[ProyectoModel]:
-        """Obtiene un proyecto por su ID"""
+    def obtener_por_id(self, id_proyecto: int, perfil: Optional[str] = None) -> Optional[ProyectoModel]:
+        """Obtiene un proyecto por su ID, opcionalmente con un perfil de carga"""
         try:
-            return ProyectoModel.query.filter_by(id_proyecto=id_proyecto).first()
+            return ProyectoModel.query.options(
+                *self._opciones_perfil(perfil)
+            ).filter_by(id_proyecto=id_proyecto).first()
+        except DatoInvalidoError:
+            raise
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener proyecto por ID: {str(e)}")
     
@@ -35,6 +80,170 @@ class ProyectoRepository:
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener todos los proyectos: {str(e)}")
     
+    def _filtros_api(self, estado: Optional[str] = None) -> list:
+        """Condiciones WHERE de los filtros de la API (estado)"""
+        filtros = []
+        if estado:
+            filtros.append(ProyectoModel.estado == estado)
+        return filtros
+    
+    def obtener_pagina_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Pagina:
+        """Página de proyectos como diccionarios con solo los campos pedidos (CAMPOS_API)"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_proyecto')
+            return pagina_proyectada(
+                columnas, ProyectoModel.id_proyecto, self._filtros_api(estado), cursor, limite
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de proyectos: {str(e)}")
+    
+    def iterar_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        estado: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Recorre en streaming (yield_per) todos los proyectos desde el cursor, con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_proyecto')
+            return iterar_proyectadas(
+                columnas, ProyectoModel.id_proyecto, self._filtros_api(estado), cursor
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al recorrer proyectos: {str(e)}")
+    
+    def obtener_campos(self, id_proyecto: int, campos: Optional[List[str]] = None) -> Optional[Dict]:
+        """Obtiene un proyecto por ID como diccionario con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_proyecto')
+            fila = db.session.execute(
+                db.select(*columnas).where(ProyectoModel.id_proyecto == id_proyecto)
+            ).first()
+            return dict(fila._mapping) if fila else None
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener proyecto: {str(e)}")
+    
+    @staticmethod
+    def _columnas_reporte() -> list:
+        """Columnas del reporte: el proyecto, sus contadores de tareas por estado y su cantidad de miembros"""
+        contadores = [
+            func.coalesce(getattr(ProyectoEstadisticaModel, estado), 0).label(estado)
+            for estado in ProyectoEstadisticaModel.ESTADOS
+        ]
+        cantidad_miembros = db.select(func.count()).select_from(proyecto_miembro).where(
+            proyecto_miembro.c.id_proyecto == ProyectoModel.id_proyecto
+        ).scalar_subquery()
+        return [
+            ProyectoModel.id_proyecto,
+            ProyectoModel.nombre,
+            ProyectoModel.estado,
+            type_coerce(ProyectoModel.fecha_inicio, String).label('fecha_inicio'),
+            type_coerce(ProyectoModel.fecha_fin, String).label('fecha_fin'),
+            cantidad_miembros.label('miembros'),
+            sum(contadores[1:], contadores[0]).label('tareas'),
+            *contadores,
+        ]
+    
+    def encabezado_reporte(self) -> List[str]:
+        """Nombres de columna de iterar_reporte, en orden"""
+        return [columna.name for columna in self._columnas_reporte()]
+    
+    def iterar_reporte(self) -> Iterator[tuple]:
+        """Recorre el reporte de todos los proyectos por id, leyendo el resultado en lotes"""
+        try:
+            consulta = db.select(*self._columnas_reporte()).outerjoin(
+                ProyectoEstadisticaModel,
+                ProyectoEstadisticaModel.id_proyecto == ProyectoModel.id_proyecto
+            ).order_by(ProyectoModel.id_proyecto)
+            return recorrer_consulta(consulta)
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al exportar proyectos: {str(e)}")
+    
+    def obtener_progreso(self, ids_proyecto: Iterable[int]) -> Dict[int, Dict[str, int]]:
+        """
+        Contadores de avance de varios proyectos: total, completadas, bloqueadas,
+        vencidas (abiertas con vencimiento pasado) y miembros.
+        total, completadas y bloqueadas se leen de proyecto_estadisticas (ya incluyen las
+        tareas archivadas); solo vencidas se cuenta, sobre el índice parcial ix_tareas_vencimiento_abiertas.
+        """
+        try:
+            ids_proyecto = set(ids_proyecto)
+            if not ids_proyecto:
+                return {}
+            contadores = [
+                func.coalesce(getattr(ProyectoEstadisticaModel, estado), 0)
+                for estado in ProyectoEstadisticaModel.ESTADOS
+            ]
+            por_estado = dict(zip(ProyectoEstadisticaModel.ESTADOS, contadores))
+            cantidad_miembros = db.select(func.count()).select_from(proyecto_miembro).where(
+                proyecto_miembro.c.id_proyecto == ProyectoModel.id_proyecto
+            ).scalar_subquery()
+            consulta = db.select(
+                ProyectoModel.id_proyecto,
+                sum(contadores[1:], contadores[0]).label('total'),
+                por_estado['completada'].label('completadas'),
+                por_estado['bloqueada'].label('bloqueadas'),
+                cantidad_miembros.label('miembros'),
+            ).outerjoin(
+                ProyectoEstadisticaModel,
+                ProyectoEstadisticaModel.id_proyecto == ProyectoModel.id_proyecto
+            ).where(ProyectoModel.id_proyecto.in_(ids_proyecto))
+            
+            # El literal (no un parámetro) en estado != habilita el índice parcial. Con id_proyecto + 0
+            # SQLite no puede usar ix_tareas_proyecto_estado, que recorrería todas las tareas de cada
+            # proyecto: lee solo las vencidas del índice parcial y agrupa esas pocas filas
+            proyecto = TareaModel.id_proyecto + 0
+            vencidas = dict(db.session.execute(
+                db.select(proyecto, func.count()).where(
+                    TareaModel.fecha_vencimiento < date.today(),
+                    TareaModel.estado != literal_column(str(CODIGO_COMPLETADA)),
+                    proyecto.in_(ids_proyecto)
+                ).group_by(proyecto)
+            ).all())
+            return {
+                fila.id_proyecto: {
+                    'total': fila.total,
+                    'completadas': fila.completadas,
+                    'bloqueadas': fila.bloqueadas,
+                    'vencidas': vencidas.get(fila.id_proyecto, 0),
+                    'miembros': fila.miembros,
+                }
+                for fila in db.session.execute(consulta)
+            }
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener progreso de proyectos: {str(e)}")
+    
+    def obtener_pagina(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Pagina:
+        """Obtiene una página de proyectos ordenados por (nombre, id)"""
+        try:
+            query = ProyectoModel.query
+            if estado:
+                query = query.filter(ProyectoModel.estado == estado)
+            return paginar(
+                query, [ProyectoModel.nombre, ProyectoModel.id_proyecto], cursor, limite
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de proyectos: {str(e)}")
+    
     def obtener_por_estado(self, estado: str) -> List[ProyectoModel]:
         """Obtiene proyectos filtrados por estado"""
         try:
@@ -45,76 +254,207 @@ class ProyectoRepository:
     def actualizar(self, proyecto_model: ProyectoModel) -> ProyectoModel:
         """Actualiza un proyecto en la BD"""
         try:
-            db.session.commit()
-            db.session.refresh(proyecto_model)
+            confirmar()
             return proyecto_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al actualizar proyecto: {str(e)}")
     
+    def eliminar_tareas(self, id_proyecto: int, limite: int) -> int:
+        """
+        Borra hasta `limite` tareas del proyecto con un DELETE por conjunto (sin cargarlas),
+        primero de `tareas` y luego de `tareas_archivadas`.
+        Devuelve cuántas borró; para proyectos grandes se llama en bloques hasta que devuelva menos que limite.
+        """
+        try:
+            borradas = 0
+            for modelo in (TareaModel, TareaArchivadaModel):
+                if borradas >= limite:
+                    break
+                bloque = db.select(modelo.id_tarea).where(
+                    modelo.id_proyecto == id_proyecto
+                ).limit(limite - borradas).scalar_subquery()
+                borradas += db.session.execute(
+                    modelo.__table__.delete().where(modelo.id_tarea.in_(bloque))
+                ).rowcount
+            confirmar()
+            return borradas
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al eliminar tareas del proyecto: {str(e)}")
+    
     def eliminar(self, id_proyecto: int) -> bool:
-        """Elimina un proyecto de la BD"""
+        """
+        Elimina un proyecto de la BD con DELETE por conjunto: sus tareas restantes
+        (también archivadas), sus membresías y el proyecto, sin cargar nada en la sesión
+        """
         try:
-            proyecto = self.obtener_por_id(id_proyecto)
-            if not proyecto:
-                return False
-            
-            db.session.delete(proyecto)
-            db.session.commit()
-            return True
+            for modelo in (TareaModel, TareaArchivadaModel):
+                db.session.execute(
+                    modelo.__table__.delete().where(modelo.id_proyecto == id_proyecto)
+                )
+            db.session.execute(
+                proyecto_miembro.delete().where(proyecto_miembro.c.id_proyecto == id_proyecto)
+            )
+            resultado = db.session.execute(
+                ProyectoModel.__table__.delete().where(ProyectoModel.id_proyecto == id_proyecto)
+            )
+            confirmar()
+            return resultado.rowcount > 0
             
         except Exception as e:
-            db.session.rollback()
+            revertir()
             if "foreign key constraint" in str(e).lower():
                 raise DatoInvalidoError(
                     "No se puede eliminar el proyecto porque tiene tareas asociadas"
                 )
             raise DatoInvalidoError(f"Error al eliminar proyecto: {str(e)}")
     
+    def es_miembro(self, id_proyecto: int, id_miembro: int) -> bool:
+        """Verifica si un miembro pertenece a un proyecto (EXISTS sobre la PK de proyecto_miembro)"""
+        try:
+            return db.session.query(
+                exists().where(
+                    proyecto_miembro.c.id_proyecto == id_proyecto,
+                    proyecto_miembro.c.id_miembro == id_miembro
+                )
+            ).scalar()
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al verificar membresía del proyecto: {str(e)}")
+    
+    def obtener_ids_existentes(self, ids_proyecto: Iterable[int]) -> Set[int]:
+        """Devuelve cuáles de los IDs indicados corresponden a proyectos existentes (una consulta)"""
+        try:
+            ids_proyecto = set(ids_proyecto)
+            if not ids_proyecto:
+                return set()
+            return set(db.session.scalars(
+                db.select(ProyectoModel.id_proyecto).where(ProyectoModel.id_proyecto.in_(ids_proyecto))
+            ))
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener proyectos: {str(e)}")
+    
+    def obtener_mapa_nombres(self) -> Dict[str, Optional[int]]:
+        """
+        Devuelve {nombre: id_proyecto} de todos los proyectos, leyendo solo esas dos columnas.
+        Los nombres repetidos quedan con None: no identifican a un único proyecto.
+        """
+        try:
+            mapa = {}
+            for nombre, id_proyecto in db.session.execute(db.select(ProyectoModel.nombre, ProyectoModel.id_proyecto)):
+                mapa[nombre] = None if nombre in mapa else id_proyecto
+            return mapa
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener nombres de proyectos: {str(e)}")
+    
+    def obtener_membresias(self, ids_proyecto: Iterable[int]) -> Set[Tuple[int, int]]:
+        """Devuelve los pares (id_proyecto, id_miembro) de los proyectos indicados (una consulta)"""
+        try:
+            ids_proyecto = set(ids_proyecto)
+            if not ids_proyecto:
+                return set()
+            filas = db.session.execute(
+                db.select(proyecto_miembro.c.id_proyecto, proyecto_miembro.c.id_miembro)
+                .where(proyecto_miembro.c.id_proyecto.in_(ids_proyecto))
+            )
+            return {(fila.id_proyecto, fila.id_miembro) for fila in filas}
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener membresías: {str(e)}")
+    
     def agregar_miembro(self, id_proyecto: int, id_miembro: int) -> bool:
         """Agrega un miembro a un proyecto"""
         try:
-            proyecto = self.obtener_por_id(id_proyecto)
-            if not proyecto:
-                return False
+            if self.es_miembro(id_proyecto, id_miembro):
+                return True
             
-            miembro = MiembroModel.query.filter_by(id=id_miembro).first()
-            if not miembro:
+            if not db.session.get(ProyectoModel, id_proyecto) or not db.session.get(MiembroModel, id_miembro):
                 return False
             
-            if miembro not in proyecto.miembros:
-                proyecto.miembros.append(miembro)
-                db.session.commit()
-            
+            db.session.execute(
+                proyecto_miembro.insert().values(id_proyecto=id_proyecto, id_miembro=id_miembro)
+            )
+            confirmar()
             return True
             
+        except DatoInvalidoError:
+            raise
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al agregar miembro al proyecto: {str(e)}")
     
-    def remover_miembro(self, id_proyecto: int, id_miembro: int) -> bool:
-        """Remueve un miembro de un proyecto"""
+    @staticmethod
+    def _miembros_faltantes(id_proyecto: int, ids_miembro: Set[int]):
+        """SELECT (id_proyecto, id_miembro) de los miembros indicados que existen y aún no están en el proyecto"""
+        ya_es_miembro = exists().where(
+            proyecto_miembro.c.id_proyecto == id_proyecto,
+            proyecto_miembro.c.id_miembro == MiembroModel.id_miembro
+        )
+        return db.select(
+            literal_column(str(int(id_proyecto))).label('id_proyecto'), MiembroModel.id_miembro
+        ).where(MiembroModel.id_miembro.in_(ids_miembro), ~ya_es_miembro)
+    
+    def contar_miembros_faltantes(self, id_proyecto: int, ids_miembro: Iterable[int]) -> int:
+        """Cuántos de los miembros indicados se agregarían al sincronizar (una consulta)"""
         try:
-            proyecto = self.obtener_por_id(id_proyecto)
-            if not proyecto:
-                return False
+            ids_miembro = set(ids_miembro)
+            if not ids_miembro:
+                return 0
+            faltantes = self._miembros_faltantes(id_proyecto, ids_miembro).subquery()
+            return db.session.scalar(db.select(func.count()).select_from(faltantes))
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al comparar miembros del proyecto: {str(e)}")
+    
+    def sincronizar_miembros(self, id_proyecto: int, ids_miembro: Iterable[int]) -> Tuple[int, int]:
+        """
+        Deja como miembros del proyecto exactamente ids_miembro con dos sentencias:
+        un DELETE de los que sobran y un INSERT ... SELECT de los que faltan
+        (el SELECT sobre miembros descarta los IDs inexistentes).
+        Devuelve (agregados, removidos).
+        """
+        try:
+            ids_miembro = set(ids_miembro)
+            removidos = db.session.execute(
+                proyecto_miembro.delete().where(
+                    proyecto_miembro.c.id_proyecto == id_proyecto,
+                    proyecto_miembro.c.id_miembro.not_in(ids_miembro)
+                )
+            ).rowcount
             
-            miembro = MiembroModel.query.filter_by(id=id_miembro).first()
-            if miembro and miembro in proyecto.miembros:
-                proyecto.miembros.remove(miembro)
-                db.session.commit()
-                return True
+            agregados = 0
+            if ids_miembro:
+                agregados = db.session.execute(
+                    proyecto_miembro.insert().from_select(
+                        ['id_proyecto', 'id_miembro'], self._miembros_faltantes(id_proyecto, ids_miembro)
+                    )
+                ).rowcount
             
-            return False
+            confirmar()
+            return agregados, removidos
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al sincronizar miembros del proyecto: {str(e)}")
+    
+    def remover_miembro(self, id_proyecto: int, id_miembro: int) -> bool:
+        """Remueve un miembro de un proyecto"""
+        try:
+            # El DELETE por clave primaria es en sí la verificación de membresía
+            resultado = db.session.execute(
+                proyecto_miembro.delete().where(
+                    proyecto_miembro.c.id_proyecto == id_proyecto,
+                    proyecto_miembro.c.id_miembro == id_miembro
+                )
+            )
+            confirmar()
+            return resultado.rowcount > 0
             
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al remover miembro del proyecto: {str(e)}")
     
     def obtener_miembros(self, id_proyecto: int) -> List[MiembroModel]:
         """Obtiene todos los miembros de un proyecto"""
         try:
-            proyecto = self.obtener_por_id(id_proyecto)
+            proyecto = self.obtener_por_id(id_proyecto, perfil='proyecto_con_miembros')
             return proyecto.miembros if proyecto else []
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener miembros del proyecto: {str(e)}")
\ No newline at end of file
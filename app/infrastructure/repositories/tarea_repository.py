@@ -1,31 +1,179 @@
 # app/infrastructure/repositories/tarea_repository.py
-from typing import List, Optional, Dict
+from typing import Iterable, Iterator, List, Optional, Dict
 from datetime import date
+from sqlalchemy import (
+    DateTime, String, column, func, insert, literal, literal_column, table, type_coerce,
+    union_all, update
+)
+from sqlalchemy.orm import joinedload
 from app import db
-from app.infrastructure.models.tarea_model import TareaModel
+from app.domain.entities.catalogo import PRIORIDADES_TAREA
+from app.infrastructure.models.tarea_model import CODIGO_COMPLETADA, SIN_VENCIMIENTO, VENCIMIENTO_ORDENABLE, TareaModel
+from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
+from app.infrastructure.models.marca_tabla_model import ahora_utc
+from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.models.miembro_model import MiembroModel
+from app.domain.consultas.tarea_filtro import TareaFiltro
+from app.infrastructure.queries.busqueda_texto import (
+    TABLA_FTS,
+    PESO_TITULO,
+    PESO_DESCRIPCION,
+    expresion_match
+)
+from app.infrastructure.repositories.paginacion import Pagina, paginar
+from app.infrastructure.repositories.proyeccion import (
+    columnas_solicitadas,
+    iterar_proyectadas,
+    pagina_proyectada,
+    recorrer_consulta
+)
+from app.infrastructure.repositories.unidad_de_trabajo import confirmar, revertir
 from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
 
+
+def _columnas_entidad(modelo) -> tuple:
+    """Columnas de la entidad Tarea en `tareas` o en `tareas_archivadas` (mismos nombres y orden)"""
+    return (
+        modelo.id_tarea,
+        modelo.titulo,
+        modelo.descripcion,
+        modelo.id_proyecto,
+        modelo.id_miembro_asignado,
+        modelo.prioridad,
+        modelo.estado,
+        type_coerce(modelo.fecha_creacion, String).label('fecha_creacion'),
+        type_coerce(modelo.fecha_vencimiento, String).label('fecha_vencimiento'),
+    )
+
+
+def _columnas_vista(modelo) -> tuple:
+    return _columnas_entidad(modelo) + (
+        ProyectoModel.nombre.label('nombre_proyecto'),
+        (MiembroModel.nombre + ' ' + MiembroModel.apellido).label('nombre_miembro'),
+    )
+
+
 class TareaRepository:
     """Repositorio para acceso a datos de Tarea con Flask-SQLAlchemy"""
     
+    # Perfiles de carga: relaciones que se traen junto a la tarea en un número fijo de consultas
+    PERFILES_CARGA = {
+        'tarea_completa': lambda: [
+            joinedload(TareaModel.proyecto),
+            joinedload(TareaModel.asignado_a),
+        ],
+    }
+    
+    # Proyección de solo lectura: las columnas de la entidad Tarea, sin hidratar TareaModel.
+    # Las fechas se leen como el texto ISO que guarda SQLite, que es lo que espera la entidad.
+    COLUMNAS_ENTIDAD = _columnas_entidad(TareaModel)
+    
+    # Modelo de lectura de los listados: la entidad más los nombres de proyecto y responsable.
+    # Se lee con un JOIN, así que un proyecto o miembro renombrado se ve al instante.
+    COLUMNAS_VISTA = _columnas_vista(TareaModel)
+    
+    # Campos que la API puede devolver (?fields=...), en el orden de salida
+    CAMPOS_API = {
+        'id_tarea': TareaModel.id_tarea,
+        'titulo': TareaModel.titulo,
+        'descripcion': TareaModel.descripcion,
+        'id_proyecto': TareaModel.id_proyecto,
+        'id_miembro_asignado': TareaModel.id_miembro_asignado,
+        'prioridad': TareaModel.prioridad,
+        'estado': TareaModel.estado,
+        'fecha_creacion': TareaModel.fecha_creacion,
+        'fecha_vencimiento': TareaModel.fecha_vencimiento,
+        'updated_at': TareaModel.updated_at,
+    }
+    
     def __init__(self):
         pass
     
+    def _opciones_perfil(self, perfil: Optional[str]) -> list:
+        """Devuelve las opciones de carga del perfil indicado"""
+        if perfil is None:
+            return []
+        if perfil not in self.PERFILES_CARGA:
+            raise DatoInvalidoError(f"Perfil de carga '{perfil}' no existe")
+        return self.PERFILES_CARGA[perfil]()
+    
     def crear(self, tarea_model: TareaModel) -> TareaModel:
         """Crea una nueva tarea en la BD"""
         try:
             db.session.add(tarea_model)
-            db.session.commit()
-            db.session.refresh(tarea_model)
+            confirmar()
             return tarea_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al crear tarea: {str(e)}")
     
-    def obtener_por_id(self, id_tarea: int) -> Optional[TareaModel]:
-        """Obtiene una tarea por su ID"""
+    def crear_en_lote(self, filas: List[Dict]) -> List[int]:
+        """
+        Inserta muchas tareas con un único INSERT ejecutado en lote (executemany).
+        Devuelve los IDs generados en el mismo orden que las filas.
+        """
+        try:
+            if not filas:
+                return []
+            # sort_by_parameter_order garantiza los IDs en el orden de las filas. SQLite no
+            # tiene una columna centinela determinista, así que SQLAlchemy ejecuta un
+            # INSERT ... RETURNING por fila, todos en la misma transacción
+            ids = db.session.scalars(
+                insert(TareaModel).returning(
+                    TareaModel.id_tarea, sort_by_parameter_order=True
+                ),
+                filas
+            ).all()
+            confirmar()
+            return list(ids)
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al crear tareas en lote: {str(e)}")
+    
+    def actualizar_en_lote(self, filas: List[Dict]) -> int:
+        """
+        Actualiza muchas tareas por clave primaria con un UPDATE en lote (executemany).
+        Cada fila debe incluir id_tarea y las columnas a modificar.
+        """
         try:
-            return TareaModel.query.filter_by(id_tarea=id_tarea).first()  
+            if not filas:
+                return 0
+            db.session.execute(update(TareaModel), filas)
+            confirmar()
+            return len(filas)
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al actualizar tareas en lote: {str(e)}")
+    
+    def obtener_por_ids(self, ids_tarea: List[int]) -> List[TareaModel]:
+        """Obtiene varias tareas por ID en una sola consulta"""
+        try:
+            if not ids_tarea:
+                return []
+            return TareaModel.query.filter(TareaModel.id_tarea.in_(set(ids_tarea))).all()
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener tareas: {str(e)}")
+    
+    def obtener_por_id(
+        self,
+        id_tarea: int,
+        perfil: Optional[str] = None,
+        incluir_archivadas: bool = False
+    ) -> Optional[TareaModel]:
+        """
+        Obtiene una tarea por su ID, opcionalmente con un perfil de carga.
+        Con incluir_archivadas, si no está en `tareas` se busca en `tareas_archivadas`
+        (devuelve un TareaArchivadaModel, de solo lectura).
+        """
+        try:
+            tarea = TareaModel.query.options(
+                *self._opciones_perfil(perfil)
+            ).filter_by(id_tarea=id_tarea).first()
+            if tarea is None and incluir_archivadas:
+                tarea = db.session.get(TareaArchivadaModel, id_tarea)
+            return tarea
+        except DatoInvalidoError:
+            raise
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener tarea por ID: {str(e)}")
     
@@ -36,6 +184,337 @@ class TareaRepository:
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener todas las tareas: {str(e)}")
     
+    def _consulta_proyectada(
+        self,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None
+    ):
+        """Query sobre COLUMNAS_ENTIDAD con los filtros habituales de listado"""
+        query = db.session.query(*self.COLUMNAS_ENTIDAD)
+        if id_proyecto is not None:
+            query = query.filter(TareaModel.id_proyecto == id_proyecto)
+        if id_miembro is not None:
+            query = query.filter(TareaModel.id_miembro_asignado == id_miembro)
+        if estado:
+            query = query.filter(TareaModel.estado == estado)
+        return query
+    
+    def obtener_filas(
+        self,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> list:
+        """
+        Obtiene tareas como filas de solo lectura (sin objetos ORM ni identity map),
+        con filtros opcionales. Cada fila se convierte con TareaModel.entity_desde_fila.
+        """
+        try:
+            return self._consulta_proyectada(id_proyecto, id_miembro, estado).all()
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener tareas: {str(e)}")
+    
+    def obtener_pagina_filas(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Pagina:
+        """Como obtener_pagina, pero con filas de solo lectura en lugar de TareaModel"""
+        try:
+            query = self._consulta_proyectada(id_proyecto, id_miembro, estado)
+            return paginar(query, [TareaModel.id_tarea], cursor, limite)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de tareas: {str(e)}")
+    
+    def _filtros_api(self, id_proyecto: Optional[int] = None, id_miembro: Optional[int] = None, estado: Optional[str] = None, prioridad: Optional[str] = None) -> list:
+        """Condiciones WHERE de los filtros de la API (proyecto, miembro, estado, prioridad)"""
+        filtros = []
+        if id_proyecto is not None:
+            filtros.append(TareaModel.id_proyecto == id_proyecto)
+        if id_miembro is not None:
+            filtros.append(TareaModel.id_miembro_asignado == id_miembro)
+        if estado:
+            filtros.append(TareaModel.estado == estado)
+        if prioridad:
+            filtros.append(TareaModel.prioridad == prioridad)
+        return filtros
+    
+    def obtener_pagina_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None,
+        prioridad: Optional[str] = None
+    ) -> Pagina:
+        """Página de tareas como diccionarios con solo los campos pedidos (CAMPOS_API)"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_tarea')
+            return pagina_proyectada(
+                columnas, TareaModel.id_tarea, self._filtros_api(id_proyecto, id_miembro, estado, prioridad), cursor, limite
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de tareas: {str(e)}")
+    
+    def iterar_campos(
+        self,
+        campos: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None,
+        prioridad: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Recorre en streaming (yield_per) todos los tareas desde el cursor, con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_tarea')
+            return iterar_proyectadas(
+                columnas, TareaModel.id_tarea, self._filtros_api(id_proyecto, id_miembro, estado, prioridad), cursor
+            )
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al recorrer tareas: {str(e)}")
+    
+    def obtener_campos(self, id_tarea: int, campos: Optional[List[str]] = None) -> Optional[Dict]:
+        """Obtiene una tarea por ID como diccionario con los campos pedidos"""
+        try:
+            columnas = columnas_solicitadas(self.CAMPOS_API, campos, 'id_tarea')
+            fila = db.session.execute(
+                db.select(*columnas).where(TareaModel.id_tarea == id_tarea)
+            ).first()
+            return dict(fila._mapping) if fila else None
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener tarea: {str(e)}")
+    
+    @staticmethod
+    def _columnas_exportacion() -> list:
+        """Columnas de la exportación: la tarea con los nombres de su proyecto y de su miembro"""
+        return [
+            TareaModel.id_tarea,
+            TareaModel.titulo,
+            TareaModel.descripcion,
+            TareaModel.estado,
+            TareaModel.prioridad,
+            type_coerce(TareaModel.fecha_creacion, String).label('fecha_creacion'),
+            type_coerce(TareaModel.fecha_vencimiento, String).label('fecha_vencimiento'),
+            TareaModel.id_proyecto,
+            ProyectoModel.nombre.label('proyecto'),
+            TareaModel.id_miembro_asignado,
+            (MiembroModel.nombre + ' ' + MiembroModel.apellido).label('miembro_asignado'),
+        ]
+    
+    def encabezado_exportacion(self) -> List[str]:
+        """Nombres de columna de iterar_exportacion, en orden"""
+        return [columna.name for columna in self._columnas_exportacion()]
+    
+    def iterar_exportacion(self, id_proyecto: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Recorre todas las tareas (o las de un proyecto) unidas a proyectos y miembros,
+        por id, leyendo el resultado en lotes (yield_per) sin materializarlo
+        """
+        try:
+            consulta = db.select(*self._columnas_exportacion()).join(
+                ProyectoModel, ProyectoModel.id_proyecto == TareaModel.id_proyecto
+            ).outerjoin(
+                MiembroModel, MiembroModel.id_miembro == TareaModel.id_miembro_asignado
+            ).order_by(TareaModel.id_tarea)
+            if id_proyecto is not None:
+                consulta = consulta.where(TareaModel.id_proyecto == id_proyecto)
+            return recorrer_consulta(consulta)
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al exportar tareas: {str(e)}")
+    
+    def _condiciones_filtro(self, filtro: TareaFiltro, modelo=TareaModel) -> list:
+        """Traduce el filtro a condiciones WHERE sobre columnas indexadas (de `tareas` o del archivo)"""
+        condiciones = []
+        if filtro.id_proyecto is not None:
+            condiciones.append(modelo.id_proyecto == filtro.id_proyecto)
+        if filtro.id_miembro is not None:
+            condiciones.append(modelo.id_miembro_asignado == filtro.id_miembro)
+        elif filtro.sin_asignar:
+            condiciones.append(modelo.id_miembro_asignado.is_(None))
+        if filtro.estados:
+            condiciones.append(modelo.estado.in_(filtro.estados))
+        if filtro.prioridades:
+            condiciones.append(modelo.prioridad.in_(filtro.prioridades))
+        if filtro.vence_desde or filtro.vence_hasta:
+            if filtro.vence_desde:
+                condiciones.append(modelo.fecha_vencimiento >= date.fromisoformat(filtro.vence_desde))
+            if filtro.vence_hasta:
+                condiciones.append(modelo.fecha_vencimiento <= date.fromisoformat(filtro.vence_hasta))
+            if filtro.excluye_completadas:
+                # Redundante con el IN de estados, pero como literal habilita el índice
+                # parcial ix_tareas_vencimiento_abiertas para el rango de fechas
+                condiciones.append(modelo.estado != literal_column(str(CODIGO_COMPLETADA)))
+        return condiciones
+    
+    def _orden_filtro(self, orden: str, fuente=TareaModel):
+        """
+        Columnas de orden (la última es la PK), la función que calcula esa misma
+        clave desde una fila, para los cursores de paginar, y si el orden es descendente.
+        Los órdenes inversos no niegan la clave: paginar recorre el mismo índice hacia atrás.
+        fuente es TareaModel o las columnas (.c) de la unión con el archivo.
+        """
+        c = fuente
+        descendente = orden.startswith('-')
+        vencimiento = VENCIMIENTO_ORDENABLE if c is TareaModel else func.coalesce(
+            c.fecha_vencimiento, literal_column(f"'{SIN_VENCIMIENTO}'")
+        )
+        if orden in ('vencimiento', '-vencimiento'):
+            # Recorre ix_tareas_vencimiento (las tareas sin vencimiento quedan al final en
+            # orden ascendente y al principio en descendente)
+            columnas = [vencimiento, c.id_tarea]
+            clave = lambda f: (self._clave_vencimiento(f), f.id_tarea)
+        elif orden in ('prioridad', '-prioridad'):
+            # El código de prioridad ya es el orden de urgencia: recorre ix_tareas_prioridad_vencimiento
+            columnas = [c.prioridad, vencimiento, c.id_tarea]
+            clave = lambda f: (PRIORIDADES_TAREA.codigo(f.prioridad), self._clave_vencimiento(f), f.id_tarea)
+        else:
+            return [c.id_tarea], None, False
+        return columnas, clave, descendente
+    
+    @staticmethod
+    def _clave_vencimiento(fila) -> str:
+        """Valor de VENCIMIENTO_ORDENABLE para una fila leída (la fecha ya viene como texto ISO)"""
+        return fila.fecha_vencimiento or SIN_VENCIMIENTO
+    
+    @staticmethod
+    def _con_nombres(query, modelo=TareaModel):
+        """Agrega a una query sobre tareas los JOIN que necesitan las columnas de nombre de COLUMNAS_VISTA"""
+        return query.join(
+            ProyectoModel, ProyectoModel.id_proyecto == modelo.id_proyecto
+        ).outerjoin(
+            MiembroModel, MiembroModel.id_miembro == modelo.id_miembro_asignado
+        )
+    
+    def _union_con_archivadas(self, filtro: TareaFiltro, con_nombres: bool):
+        """
+        Subconsulta UNION ALL de `tareas` y `tareas_archivadas` con el filtro aplicado en
+        cada rama (cada una usa sus índices); el orden y el cursor se aplican sobre la unión
+        """
+        ramas = []
+        for modelo in (TareaModel, TareaArchivadaModel):
+            if con_nombres:
+                rama = self._con_nombres(db.select(*_columnas_vista(modelo)), modelo)
+            else:
+                rama = db.select(*_columnas_entidad(modelo))
+            ramas.append(rama.where(*self._condiciones_filtro(filtro, modelo)))
+        return union_all(*ramas).subquery('tareas_con_archivadas')
+    
+    def obtener_pagina_filtrada(
+        self,
+        filtro: TareaFiltro,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        con_nombres: bool = False
+    ) -> Pagina:
+        """
+        Página de tareas (filas de COLUMNAS_ENTIDAD, o de COLUMNAS_VISTA con con_nombres)
+        que cumplen el filtro, en el orden pedido.
+        Filtros, orden, nombres y LIMIT se resuelven en una sola consulta SQL;
+        con filtro.incluir_archivadas, sobre la unión con `tareas_archivadas`.
+        """
+        try:
+            if filtro.busca_archivadas:
+                union = self._union_con_archivadas(filtro, con_nombres)
+                columnas_orden, clave_de, descendente = self._orden_filtro(filtro.orden, union.c)
+                return paginar(
+                    db.session.query(*union.c), columnas_orden, cursor, limite,
+                    clave_de=clave_de, descendente=descendente
+                )
+            
+            columnas_orden, clave_de, descendente = self._orden_filtro(filtro.orden)
+            if con_nombres:
+                query = self._con_nombres(db.session.query(*self.COLUMNAS_VISTA))
+            else:
+                query = db.session.query(*self.COLUMNAS_ENTIDAD)
+            query = query.filter(*self._condiciones_filtro(filtro))
+            return paginar(query, columnas_orden, cursor, limite, clave_de=clave_de, descendente=descendente)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al filtrar tareas: {str(e)}")
+    
+    def obtener_pagina(
+        self,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        id_proyecto: Optional[int] = None,
+        id_miembro: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Pagina:
+        """Obtiene una página de tareas ordenadas por id, con filtros opcionales"""
+        try:
+            query = TareaModel.query
+            if id_proyecto is not None:
+                query = query.filter(TareaModel.id_proyecto == id_proyecto)
+            if id_miembro is not None:
+                query = query.filter(TareaModel.id_miembro_asignado == id_miembro)
+            if estado:
+                query = query.filter(TareaModel.estado == estado)
+            return paginar(query, [TareaModel.id_tarea], cursor, limite)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al obtener página de tareas: {str(e)}")
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: Optional[TareaFiltro] = None,
+        cursor: Optional[str] = None,
+        limite: Optional[int] = None,
+        con_nombres: bool = False
+    ) -> Pagina:
+        """
+        Busca tareas por título y descripción en el índice FTS5, con las mismas
+        condiciones de filtro que obtener_pagina_filtrada (filtro.orden no se usa).
+        Devuelve una página ordenada por relevancia (bm25) y luego por id:
+        de TareaModel, o de filas de COLUMNAS_VISTA (más 'rango') con con_nombres.
+        """
+        try:
+            fts = table(TABLA_FTS, column('rowid'))
+            tabla_fts = literal_column(TABLA_FTS)
+            rango = func.bm25(tabla_fts, PESO_TITULO, PESO_DESCRIPCION).label('rango')
+            
+            if con_nombres:
+                query = self._con_nombres(db.session.query(*self.COLUMNAS_VISTA, rango))
+            else:
+                query = db.session.query(TareaModel, rango)
+            query = query.join(
+                fts, fts.c.rowid == TareaModel.id_tarea
+            ).filter(tabla_fts.op('MATCH')(expresion_match(texto)))
+            if filtro is not None:
+                query = query.filter(*self._condiciones_filtro(filtro))
+            
+            if con_nombres:
+                return paginar(
+                    query, [rango, TareaModel.id_tarea], cursor, limite,
+                    clave_de=lambda fila: (fila.rango, fila.id_tarea)
+                )
+            pagina = paginar(
+                query, [rango, TareaModel.id_tarea], cursor, limite,
+                clave_de=lambda fila: (fila.rango, fila.TareaModel.id_tarea)
+            )
+            return pagina.transformar(lambda fila: fila.TareaModel)
+        except DatoInvalidoError:
+            raise
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al buscar tareas: {str(e)}")
+    
     def obtener_por_proyecto(self, id_proyecto: int) -> List[TareaModel]:
         """Obtiene todas las tareas de un proyecto"""
         try:
@@ -67,9 +546,11 @@ class TareaRepository:
     def obtener_vencidas(self) -> List[TareaModel]:
         """Obtiene tareas vencidas"""
         try:
+            # El literal (no un parámetro) permite que SQLite use el índice parcial
+            # ix_tareas_vencimiento_abiertas (WHERE estado != <código de completada>)
             return TareaModel.query.filter(
                 TareaModel.fecha_vencimiento < date.today(),
-                TareaModel.estado != 'completada'
+                TareaModel.estado != literal_column(str(CODIGO_COMPLETADA))
             ).all()
         except Exception as e:
             raise DatoInvalidoError(f"Error al obtener tareas vencidas: {str(e)}")
@@ -84,35 +565,114 @@ class TareaRepository:
     def actualizar(self, tarea_model: TareaModel) -> TareaModel:
         """Actualiza una tarea en la BD"""
         try:
-            db.session.commit()
-            db.session.refresh(tarea_model)
+            confirmar()
             return tarea_model
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al actualizar tarea: {str(e)}")
     
     def eliminar(self, id_tarea: int) -> bool:
-        """Elimina una tarea de la BD"""
+        """Elimina una tarea de la BD (también si está archivada)"""
         try:
             tarea = self.obtener_por_id(id_tarea)
             if not tarea:
-                return False
+                resultado = db.session.execute(
+                    TareaArchivadaModel.__table__.delete().where(TareaArchivadaModel.id_tarea == id_tarea)
+                )
+                confirmar()
+                return resultado.rowcount > 0
             
             db.session.delete(tarea)
-            db.session.commit()
+            confirmar()
             return True
             
         except Exception as e:
-            db.session.rollback()
+            revertir()
             raise DatoInvalidoError(f"Error al eliminar tarea: {str(e)}")
     
+    @staticmethod
+    def _mover(origen, destino, ids_tarea: List[int]) -> None:
+        """
+        Copia las filas de una tabla de tareas a la otra con INSERT ... SELECT y las borra
+        del origen, sin cargarlas en la sesión (los triggers FTS siguen el movimiento)
+        """
+        columnas = list(TareaArchivadaModel.COLUMNAS_COPIADAS)
+        seleccion = [origen.__table__.c[nombre] for nombre in columnas]
+        if destino is TareaArchivadaModel:
+            # El default de archivada_en es Python: INSERT ... SELECT no lo aplica solo
+            columnas.append('archivada_en')
+            seleccion.append(literal(ahora_utc(), DateTime))
+        db.session.execute(
+            insert(destino.__table__).from_select(
+                columnas, db.select(*seleccion).where(origen.id_tarea.in_(ids_tarea))
+            )
+        )
+        db.session.execute(origen.__table__.delete().where(origen.id_tarea.in_(ids_tarea)))
+    
+    def archivar_bloque(self, estados_proyecto: Iterable[str], limite: int) -> int:
+        """
+        Mueve a `tareas_archivadas` hasta `limite` tareas completadas de proyectos en
+        estados_proyecto, por id. Devuelve cuántas movió; se llama en bloques hasta 0.
+        """
+        try:
+            ids = db.session.scalars(
+                db.select(TareaModel.id_tarea).join(
+                    ProyectoModel, ProyectoModel.id_proyecto == TareaModel.id_proyecto
+                ).where(
+                    TareaModel.estado == literal_column(str(CODIGO_COMPLETADA)),
+                    ProyectoModel.estado.in_(list(estados_proyecto))
+                ).order_by(TareaModel.id_tarea).limit(limite)
+            ).all()
+            if ids:
+                self._mover(TareaModel, TareaArchivadaModel, ids)
+            confirmar()
+            return len(ids)
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al archivar tareas: {str(e)}")
+    
+    def restaurar_bloque(
+        self,
+        limite: int,
+        id_proyecto: Optional[int] = None,
+        ids_tarea: Optional[List[int]] = None
+    ) -> int:
+        """
+        Devuelve a `tareas` hasta `limite` tareas archivadas (de un proyecto o con los ids dados).
+        Devuelve cuántas movió; se llama en bloques hasta 0.
+        """
+        try:
+            consulta = db.select(TareaArchivadaModel.id_tarea)
+            if id_proyecto is not None:
+                consulta = consulta.where(TareaArchivadaModel.id_proyecto == id_proyecto)
+            if ids_tarea is not None:
+                consulta = consulta.where(TareaArchivadaModel.id_tarea.in_(ids_tarea))
+            ids = db.session.scalars(consulta.order_by(TareaArchivadaModel.id_tarea).limit(limite)).all()
+            if ids:
+                self._mover(TareaArchivadaModel, TareaModel, ids)
+            confirmar()
+            return len(ids)
+        except Exception as e:
+            revertir()
+            raise DatoInvalidoError(f"Error al restaurar tareas archivadas: {str(e)}")
+    
+    def contar_archivadas(self, id_proyecto: Optional[int] = None) -> int:
+        """Cantidad de tareas archivadas (de un proyecto o en total)"""
+        try:
+            consulta = db.select(func.count()).select_from(TareaArchivadaModel)
+            if id_proyecto is not None:
+                consulta = consulta.where(TareaArchivadaModel.id_proyecto == id_proyecto)
+            return db.session.scalar(consulta)
+        except Exception as e:
+            raise DatoInvalidoError(f"Error al contar tareas archivadas: {str(e)}")
+    
     def contar_por_estado(self, id_proyecto: int) -> Dict[str, int]:
         """Cuenta tareas por estado en un proyecto"""
         try:
             from sqlalchemy import func
             resultado = db.session.query(
                 TareaModel.estado,
-                func.count(TareaModel.id)
+                func.count(TareaModel.id_tarea)
             ).filter(
                 TareaModel.id_proyecto == id_proyecto
             ).group_by(TareaModel.estado).all()
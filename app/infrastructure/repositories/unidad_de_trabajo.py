@@ -0,0 +1,100 @@
+"""
+Unidad de trabajo - Infrastructure Layer
+Sistema de Gestión de Proyectos y Tareas
+
+Dentro de una unidad de trabajo los repositorios solo hacen flush; el commit
+(o rollback) se hace una sola vez al cerrar la unidad más externa. Fuera de
+una unidad los repositorios confirman cada operación como siempre.
+"""
+from flask import g
+from app import db
+
+
+class UnidadDeTrabajo:
+    """
+    Context manager anidable que agrupa varias operaciones en una transacción.
+
+    Uso en servicios:
+        with UnidadDeTrabajo():
+            self.tarea_repo.crear(...)
+            self.tarea_repo.actualizar(...)
+
+    Con independiente=True la unidad confirma al cerrarse aunque esté anidada
+    (p. ej. un bloque de una importación dentro de la unidad de la petición).
+    El commit incluye lo que la unidad externa tenga pendiente en la sesión.
+    """
+
+    def __init__(self, independiente: bool = False):
+        self.independiente = independiente
+        self._externa = None
+
+    def __enter__(self) -> 'UnidadDeTrabajo':
+        if self.independiente:
+            self._externa = (g.get('_uow_profundidad', 0), g.get('_uow_fallida', False))
+            g._uow_profundidad = 0
+        if g.get('_uow_profundidad', 0) == 0:
+            g._uow_fallida = False
+        g._uow_profundidad = g.get('_uow_profundidad', 0) + 1
+        return self
+
+    def __exit__(self, tipo_exc, valor_exc, traza) -> bool:
+        g._uow_profundidad -= 1
+        if tipo_exc is not None:
+            g._uow_fallida = True
+
+        try:
+            if g._uow_profundidad == 0:
+                if g._uow_fallida:
+                    db.session.rollback()
+                else:
+                    try:
+                        db.session.commit()
+                    except Exception:
+                        db.session.rollback()
+                        raise
+        finally:
+            if self.independiente:
+                g._uow_profundidad, g._uow_fallida = self._externa
+        return False
+
+
+def en_unidad_de_trabajo() -> bool:
+    """Indica si hay una unidad de trabajo abierta en el contexto actual"""
+    return g.get('_uow_profundidad', 0) > 0
+
+
+def confirmar() -> None:
+    """Flush dentro de una unidad de trabajo, commit fuera de ella"""
+    if en_unidad_de_trabajo():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def revertir() -> None:
+    """Rollback de la sesión; si hay una unidad abierta, queda marcada como fallida"""
+    db.session.rollback()
+    if en_unidad_de_trabajo():
+        g._uow_fallida = True
+
+
+def registrar_unidad_de_trabajo_por_peticion(app) -> None:
+    """Abre una unidad de trabajo por petición y la confirma una vez al final"""
+
+    @app.before_request
+    def _abrir_unidad_de_trabajo():
+        g._uow_peticion = UnidadDeTrabajo().__enter__()
+
+    @app.after_request
+    def _confirmar_unidad_de_trabajo(response):
+        unidad = g.pop('_uow_peticion', None)
+        if unidad is not None:
+            unidad.__exit__(None, None, None)
+        return response
+
+    @app.teardown_request
+    def _descartar_unidad_de_trabajo(exc):
+        # Solo queda abierta si la petición terminó con una excepción no manejada
+        unidad = g.pop('_uow_peticion', None)
+        if unidad is not None:
+            unidad.__exit__(type(exc) if exc else Exception, exc, None)
@@ -0,0 +1,156 @@
+"""
+Comandos de consola (flask <comando>) - Presentation Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import os
+import sys
+import click
+
+
+def registrar_comandos(app) -> None:
+    """Registra los comandos de mantenimiento en app.cli"""
+
+    @app.cli.command('migrar-db')
+    def migrar_db():
+        """Crea las tablas que falten y aplica las migraciones pendientes"""
+        from app.infrastructure.migraciones.migrador import aplicar_migraciones
+
+        aplicadas = aplicar_migraciones()
+        if not aplicadas:
+            click.echo("La base de datos ya está actualizada")
+        for descripcion in aplicadas:
+            click.echo(f"✓ Migración aplicada: {descripcion}")
+
+    @app.cli.command('verificar-indices')
+    def verificar_indices():
+        """Comprueba con EXPLAIN QUERY PLAN que cada consulta de repositorio usa un índice"""
+        from app.infrastructure.queries.plan_consultas import verificar_uso_de_indices
+
+        resultados = verificar_uso_de_indices()
+        for resultado in resultados:
+            marca = "✓" if resultado['usa_indice'] else "✗"
+            click.echo(f"{marca} {resultado['metodo']}")
+            for detalle in resultado['plan']:
+                click.echo(f"    {detalle}")
+
+        if not all(r['usa_indice'] for r in resultados):
+            sys.exit(1)
+
+    @app.cli.command('recalcular-estadisticas')
+    def recalcular_estadisticas():
+        """Recalcula desde cero los contadores de tareas por proyecto e informa la deriva"""
+        from app.application.services.tarea_service import TareaService
+
+        diferencias = TareaService().recalcular_estadisticas()
+        if not diferencias:
+            click.echo("✓ Los contadores coinciden con las tareas")
+        for diferencia in diferencias:
+            click.echo(f"✗ Proyecto {diferencia['id_proyecto']}: "
+                       f"guardado={diferencia['guardado']} recalculado={diferencia['recalculado']}")
+
+
+    def _importar(importar, archivo: str, formato, errores, bloque) -> None:
+        """Importa un archivo informando el avance por bloque y deja las filas rechazadas en un CSV"""
+        from app.infrastructure.archivos.lectores import detectar_formato
+
+        formato = detectar_formato(archivo, formato)
+        ruta_errores = errores or f"{archivo}.errores.csv"
+
+        def _informar(progreso):
+            click.echo(f"  {progreso['procesadas']} filas: {progreso['creadas']} creadas, "
+                       f"{progreso['errores']} con error")
+
+        with open(archivo, 'rb') as flujo, open(ruta_errores, 'w', encoding='utf-8', newline='') as destino:
+            resumen = importar(flujo, formato, destino, al_progresar=_informar, tamano_bloque=bloque)
+
+        click.echo(f"✓ {resumen['creadas']} de {resumen['procesadas']} filas importadas")
+        if resumen['errores']:
+            click.echo(f"✗ {resumen['errores']} filas rechazadas: ver {ruta_errores}")
+            sys.exit(1)
+        os.remove(ruta_errores)
+
+    @app.cli.command('importar-miembros')
+    @click.argument('archivo', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--formato', type=click.Choice(['csv', 'ndjson']), help="Por defecto, según la extensión")
+    @click.option('--errores', type=click.Path(dir_okay=False), help="CSV de filas rechazadas")
+    @click.option('--bloque', type=int, help="Filas por transacción")
+    def importar_miembros(archivo, formato, errores, bloque):
+        """Importa miembros desde un archivo CSV o NDJSON, por bloques"""
+        from app.application.services.importacion_service import ImportacionService
+
+        _importar(ImportacionService().importar_miembros, archivo, formato, errores, bloque)
+
+    @app.cli.command('importar-tareas')
+    @click.argument('archivo', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--formato', type=click.Choice(['csv', 'ndjson']), help="Por defecto, según la extensión")
+    @click.option('--errores', type=click.Path(dir_okay=False), help="CSV de filas rechazadas")
+    @click.option('--bloque', type=int, help="Filas por transacción")
+    def importar_tareas(archivo, formato, errores, bloque):
+        """Importa tareas desde un archivo CSV o NDJSON, por bloques"""
+        from app.application.services.importacion_service import ImportacionService
+
+        _importar(ImportacionService().importar_tareas, archivo, formato, errores, bloque)
+
+    def _exportar(trozos, salida: str) -> None:
+        """Escribe el .csv.gz a medida que se genera ('-' = salida estándar)"""
+        destino = sys.stdout.buffer if salida == '-' else open(salida, 'wb')
+        try:
+            for trozo in trozos:
+                destino.write(trozo)
+        finally:
+            if destino is not sys.stdout.buffer:
+                destino.close()
+        if salida != '-':
+            click.echo(f"✓ Exportado en {salida}")
+
+    @app.cli.command('exportar-tareas')
+    @click.option('--salida', type=click.Path(dir_okay=False, allow_dash=True), help="Por defecto tareas_<fecha>.csv.gz")
+    @click.option('--proyecto', type=int, help="Solo las tareas de este proyecto")
+    def exportar_tareas(salida, proyecto):
+        """Exporta todas las tareas, con nombres de proyecto y miembro, como CSV gzip"""
+        from datetime import date
+        from app.application.services.exportacion_service import ExportacionService
+
+        _exportar(
+            ExportacionService().exportar_tareas(proyecto),
+            salida or f"tareas_{date.today().isoformat()}.csv.gz"
+        )
+
+    @app.cli.command('exportar-proyectos')
+    @click.option('--salida', type=click.Path(dir_okay=False, allow_dash=True), help="Por defecto proyectos_<fecha>.csv.gz")
+    def exportar_proyectos(salida):
+        """Exporta el reporte de proyectos (tareas por estado, miembros) como CSV gzip"""
+        from datetime import date
+        from app.application.services.exportacion_service import ExportacionService
+
+        _exportar(
+            ExportacionService().exportar_proyectos(),
+            salida or f"proyectos_{date.today().isoformat()}.csv.gz"
+        )
+
+    @app.cli.command('archivar-tareas')
+    @click.option('--bloque', type=int, help="Tareas por transacción")
+    def archivar_tareas(bloque):
+        """Mueve a tareas_archivadas las tareas completadas de proyectos finalizados o cancelados"""
+        from app.application.services.tarea_service import TareaService
+
+        archivadas = TareaService().archivar_tareas(tamano_bloque=bloque)
+        click.echo(f"✓ {archivadas} tareas archivadas")
+
+    @app.cli.command('restaurar-tareas')
+    @click.option('--proyecto', type=int, help="Restaurar todas las tareas archivadas de este proyecto")
+    @click.option('--tarea', 'tareas', type=int, multiple=True, help="Id de tarea (puede repetirse)")
+    @click.option('--bloque', type=int, help="Tareas por transacción")
+    def restaurar_tareas(proyecto, tareas, bloque):
+        """Devuelve tareas archivadas a la tabla tareas"""
+        from app.application.services.tarea_service import TareaService
+        from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError, NoEncontradoError
+
+        try:
+            restauradas = TareaService().restaurar_tareas(
+                id_proyecto=proyecto, ids_tarea=list(tareas) or None, tamano_bloque=bloque
+            )
+        except (DatoInvalidoError, NoEncontradoError) as e:
+            click.echo(f"✗ {e}")
+            sys.exit(1)
+        click.echo(f"✓ {restauradas} tareas restauradas")
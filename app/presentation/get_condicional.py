@@ -0,0 +1,75 @@
+"""
+GET condicional (ETag / Last-Modified / 304) - Presentation Layer
+Sistema de Gestión de Proyectos y Tareas
+"""
+import hashlib
+from datetime import date, datetime, time, timezone
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import make_response, request, session
+
+from app.application.services.marca_service import Marca
+
+
+def condicional(calcular_marca: Callable[..., Optional[Marca]]):
+    """
+    Decorador para vistas GET: calcula la marca de la página con `calcular_marca(**view_args)`
+    y responde 304 sin renderizar si el cliente ya tiene esa versión.
+    Si la marca no puede calcularse (entidad inexistente, error) la vista se ejecuta normalmente.
+    """
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            # Con mensajes flash pendientes la página no es reutilizable
+            if request.method != 'GET' or session.get('_flashes'):
+                return vista(*args, **kwargs)
+
+            try:
+                marca = calcular_marca(**kwargs)
+            except Exception:
+                marca = None
+            if marca is None:
+                return vista(*args, **kwargs)
+
+            etag = _etag(marca)
+            ultima_modificacion = _ultima_modificacion(marca)
+
+            if _no_modificado(etag, ultima_modificacion):
+                respuesta = make_response('', 304)
+            else:
+                respuesta = make_response(vista(*args, **kwargs))
+                if respuesta.status_code != 200:
+                    return respuesta
+
+            respuesta.set_etag(etag, weak=True)
+            respuesta.last_modified = ultima_modificacion
+            # El navegador guarda la página pero revalida siempre antes de usarla
+            respuesta.headers['Cache-Control'] = 'no-cache'
+            respuesta.vary.add('Cookie')
+            return respuesta
+        return envoltura
+    return decorador
+
+
+def _etag(marca: Marca) -> str:
+    # Incluye la URL completa (filtros, cursor) y la fecha: los días al vencimiento dependen de hoy
+    contenido = f"{request.full_path}|{marca.firma}|{date.today().isoformat()}"
+    return hashlib.sha1(contenido.encode('utf-8')).hexdigest()[:32]
+
+
+def _ultima_modificacion(marca: Marca) -> datetime:
+    # Nunca antes del inicio de hoy: como la ETag, la página cambia con el día
+    inicio_del_dia = datetime.combine(date.today(), time.min).astimezone(timezone.utc)
+    if marca.ultima_modificacion is None:
+        return inicio_del_dia
+    return max(marca.ultima_modificacion.replace(tzinfo=timezone.utc, microsecond=0), inicio_del_dia)
+
+
+def _no_modificado(etag: str, ultima_modificacion: datetime) -> bool:
+    if request.if_none_match:
+        # If-None-Match tiene prioridad sobre If-Modified-Since (RFC 9110)
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since:
+        return ultima_modificacion <= request.if_modified_since
+    return False
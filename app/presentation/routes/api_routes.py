@@ -0,0 +1,161 @@
+import json
+from datetime import date, datetime
+from flask import Blueprint, Response, request, stream_with_context
+from app.application.services.tarea_service import TareaService
+from app.application.services.proyecto_service import ProyectoService
+from app.application.services.miembro_service import MiembroService
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError, NoEncontradoError
+
+# API JSON versionada: colecciones paginadas por cursor o en streaming NDJSON
+api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+tarea_service = TareaService()
+proyecto_service = ProyectoService()
+miembro_service = MiembroService()
+
+TIPO_JSON = 'application/json'
+TIPO_NDJSON = 'application/x-ndjson'
+LINEAS_POR_BLOQUE = 500
+
+
+def _valor_json(valor):
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+# Un único encoder reutilizado: json.dumps con opciones crea uno nuevo en cada llamada
+_codificador = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_valor_json)
+
+
+def _serializar(valor) -> str:
+    """JSON compacto; fechas en ISO 8601"""
+    return _codificador.encode(valor)
+
+
+def _respuesta(cuerpo, estado: int = 200) -> Response:
+    return Response(_serializar(cuerpo), status=estado, mimetype=TIPO_JSON)
+
+
+def _error(e: Exception, estado: int) -> Response:
+    return _respuesta({'error': str(e)}, estado)
+
+
+def _campos():
+    """Campos pedidos con ?fields=a,b (None = todos)"""
+    campos = request.args.get('fields', '')
+    return [c.strip() for c in campos.split(',') if c.strip()] or None
+
+
+def _pide_ndjson() -> bool:
+    """NDJSON con ?formato=ndjson o con Accept: application/x-ndjson"""
+    if request.args.get('formato') == 'ndjson':
+        return True
+    return request.accept_mimetypes.best_match([TIPO_JSON, TIPO_NDJSON], default=TIPO_JSON) == TIPO_NDJSON
+
+
+def _coleccion(servicio, **filtros) -> Response:
+    """
+    Página JSON ({datos, cursor_siguiente, cursor_anterior}) o, en formato NDJSON,
+    todas las filas desde el cursor, una por línea, generadas a medida que se leen.
+    """
+    campos = _campos()
+    cursor = request.args.get('cursor')
+    if _pide_ndjson():
+        filas = servicio.recorrer_campos(campos, cursor, **filtros)
+        return Response(stream_with_context(_bloques_ndjson(filas)), mimetype=TIPO_NDJSON)
+
+    pagina = servicio.listar_campos_paginados(
+        campos, cursor, request.args.get('limite', type=int), **filtros
+    )
+    return _respuesta({
+        'datos': pagina.elementos,
+        'cursor_siguiente': pagina.cursor_siguiente,
+        'cursor_anterior': pagina.cursor_anterior
+    })
+
+
+def _bloques_ndjson(filas):
+    """Agrupa las líneas NDJSON en bloques: un write del servidor cada LINEAS_POR_BLOQUE filas"""
+    bloque = []
+    for fila in filas:
+        bloque.append(_serializar(fila))
+        if len(bloque) == LINEAS_POR_BLOQUE:
+            yield '\n'.join(bloque) + '\n'
+            bloque = []
+    if bloque:
+        yield '\n'.join(bloque) + '\n'
+
+
+def _filtros_tareas(id_proyecto=None) -> dict:
+    return {
+        'id_proyecto': id_proyecto if id_proyecto is not None else request.args.get('proyecto', type=int),
+        'id_miembro': request.args.get('miembro', type=int),
+        'estado': request.args.get('estado'),
+        'prioridad': request.args.get('prioridad'),
+    }
+
+
+# Tareas
+@api_bp.route('/tareas', methods=['GET'])
+def listar_tareas():
+    """Tareas filtradas por proyecto, miembro, estado y prioridad"""
+    try:
+        return _coleccion(tarea_service, filtros=_filtros_tareas())
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+@api_bp.route('/tareas/<int:id_tarea>', methods=['GET'])
+def obtener_tarea(id_tarea):
+    try:
+        return _respuesta(tarea_service.obtener_campos(id_tarea, _campos()))
+    except NoEncontradoError as e:
+        return _error(e, 404)
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+# Proyectos
+@api_bp.route('/proyectos', methods=['GET'])
+def listar_proyectos():
+    """Proyectos, opcionalmente filtrados por estado"""
+    try:
+        return _coleccion(proyecto_service, estado=request.args.get('estado'))
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+@api_bp.route('/proyectos/<int:id_proyecto>', methods=['GET'])
+def obtener_proyecto(id_proyecto):
+    try:
+        return _respuesta(proyecto_service.obtener_campos(id_proyecto, _campos()))
+    except NoEncontradoError as e:
+        return _error(e, 404)
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+@api_bp.route('/proyectos/<int:id_proyecto>/tareas', methods=['GET'])
+def listar_tareas_de_proyecto(id_proyecto):
+    """Tareas de un proyecto (mismos filtros y formatos que /tareas)"""
+    try:
+        proyecto_service.obtener_campos(id_proyecto, ['id_proyecto'])
+        return _coleccion(tarea_service, filtros=_filtros_tareas(id_proyecto))
+    except NoEncontradoError as e:
+        return _error(e, 404)
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+# Miembros
+@api_bp.route('/miembros', methods=['GET'])
+def listar_miembros():
+    """Miembros, opcionalmente filtrados por rol"""
+    try:
+        return _coleccion(miembro_service, rol=request.args.get('rol'))
+    except DatoInvalidoError as e:
+        return _error(e, 400)
+
+@api_bp.route('/miembros/<int:id_miembro>', methods=['GET'])
+def obtener_miembro(id_miembro):
+    try:
+        return _respuesta(miembro_service.obtener_campos(id_miembro, _campos()))
+    except NoEncontradoError as e:
+        return _error(e, 404)
+    except DatoInvalidoError as e:
+        return _error(e, 400)
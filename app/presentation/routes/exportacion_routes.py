@@ -0,0 +1,36 @@
+from datetime import date
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from app.application.services.exportacion_service import ExportacionService
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError, NoEncontradoError
+
+exportaciones_bp = Blueprint('exportaciones', __name__, url_prefix='/exportaciones')
+exportacion_service = ExportacionService()
+
+
+def _descarga_gzip(trozos, nombre: str) -> Response:
+    """Respuesta que envía el .csv.gz a medida que se genera (sin Content-Length)"""
+    return Response(
+        stream_with_context(trozos),
+        mimetype='application/gzip',
+        headers={'Content-Disposition': f'attachment; filename="{nombre}_{date.today().isoformat()}.csv.gz"'}
+    )
+
+
+# READ - Exportar tareas (todas o ?proyecto=<id>) con nombres de proyecto y miembro
+@exportaciones_bp.route('/tareas.csv.gz', methods=['GET'])
+def exportar_tareas():
+    try:
+        id_proyecto = request.args.get('proyecto', type=int)
+        return _descarga_gzip(exportacion_service.exportar_tareas(id_proyecto), 'tareas')
+    except NoEncontradoError as e:
+        return jsonify({'error': str(e)}), 404
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+
+# READ - Exportar el reporte de proyectos
+@exportaciones_bp.route('/proyectos.csv.gz', methods=['GET'])
+def exportar_proyectos():
+    try:
+        return _descarga_gzip(exportacion_service.exportar_proyectos(), 'proyectos')
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
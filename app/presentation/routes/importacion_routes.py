@@ -0,0 +1,87 @@
+import glob
+import os
+import time
+import uuid
+from flask import Blueprint, current_app, jsonify, request, send_from_directory, url_for
+from app.application.services.importacion_service import ImportacionService
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.archivos.lectores import detectar_formato
+
+importaciones_bp = Blueprint('importaciones', __name__, url_prefix='/importaciones')
+importacion_service = ImportacionService()
+
+
+def _directorio_errores() -> str:
+    directorio = os.path.join(current_app.instance_path, 'importaciones')
+    os.makedirs(directorio, exist_ok=True)
+    return directorio
+
+
+def _eliminar_vencidos(directorio: str) -> None:
+    """Borra los CSV de errores más antiguos que IMPORTACION_ERRORES_RETENCION"""
+    limite = time.time() - current_app.config.get('IMPORTACION_ERRORES_RETENCION', 86400)
+    for ruta in glob.glob(os.path.join(directorio, 'errores_*.csv')):
+        try:
+            if os.path.getmtime(ruta) < limite:
+                os.remove(ruta)
+        except FileNotFoundError:
+            # Otro worker lo borró primero
+            pass
+
+
+def _importar(importar):
+    """
+    Recibe el archivo como multipart (campo 'archivo') o como cuerpo crudo con ?formato=,
+    lo importa en streaming y guarda las filas rechazadas en un CSV descargable.
+    """
+    archivo = request.files.get('archivo')
+    flujo = archivo.stream if archivo else request.stream
+    formato = detectar_formato(archivo.filename if archivo else None, request.args.get('formato'))
+    tamano_bloque = request.args.get('bloque', type=int)
+
+    directorio = _directorio_errores()
+    _eliminar_vencidos(directorio)
+    nombre_errores = f"errores_{uuid.uuid4().hex}.csv"
+    ruta_errores = os.path.join(directorio, nombre_errores)
+
+    def _informar(progreso):
+        current_app.logger.info("Importación %s: %s", request.path, progreso)
+
+    try:
+        with open(ruta_errores, 'w', encoding='utf-8', newline='') as destino:
+            resumen = importar(flujo, formato, destino, al_progresar=_informar, tamano_bloque=tamano_bloque)
+    except BaseException:
+        # Importación interrumpida (archivo ilegible, error de base, ...): nadie va a descargarlo
+        os.remove(ruta_errores)
+        raise
+
+    if resumen['errores']:
+        resumen['archivo_errores'] = url_for('importaciones.descargar_errores', nombre=nombre_errores)
+    else:
+        os.remove(ruta_errores)
+        resumen['archivo_errores'] = None
+    return jsonify(resumen), (201 if resumen['creadas'] else 422)
+
+
+# CREATE - Importar miembros (CSV o NDJSON)
+@importaciones_bp.route('/miembros', methods=['POST'])
+def importar_miembros():
+    try:
+        return _importar(importacion_service.importar_miembros)
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+
+# CREATE - Importar tareas (CSV o NDJSON)
+@importaciones_bp.route('/tareas', methods=['POST'])
+def importar_tareas():
+    try:
+        return _importar(importacion_service.importar_tareas)
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+
+# READ - Descargar el CSV de filas rechazadas de una importación
+@importaciones_bp.route('/errores/<nombre>', methods=['GET'])
+def descargar_errores(nombre):
+    directorio = _directorio_errores()
+    _eliminar_vencidos(directorio)
+    return send_from_directory(directorio, nombre, mimetype='text/csv', as_attachment=True)
@@ -1,7 +1,37 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, Response, render_template, jsonify, request
+from app.infrastructure.cache.cache_versionado import cache_referencia, generaciones
+from app.infrastructure.models.marca_tabla_model import TABLAS_CON_MARCA
+from app.infrastructure.queries.instrumentacion import registro_peticiones
+from app.infrastructure.metricas.metricas import exponer
 
 main = Blueprint('main', __name__)
 
 @main.route('/')
 def index():
-    return render_template('index.html')
\ No newline at end of file
+    return render_template('index.html')
+
+@main.route('/estado/cache')
+def estado_cache():
+    """Estadísticas de la caché de proyectos y miembros (aciertos, fallos, tamaño) y generación de cada tabla"""
+    versiones = generaciones(TABLAS_CON_MARCA)
+    return jsonify({
+        **cache_referencia.estadisticas(),
+        'generaciones': {tabla: version for tabla, (version, _) in zip(TABLAS_CON_MARCA, versiones)}
+    })
+
+@main.route('/estado/sql')
+def estado_sql():
+    """
+    Últimas peticiones medidas (más recientes primero): sentencias, tiempo en la base,
+    sentencia más lenta y repetidas. ?lentas=1 ordena por tiempo en la base; ?limite=N
+    """
+    peticiones = registro_peticiones.recientes()
+    if request.args.get('lentas'):
+        peticiones.sort(key=lambda p: p['tiempo_db_ms'], reverse=True)
+    limite = request.args.get('limite', type=int)
+    return jsonify({**registro_peticiones.estadisticas(), 'peticiones': peticiones[:limite] if limite else peticiones})
+
+@main.route('/metrics')
+def metricas():
+    """Métricas de todos los procesos en formato de texto de Prometheus"""
+    return Response(exponer(), mimetype='text/plain; version=0.0.4; charset=utf-8')
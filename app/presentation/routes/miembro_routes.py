@@ -1,14 +1,17 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from app.application.services.miembro_service import MiembroService
+from app.application.services.marca_service import MarcaService
 from app.domain.exceptions.proyecto_exceptions import (
     DatoInvalidoError,
     NoEncontradoError,
     EmailDuplicadoError,
     MiembroNoDisponibleError
 )
+from app.presentation.get_condicional import condicional
 
 miembros_bp = Blueprint('miembros', __name__, url_prefix='/miembros')
 miembro_service = MiembroService()
+marca_service = MarcaService()
 
 # CREATE - Mostrar formulario
 @miembros_bp.route('/nuevo', methods=['GET'])
@@ -47,35 +50,43 @@ def crear():
 
 # READ - Listar todos los miembros
 @miembros_bp.route('/', methods=['GET'])
+@condicional(lambda: marca_service.marca_listado('miembros', 'proyecto_miembro'))
 def listar():
-    """Lista todos los miembros usando MiembroService"""
+    """Lista los miembros paginados por cursor usando MiembroService"""
     try:
         rol = request.args.get('rol')
-        miembros = miembro_service.listar_miembros(rol=rol)
-        return render_template('miembros/listar.html', miembros=miembros)
+        pagina = miembro_service.listar_miembros_paginados(
+            cursor=request.args.get('cursor'),
+            limite=request.args.get('limite', type=int),
+            rol=rol
+        )
+        return render_template('miembros/listar.html', miembros=pagina.elementos, pagina=pagina)
         
     except DatoInvalidoError as e:
         flash(f'Error en filtro: {str(e)}', 'error')
         print('FLASH:', f'Error en filtro: {str(e)}', 'error')
-        miembros = miembro_service.listar_miembros()
-        return render_template('miembros/listar.html', miembros=miembros)
+        pagina = miembro_service.listar_miembros_paginados()
+        return render_template('miembros/listar.html', miembros=pagina.elementos, pagina=pagina)
     except Exception as e:
         flash(f'Error al listar miembros: {str(e)}', 'error')
         print('FLASH:', f'Error al listar miembros: {str(e)}', 'error')
-        return render_template('miembros/listar.html', miembros=[])
+        return render_template('miembros/listar.html', miembros=[], pagina=None)
 
 # READ - Ver detalle de un miembro
 @miembros_bp.route('/<int:id_miembro>', methods=['GET'])
+@condicional(lambda id_miembro: marca_service.marca_entidad(
+    'miembro', id_miembro, 'tareas', 'proyectos', 'proyecto_miembro'
+))
 def detalle(id_miembro):
     """Muestra el detalle de un miembro específico usando MiembroService"""
     try:
-        miembro = miembro_service.obtener_miembro(id_miembro)
-        if not miembro:
-            flash('Miembro no encontrado', 'error')
-            print('FLASH:', 'Miembro no encontrado', 'error')
-            return redirect(url_for('miembros.listar'))
+        detalle_miembro = miembro_service.obtener_miembro_detalle(id_miembro)
             
-        return render_template('miembros/detalle.html', miembro=miembro)
+        return render_template('miembros/detalle.html',
+                             miembro=detalle_miembro['miembro'],
+                             proyectos=detalle_miembro['proyectos'],
+                             tareas=detalle_miembro['tareas'],
+                             nombres_proyecto=detalle_miembro['nombres_proyecto'])
         
     except NoEncontradoError as e:
         flash(str(e), 'error')
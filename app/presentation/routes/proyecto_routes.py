@@ -1,16 +1,19 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from app.application.services.proyecto_service import ProyectoService
 from app.application.services.miembro_service import MiembroService
+from app.application.services.marca_service import MarcaService
 from app.domain.exceptions.proyecto_exceptions import (
     DatoInvalidoError,
     NoEncontradoError,
     ProyectoInactivoError,
     FechaInvalidaError
 )
+from app.presentation.get_condicional import condicional
 
 proyectos_bp = Blueprint('proyectos', __name__, url_prefix='/proyectos')
 proyecto_service = ProyectoService()
 miembro_service = MiembroService()
+marca_service = MarcaService()
 
 # CREATE - Mostrar formulario
 @proyectos_bp.route('/nuevo', methods=['GET'])
@@ -63,39 +66,44 @@ def crear():
 
 # READ - Listar todos los proyectos
 @proyectos_bp.route('/', methods=['GET'])
+@condicional(lambda: marca_service.marca_listado('proyectos', 'tareas', 'tareas_archivadas', 'proyecto_miembro'))
 def listar():
-    """Lista todos los proyectos usando ProyectoService"""
+    """Lista los proyectos paginados por cursor, con su avance, usando ProyectoService"""
     try:
         estado = request.args.get('estado')
-        proyectos = proyecto_service.listar_proyectos(estado=estado)
-        return render_template('proyectos/listar.html', proyectos=proyectos)
+        pagina = proyecto_service.listar_proyectos_con_progreso(
+            cursor=request.args.get('cursor'),
+            limite=request.args.get('limite', type=int),
+            estado=estado
+        )
+        return render_template('proyectos/listar.html', proyectos=pagina.elementos, pagina=pagina)
         
     except DatoInvalidoError as e:
         flash(f'Error en filtro: {str(e)}', 'error')
         print("FLASH:", f'Error en filtro: {str(e)}', 'error')
-        proyectos = proyecto_service.listar_proyectos()
-        return render_template('proyectos/listar.html', proyectos=proyectos)
+        pagina = proyecto_service.listar_proyectos_con_progreso()
+        return render_template('proyectos/listar.html', proyectos=pagina.elementos, pagina=pagina)
     except Exception as e:
         flash(f'Error al listar proyectos: {str(e)}', 'error')
         print("FLASH:", f'Error al listar proyectos: {str(e)}', 'error')
-        return render_template('proyectos/listar.html', proyectos=[])
+        return render_template('proyectos/listar.html', proyectos=[], pagina=None)
 
 # READ - Ver detalle de un proyecto
 @proyectos_bp.route('<int:id_proyecto>', methods=['GET'])
+@condicional(lambda id_proyecto: marca_service.marca_entidad(
+    'proyecto', id_proyecto, 'tareas', 'miembros', 'proyecto_miembro'
+))
 def detalle(id_proyecto):
     """Muestra el detalle de un proyecto específico usando ProyectoService"""
     try:
-        proyecto = proyecto_service.obtener_proyecto(id_proyecto)
-        if not proyecto:
-            flash('Proyecto no encontrado', 'error')
-            print("FLASH:", 'Proyecto no encontrado', 'error')
-            return redirect(url_for('proyectos.listar'))
-        
-        miembros_proyecto = proyecto_service.obtener_miembros_del_proyecto(id_proyecto)
+        detalle_proyecto = proyecto_service.obtener_proyecto_detalle(id_proyecto)
             
         return render_template('proyectos/detalle.html', 
-                             proyecto=proyecto, 
-                             miembros_proyecto=miembros_proyecto)
+                             proyecto=detalle_proyecto['proyecto'], 
+                             miembros_proyecto=detalle_proyecto['miembros'],
+                             tareas_proyecto=detalle_proyecto['tareas'],
+                             nombres_miembro=detalle_proyecto['nombres_miembro'],
+                             tareas_por_miembro=detalle_proyecto['tareas_por_miembro'])
         
     except NoEncontradoError as e:
         flash(str(e), 'error')
@@ -147,26 +155,14 @@ def actualizar(id_proyecto):
             estado=request.form.get('estado', 'activo')
         )
         
-        miembros_seleccionados = request.form.getlist('miembros')
-        miembros_actuales = proyecto_service.obtener_miembros_del_proyecto(id_proyecto)
-        
-        for miembro_id in miembros_seleccionados:
-            miembro_id_int = int(miembro_id)
-            miembro_actual = next((m for m in miembros_actuales if m.id_proyecto == miembro_id_int), None)
-            if not miembro_actual:
-                try:
-                    proyecto_service.agregar_miembro_a_proyecto(id_proyecto, miembro_id_int)
-                except (NoEncontradoError, ProyectoInactivoError) as e:
-                    flash(f'No se pudo agregar miembro {miembro_id}: {str(e)}', 'warning')
-                    print("FLASH:", f'No se pudo agregar miembro {miembro_id}: {str(e)}', 'warning')
-        
-        for miembro_actual in miembros_actuales:
-            if str(miembro_actual.id_proyecto) not in miembros_seleccionados:
-                try:
-                    proyecto_service.remover_miembro_de_proyecto(id_proyecto, miembro_actual.id_proyecto)
-                except Exception as e:
-                    flash(f'No se pudo remover miembro {miembro_actual.id_proyecto}: {str(e)}', 'warning')
-                    print("FLASH:", f'No se pudo remover miembro {miembro_actual.id_proyecto}: {str(e)}', 'warning')
+        try:
+            resultado = proyecto_service.sincronizar_miembros(id_proyecto, request.form.getlist('miembros'))
+            for miembro_id in resultado['inexistentes']:
+                flash(f'No se pudo agregar miembro {miembro_id}: no existe', 'warning')
+                print("FLASH:", f'No se pudo agregar miembro {miembro_id}: no existe', 'warning')
+        except ProyectoInactivoError as e:
+            flash(f'No se actualizaron los miembros: {str(e)}', 'warning')
+            print("FLASH:", f'No se actualizaron los miembros: {str(e)}', 'warning')
         
         flash('Proyecto actualizado exitosamente', 'success')
         print("FLASH:", 'Proyecto actualizado exitosamente', 'success')
@@ -2,6 +2,8 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from app.application.services.tarea_service import TareaService
 from app.application.services.proyecto_service import ProyectoService
 from app.application.services.miembro_service import MiembroService
+from app.application.services.marca_service import MarcaService
+from app.domain.consultas.tarea_filtro import TareaFiltro
 from app.domain.exceptions.proyecto_exceptions import (
     DatoInvalidoError,
     NoEncontradoError,
@@ -10,12 +12,14 @@ from app.domain.exceptions.proyecto_exceptions import (
 )
 from app.infrastructure.models.proyecto_model import ProyectoModel
 from app.infrastructure.models.tarea_model import TareaModel
+from app.presentation.get_condicional import condicional
 from datetime import date
 
 tareas_bp = Blueprint('tareas', __name__, url_prefix='/tareas')
 tarea_service = TareaService()
 proyecto_service = ProyectoService()
 miembro_service = MiembroService()
+marca_service = MarcaService()
 
 # CREATE - Mostrar formulario
 @tareas_bp.route('/nuevo', methods=['GET'])
@@ -61,48 +65,66 @@ def crear():
 
 # READ - Listar todas las tareas
 @tareas_bp.route('/', methods=['GET'])
+@condicional(lambda: marca_service.marca_listado('tareas', 'tareas_archivadas', 'proyectos', 'miembros'))
 def listar():
+    filtro = TareaFiltro.desde_parametros(request.args)
     try:
-        id_proyecto = request.args.get('proyecto', type=int)
-        estado = request.args.get('estado', type=str)
-
-        if id_proyecto:
-            tareas = tarea_service.listar_tareas_por_proyecto(id_proyecto)
-            proyecto = proyecto_service.obtener_proyecto(id_proyecto)
-        elif estado:
-            tareas = tarea_service.listar_tareas_por_estado(estado)
-            proyecto = None
+        cursor = request.args.get('cursor')
+        limite = request.args.get('limite', type=int)
+        opciones = _opciones_filtro(filtro, cursor)
+
+        texto = request.args.get('q', '').strip()
+
+        proyecto = proyecto_service.obtener_proyecto(filtro.id_proyecto) if filtro.id_proyecto else None
+        if texto:
+            # La búsqueda por texto aplica los mismos filtros; orden y archivadas se rechazan
+            pagina = tarea_service.buscar(texto, filtro, cursor=cursor, limite=limite, con_nombres=True)
         else:
-            tareas = tarea_service.listar_tareas()
-            proyecto = None
+            pagina = tarea_service.listar_tareas_filtradas(filtro, cursor=cursor, limite=limite, con_nombres=True)
 
-        return render_template('tareas/listar.html', tareas=tareas, proyecto=proyecto, estado_filtro=estado)
+        return render_template('tareas/listar.html', tareas=pagina.elementos, pagina=pagina, proyecto=proyecto,
+                               filtro=filtro, texto_busqueda=texto, **opciones)
 
     except (NoEncontradoError, DatoInvalidoError) as e:
         flash(f'Error en filtro: {str(e)}', 'error')
         print('FLASH:', f'Error en filtro: {str(e)}', 'error')
-        tareas = tarea_service.listar_tareas()
-        return render_template('tareas/listar.html', tareas=tareas, proyecto=None)
+        pagina = tarea_service.listar_tareas_filtradas(TareaFiltro(), con_nombres=True)
+        return render_template('tareas/listar.html', tareas=pagina.elementos, pagina=pagina, proyecto=None,
+                               filtro=TareaFiltro(), **_opciones_filtro(TareaFiltro()))
 
     except Exception as e:
         flash(f'Error al listar tareas: {str(e)}', 'error')
         print('FLASH:', f'Error al listar tareas: {str(e)}', 'error')
-        return render_template('tareas/listar.html', tareas=[], proyecto=None)
+        return render_template('tareas/listar.html', tareas=[], pagina=None, proyecto=None,
+                               filtro=TareaFiltro(), **_opciones_filtro(TareaFiltro()))
+
+def _opciones_filtro(filtro: TareaFiltro, cursor: str = None) -> dict:
+    """
+    Proyectos y miembros para los selectores del formulario de filtros. Solo la primera
+    página los lista todos; las siguientes llevan los seleccionados, que es lo que el
+    formulario necesita para conservar el filtro, y no recorren ambas tablas en cada página
+    """
+    try:
+        if not cursor:
+            return {'proyectos': proyecto_service.listar_proyectos(), 'miembros': miembro_service.listar_miembros()}
+        proyecto = proyecto_service.obtener_proyecto(filtro.id_proyecto) if filtro.id_proyecto else None
+        miembro = miembro_service.obtener_miembro(filtro.id_miembro) if filtro.id_miembro else None
+        return {'proyectos': [proyecto] if proyecto else [], 'miembros': [miembro] if miembro else []}
+    except Exception:
+        return {'proyectos': [], 'miembros': []}
 
 # READ - Ver detalle de una tarea
 @tareas_bp.route('/<int:id_tarea>', methods=['GET'])
+@condicional(lambda id_tarea: marca_service.marca_entidad('tarea', id_tarea, 'proyectos', 'miembros'))
 def detalle(id_tarea):
     try:
-        tarea = tarea_service.obtener_tarea(id_tarea=id_tarea)
-        if not tarea:
-            flash('Tarea no encontrada', 'error')
-            print('FLASH:', 'Tarea no encontrada', 'error')
-            return redirect(url_for('tareas.listar'))
+        detalle_tarea = tarea_service.obtener_tarea_detalle(id_tarea=id_tarea)
 
-        proyecto = proyecto_service.obtener_proyecto(tarea.id_proyecto) if tarea.id_proyecto else None
-        miembro_asignado = miembro_service.obtener_miembro(tarea.id_miembro_asignado) if tarea.id_miembro_asignado else None
-
-        return render_template('tareas/detalle.html', tarea=tarea, proyecto=proyecto, miembro_asignado=miembro_asignado)
+        return render_template('tareas/detalle.html',
+                               tarea=detalle_tarea['tarea'],
+                               proyecto=detalle_tarea['proyecto'],
+                               miembro_asignado=detalle_tarea['miembro_asignado'],
+                               archivada=detalle_tarea['archivada'])
 
     except NoEncontradoError as e:
         flash(str(e), 'error')
@@ -259,3 +281,38 @@ def asignar_rapido(id_tarea):
         flash(f'Error al asignar tarea: {str(e)}', 'error')
         print('FLASH:', f'Error al asignar tarea: {str(e)}', 'error')
         return redirect(url_for('tareas.listar'))
+
+# API JSON - Crear tareas en lote
+@tareas_bp.route('/lote', methods=['POST'])
+def crear_en_lote():
+    """
+    Crea muchas tareas en una transacción. Cuerpo: lista JSON de tareas
+    (titulo, id_proyecto, descripcion, id_miembro_asignado, prioridad, fecha_vencimiento).
+    Responde 201 si se creó al menos una y 422 si todas fallaron; los errores van por fila.
+    """
+    try:
+        resultado = tarea_service.crear_tareas_en_lote(request.get_json(silent=True))
+        return jsonify(resultado), 201 if resultado['creadas'] else 422
+
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        return jsonify({'error': f'Error al crear tareas en lote: {str(e)}'}), 500
+
+# API JSON - Actualizar tareas en lote
+@tareas_bp.route('/lote', methods=['PATCH'])
+def actualizar_en_lote():
+    """
+    Actualiza muchas tareas en una transacción. Cuerpo: lista JSON de objetos con id_tarea
+    y los campos a cambiar. Responde 200 si se actualizó al menos una y 422 si todas fallaron.
+    """
+    try:
+        resultado = tarea_service.actualizar_tareas_en_lote(request.get_json(silent=True))
+        return jsonify(resultado), 200 if resultado['actualizadas'] else 422
+
+    except DatoInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        return jsonify({'error': f'Error al actualizar tareas en lote: {str(e)}'}), 500
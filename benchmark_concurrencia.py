@@ -0,0 +1,106 @@
+# benchmark_concurrencia.py
+"""
+Benchmark de concurrencia SQLite: throughput de lectores y escritores
+con el perfil por defecto (journal DELETE) y con ProductionConfig (WAL).
+
+Uso:
+    python benchmark_concurrencia.py --segundos 5 --lectores 4 --escritores 2
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from app import create_app, db
+from config import Config, ProductionConfig
+
+
+def _crear_app(config_base, ruta_db):
+    class ConfigBenchmark(config_base):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{ruta_db}"
+    return create_app(ConfigBenchmark)
+
+
+def _sembrar(app, cantidad_tareas: int) -> int:
+    from app.application.services.proyecto_service import ProyectoService
+    from app.infrastructure.models.tarea_model import TareaModel
+
+    with app.app_context():
+        db.create_all()
+        proyecto = ProyectoService().crear_proyecto("Benchmark", "2025-01-01", "2030-12-31")
+        db.session.bulk_insert_mappings(TareaModel, [
+            {'titulo': f"Tarea {i}", 'id_proyecto': proyecto.id_proyecto, 'prioridad': 'media', 'estado': 'pendiente'}
+            for i in range(cantidad_tareas)
+        ])
+        db.session.commit()
+        return proyecto.id_proyecto
+
+
+def _correr(app, id_proyecto: int, segundos: float, lectores: int, escritores: int) -> dict:
+    from app.application.services.tarea_service import TareaService
+
+    fin = time.perf_counter() + segundos
+    contadores = {'lecturas': 0, 'escrituras': 0, 'bloqueos': 0, 'otros_errores': 0}
+    candado = threading.Lock()
+
+    def _sumar(clave):
+        with candado:
+            contadores[clave] += 1
+
+    def lector():
+        servicio = TareaService()
+        while time.perf_counter() < fin:
+            with app.app_context():
+                try:
+                    servicio.listar_tareas_paginadas(id_proyecto=id_proyecto, limite=50)
+                    _sumar('lecturas')
+                except Exception as e:
+                    _sumar('bloqueos' if 'locked' in str(e) else 'otros_errores')
+
+    def escritor():
+        servicio = TareaService()
+        while time.perf_counter() < fin:
+            with app.app_context():
+                try:
+                    servicio.crear_tarea("Escritura concurrente", id_proyecto)
+                    _sumar('escrituras')
+                except Exception as e:
+                    _sumar('bloqueos' if 'locked' in str(e) else 'otros_errores')
+
+    hilos = [threading.Thread(target=lector) for _ in range(lectores)]
+    hilos += [threading.Thread(target=escritor) for _ in range(escritores)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    with app.app_context():
+        db.engine.dispose()
+    return contadores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segundos', type=float, default=5)
+    parser.add_argument('--lectores', type=int, default=4)
+    parser.add_argument('--escritores', type=int, default=2)
+    parser.add_argument('--tareas', type=int, default=20000)
+    args = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix="bench_sqlite_")
+    try:
+        print(f"{'perfil':<12}{'lecturas/s':>12}{'escrituras/s':>14}{'bloqueos':>10}{'otros':>8}")
+        for nombre, config in (('Config', Config), ('Production', ProductionConfig)):
+            app = _crear_app(config, os.path.join(directorio, f"{nombre}.db"))
+            id_proyecto = _sembrar(app, args.tareas)
+            r = _correr(app, id_proyecto, args.segundos, args.lectores, args.escritores)
+            print(f"{nombre:<12}{r['lecturas'] / args.segundos:>12.1f}"
+                  f"{r['escrituras'] / args.segundos:>14.1f}{r['bloqueos']:>10}{r['otros_errores']:>8}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmark_entidades.py
+"""
+Benchmark de memoria y asignaciones de las entidades de dominio:
+Tarea, Proyecto y Miembro con __slots__ frente a la misma clase con
+__dict__ por instancia (la representación anterior).
+
+La variante "con __dict__" se construye en tiempo de ejecución copiando
+los métodos y propiedades de la entidad actual sin sus __slots__, así las
+dos versiones comparten exactamente la misma API.
+
+Uso:
+    python benchmark_entidades.py --cantidad 100000 --repeticiones 5
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from app.domain.entities.miembro import Miembro
+from app.domain.entities.proyecto import Proyecto
+from app.domain.entities.tarea import Tarea
+
+
+def _sin_slots(clase):
+    """Copia de la clase sin __slots__: cada instancia vuelve a tener su __dict__"""
+    atributos = {
+        nombre: valor for nombre, valor in vars(clase).items()
+        if nombre not in ('__slots__', '__dict__', '__weakref__') + tuple(clase.__slots__)
+    }
+    return type(clase.__name__, clase.__bases__, atributos)
+
+
+def _argumentos(cantidad: int) -> dict:
+    """Por entidad: la clase y los kwargs de cada instancia (creados fuera de la medición)"""
+    return {
+        'Tarea': (Tarea, [dict(
+            titulo=f"Tarea {i}", id_proyecto=1, descripcion="Descripción", id_miembro_asignado=i % 50,
+            prioridad='media', estado='pendiente', fecha_creacion='2025-01-01',
+            fecha_vencimiento='2025-12-31', id_tarea=i
+        ) for i in range(cantidad)]),
+        'Proyecto': (Proyecto, [dict(
+            nombre=f"Proyecto {i}", fecha_inicio='2025-01-01', fecha_fin='2025-12-31',
+            descripcion="Descripción", estado='activo', id_proyecto=i
+        ) for i in range(cantidad)]),
+        'Miembro': (Miembro, [dict(
+            nombre="Ana", apellido=f"Pérez {i}", email=f"ana{i}@ejemplo.com", rol='desarrollador',
+            fecha_ingreso='2024-01-01', id_miembro=i
+        ) for i in range(cantidad)]),
+    }
+
+
+def _medir(clase, argumentos: list, repeticiones: int) -> dict:
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        instancias = [clase(**kw) for kw in argumentos]
+        tiempos.append(time.perf_counter() - inicio)
+        del instancias
+
+    gc.collect()
+    tracemalloc.start()
+    instancias = [clase(**kw) for kw in argumentos]
+    usados, _ = tracemalloc.get_traced_memory()
+    bloques = sum(e.count for e in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del instancias
+
+    # Incluye los 8 bytes del puntero en la lista que retiene las instancias
+    cantidad = len(argumentos)
+    return {
+        'bytes_por_entidad': usados / cantidad,
+        'bloques_por_entidad': bloques / cantidad,
+        'us_por_entidad': min(tiempos) / cantidad * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cantidad', type=int, default=100000)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'entidad':<10}{'variante':<12}{'bytes/entidad':>15}{'asign./entidad':>16}{'µs/entidad':>12}")
+    for nombre, (clase, argumentos) in _argumentos(args.cantidad).items():
+        for variante, cls in (('__dict__', _sin_slots(clase)), ('__slots__', clase)):
+            r = _medir(cls, argumentos, args.repeticiones)
+            print(f"{nombre:<10}{variante:<12}{r['bytes_por_entidad']:>15.1f}"
+                  f"{r['bloques_por_entidad']:>16.2f}{r['us_por_entidad']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# benchmark_lecturas.py
+"""
+Benchmark de lectura de listados: hidratación ORM completa
+(TareaRepository.obtener_todas() + to_entity()) frente a la proyección
+de columnas (TareaRepository.obtener_filas() + TareaModel.entity_desde_fila).
+
+Mide tiempo, filas por segundo y pico de memoria (tracemalloc) por estrategia.
+
+Uso:
+    python benchmark_lecturas.py --tareas 100000 --repeticiones 3
+"""
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+from app import create_app, db
+from config import Config
+
+
+def _crear_app(ruta_db):
+    class ConfigBenchmark(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{ruta_db}"
+    return create_app(ConfigBenchmark)
+
+
+def _sembrar(app, cantidad_tareas: int) -> None:
+    from app.application.services.proyecto_service import ProyectoService
+    from app.infrastructure.models.tarea_model import TareaModel
+
+    with app.app_context():
+        db.create_all()
+        proyecto = ProyectoService().crear_proyecto("Benchmark", "2025-01-01", "2030-12-31")
+        db.session.execute(db.insert(TareaModel), [
+            {
+                'titulo': f"Tarea {i}",
+                'descripcion': f"Descripción de la tarea {i}",
+                'id_proyecto': proyecto.id_proyecto,
+                'prioridad': ('baja', 'media', 'alta', 'urgente')[i % 4],
+                'estado': ('pendiente', 'en_progreso', 'completada', 'bloqueada')[i % 4],
+                'fecha_vencimiento': date(2026, 1 + i % 12, 1 + i % 28),
+            }
+            for i in range(cantidad_tareas)
+        ])
+        db.session.commit()
+
+
+def _orm_completo():
+    from app.infrastructure.repositories.tarea_repository import TareaRepository
+    return [tm.to_entity() for tm in TareaRepository().obtener_todas()]
+
+
+def _proyeccion():
+    from app.infrastructure.models.tarea_model import TareaModel
+    from app.infrastructure.repositories.tarea_repository import TareaRepository
+    return [TareaModel.entity_desde_fila(fila) for fila in TareaRepository().obtener_filas()]
+
+
+def _medir(app, estrategia, repeticiones: int) -> dict:
+    tiempos = []
+    for _ in range(repeticiones):
+        with app.app_context():
+            gc.collect()
+            inicio = time.perf_counter()
+            tareas = estrategia()
+            tiempos.append(time.perf_counter() - inicio)
+            cantidad = len(tareas)
+            del tareas
+            db.session.remove()
+
+    with app.app_context():
+        gc.collect()
+        tracemalloc.start()
+        tareas = estrategia()
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tareas
+        db.session.remove()
+
+    mejor = min(tiempos)
+    return {'filas': cantidad, 'segundos': mejor, 'filas_s': cantidad / mejor, 'pico_mb': pico / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tareas', type=int, default=100000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix="bench_lecturas_")
+    try:
+        app = _crear_app(os.path.join(directorio, "lecturas.db"))
+        _sembrar(app, args.tareas)
+
+        print(f"{'estrategia':<28}{'filas':>9}{'segundos':>10}{'filas/s':>12}{'pico MB':>10}")
+        for nombre, estrategia in (('obtener_todas + to_entity', _orm_completo),
+                                   ('obtener_filas (proyección)', _proyeccion)):
+            r = _medir(app, estrategia, args.repeticiones)
+            print(f"{nombre:<28}{r['filas']:>9}{r['segundos']:>10.3f}{r['filas_s']:>12.0f}{r['pico_mb']:>10.1f}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
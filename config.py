@@ -1,7 +1,46 @@
 import os
+import tempfile
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY','dev_key') # Default secret key for development
     SQLALCHEMY_DATABASE_URI =  'sqlite:///database.db'  # Default SQLite database
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # Disable track modifications to save resources
-    
\ No newline at end of file
+    SQLITE_PRAGMAS = {}  # PRAGMAs applied on every new SQLite connection
+    CACHE_REFERENCIA_CAPACIDAD = 512  # max entries in the project/member read cache
+    CACHE_REFERENCIA_TTL = 300  # seconds before an entry is re-read even if its tables did not change
+    INSTRUMENTACION_SQL_MUESTREO = 1.0  # fraction of requests with SQL metrics (Server-Timing, /estado/sql); 0 disables
+    INSTRUMENTACION_SQL_CAPACIDAD = 200  # measured requests kept in the in-memory ring buffer
+    INSTRUMENTACION_SQL_REPETIDAS = 5  # same SQL this many times in one request is flagged as an N+1 suspect
+    IMPORTACION_ERRORES_RETENCION = 86400  # seconds an import's rejected-rows CSV stays downloadable
+    METRICAS_HABILITADAS = True  # Prometheus metrics at /metrics
+    METRICAS_DIRECTORIO = os.environ.get('METRICAS_DIR')  # shared by all worker processes; None = private temp dir
+
+
+class ProductionConfig(Config):
+    """Perfil de producción: SQLite en modo WAL para varios workers concurrentes"""
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///database.db')
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',        # readers no longer block behind the writer
+        'synchronous': 'NORMAL',      # safe with WAL, one fsync per checkpoint instead of per commit
+        'cache_size': -64000,         # 64 MB page cache per connection (negative = KiB)
+        'mmap_size': 268435456,       # 256 MB memory-mapped I/O
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+        'busy_timeout': 5000,         # wait up to 5 s for the write lock instead of "database is locked"
+    }
+    INSTRUMENTACION_SQL_MUESTREO = 0.05  # 1 request in 20
+    # Same directory for every worker so /metrics adds them up; clear it when redeploying
+    METRICAS_DIRECTORIO = os.environ.get('METRICAS_DIR', os.path.join(tempfile.gettempdir(), 'gestion_metricas'))
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 5,
+        'pool_timeout': 30,
+        'pool_recycle': 3600,
+    }
+
+
+def obtener_config():
+    """Selecciona el perfil con la variable de entorno APP_PERFIL (desarrollo | produccion)"""
+    if os.environ.get('APP_PERFIL', 'desarrollo') == 'produccion':
+        return ProductionConfig
+    return Config
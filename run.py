@@ -1,6 +1,7 @@
 from app import create_app
+from config import obtener_config
 
-app = create_app()
+app = create_app(obtener_config())
 
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import pytest
+
+from app import create_app, db
+from config import Config
+
+
+class ConfigPruebas(Config):
+    TESTING = True
+    SQLITE_PRAGMAS = {'foreign_keys': 'ON'}  # same referential checks as production
+    INSTRUMENTACION_SQL_MUESTREO = 0.0
+    METRICAS_HABILITADAS = False
+
+
+@pytest.fixture
+def app(tmp_path):
+    """App sobre una base SQLite vacía (sin tablas) en un directorio temporal"""
+    class Configuracion(ConfigPruebas):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'gestion.db'}"
+
+    app = create_app(Configuracion)
+    app.instance_path = str(tmp_path / 'instance')
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def base(app):
+    """Esquema actual creado con create_all"""
+    db.create_all()
+    return db
+
+
+@pytest.fixture
+def servicios(base):
+    from app.application.services.miembro_service import MiembroService
+    from app.application.services.proyecto_service import ProyectoService
+    from app.application.services.tarea_service import TareaService
+
+    class Servicios:
+        proyectos = ProyectoService()
+        miembros = MiembroService()
+        tareas = TareaService()
+
+    return Servicios
+
+
+@pytest.fixture
+def proyecto(servicios):
+    """Proyecto activo con dos miembros; devuelve (proyecto, [miembros])"""
+    proyecto = servicios.proyectos.crear_proyecto('Proyecto de prueba', '2025-01-01', '2026-12-31')
+    miembros = [
+        servicios.miembros.crear_miembro('Ana', 'Pérez', 'ana@empresa.com', 'desarrollador', '2024-01-10'),
+        servicios.miembros.crear_miembro('Luis', 'Gómez', 'luis@empresa.com', 'tester', '2024-02-01'),
+    ]
+    for miembro in miembros:
+        servicios.proyectos.agregar_miembro_a_proyecto(proyecto.id_proyecto, miembro.id_miembro)
+    return proyecto, miembros
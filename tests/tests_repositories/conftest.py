@@ -0,0 +1,49 @@
+import pytest
+
+from app import db
+
+# Esquema de la versión anterior a los códigos enteros: estado, prioridad y rol como texto
+ESQUEMA_TEXTO = (
+    """CREATE TABLE proyectos (
+        id_proyecto INTEGER NOT NULL, nombre VARCHAR(100) NOT NULL, descripcion VARCHAR(500),
+        fecha_inicio DATE NOT NULL, fecha_fin DATE NOT NULL, estado VARCHAR(20) NOT NULL,
+        PRIMARY KEY (id_proyecto))""",
+    """CREATE TABLE miembros (
+        id_miembro INTEGER NOT NULL, nombre VARCHAR(50) NOT NULL, apellido VARCHAR(50) NOT NULL,
+        email VARCHAR(100) NOT NULL, rol VARCHAR(30) NOT NULL, fecha_ingreso DATE NOT NULL,
+        PRIMARY KEY (id_miembro), UNIQUE (email))""",
+    """CREATE TABLE tareas (
+        id_tarea INTEGER NOT NULL, titulo VARCHAR(150) NOT NULL, descripcion VARCHAR(1000),
+        id_proyecto INTEGER NOT NULL, id_miembro_asignado INTEGER, prioridad VARCHAR(20) NOT NULL,
+        estado VARCHAR(20) NOT NULL, fecha_creacion DATE, fecha_vencimiento DATE,
+        PRIMARY KEY (id_tarea),
+        FOREIGN KEY(id_proyecto) REFERENCES proyectos (id_proyecto),
+        FOREIGN KEY(id_miembro_asignado) REFERENCES miembros (id_miembro))""",
+    """CREATE TABLE proyecto_miembro (
+        id_proyecto INTEGER NOT NULL, id_miembro INTEGER NOT NULL,
+        PRIMARY KEY (id_proyecto, id_miembro),
+        FOREIGN KEY(id_proyecto) REFERENCES proyectos (id_proyecto),
+        FOREIGN KEY(id_miembro) REFERENCES miembros (id_miembro))""",
+    "CREATE INDEX ix_tareas_prioridad ON tareas (prioridad)",
+)
+
+DATOS_TEXTO = (
+    "INSERT INTO proyectos VALUES (1, 'Sistema de Ventas', '', '2025-01-15', '2025-06-30', 'activo')",
+    "INSERT INTO miembros VALUES (1, 'Juan', 'Pérez', 'juan@empresa.com', 'desarrollador', '2024-01-10')",
+    "INSERT INTO miembros VALUES (2, 'María', 'González', 'maria@empresa.com', 'Tester', '2023-06-15')",
+    "INSERT INTO miembros VALUES (3, 'Carlos', 'Ruiz', 'carlos@empresa.com', 'project_manager', '2024-03-20')",
+    "INSERT INTO proyecto_miembro VALUES (1, 1)",
+    "INSERT INTO tareas VALUES (1, 'Diseñar carrito', '', 1, 1, 'alta', 'en_progreso', '2025-01-20', '2025-02-01')",
+    "INSERT INTO tareas VALUES (2, 'Pasarela de pago', '', 1, NULL, 'urgente', 'pendiente', '2025-01-20', NULL)",
+    "INSERT INTO tareas VALUES (3, 'Catálogo', '', 1, 1, 'baja', 'completada', '2025-01-20', '2025-01-25')",
+    "INSERT INTO tareas VALUES (4, 'Reporte', '', 1, NULL, 'MEDIA', 'sin_estado', '2025-01-20', NULL)",
+)
+
+
+@pytest.fixture
+def base_con_textos(app):
+    """Base con el esquema y los datos anteriores a los códigos enteros, sin migrar"""
+    with db.engine.begin() as conexion:
+        for sentencia in ESQUEMA_TEXTO + DATOS_TEXTO:
+            conexion.exec_driver_sql(sentencia)
+    return db
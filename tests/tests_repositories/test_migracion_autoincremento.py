@@ -0,0 +1,33 @@
+from app import db
+from app.application.services.tarea_service import TareaService
+from app.infrastructure.migraciones.migrador import aplicar_migraciones
+from app.infrastructure.models.marca_tabla_model import ahora_utc
+from app.infrastructure.models.tarea_archivada_model import TareaArchivadaModel
+from app.infrastructure.repositories.marca_repository import MarcaRepository
+
+
+def test_tareas_pasa_a_autoincremento_por_encima_de_las_archivadas(base_con_textos):
+    with db.engine.begin() as conexion:
+        TareaArchivadaModel.__table__.create(conexion)
+        conexion.execute(TareaArchivadaModel.__table__.insert().values(
+            id_tarea=9, titulo='Archivada', descripcion='', id_proyecto=1, prioridad='media',
+            estado='completada', updated_at=ahora_utc(), archivada_en=ahora_utc()
+        ))
+
+    aplicar_migraciones()
+
+    with db.engine.connect() as conexion:
+        sql = conexion.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'tareas'").scalar()
+        assert 'AUTOINCREMENT' in sql
+        assert conexion.exec_driver_sql("SELECT seq FROM sqlite_sequence WHERE name = 'tareas'").all() == [(9,)]
+        assert conexion.exec_driver_sql("SELECT count(*) FROM tareas").scalar() == 4
+    tareas = TareaService()
+    # Índice de búsqueda y triggers recreados sobre la tabla nueva
+    assert [t.id_tarea for t in tareas.buscar('carrito')] == [1]
+    version = MarcaRepository().versiones(['tareas'])['tareas'][0]
+
+    nueva = tareas.crear_tarea('Nueva', 1)
+
+    assert nueva.id_tarea == 10
+    assert [t.id_tarea for t in tareas.buscar('nueva')] == [10]
+    assert MarcaRepository().versiones(['tareas'])['tareas'][0] == version + 1
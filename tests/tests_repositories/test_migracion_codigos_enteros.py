@@ -0,0 +1,75 @@
+import pytest
+
+from app import db
+from app.application.services.miembro_service import MiembroService
+from app.application.services.tarea_service import TareaService
+from app.domain.consultas.tarea_filtro import TareaFiltro
+from app.domain.entities.catalogo import PRIORIDADES_TAREA
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.migraciones.migrador import MIGRACIONES, aplicar_migraciones, version_actual
+
+
+def _tipos(conexion, tabla):
+    return {fila[1]: fila[2] for fila in conexion.exec_driver_sql(f"PRAGMA table_info({tabla})")}
+
+
+def test_convierte_textos_a_codigos_enteros(base_con_textos):
+    aplicadas = aplicar_migraciones()
+
+    assert len(aplicadas) == len(MIGRACIONES)
+    with db.engine.connect() as conexion:
+        assert version_actual(conexion) == max(m.VERSION for m in MIGRACIONES)
+        assert _tipos(conexion, 'tareas')['estado'] == 'SMALLINT'
+        assert _tipos(conexion, 'tareas')['prioridad'] == 'SMALLINT'
+        assert _tipos(conexion, 'miembros')['rol'] == 'SMALLINT'
+        assert conexion.exec_driver_sql(
+            "SELECT id_tarea, prioridad, estado FROM tareas ORDER BY id_tarea"
+        ).all() == [(1, 1, 1), (2, 0, 0), (3, 3, 2), (4, 2, 0)]
+        indices = {fila[0] for fila in conexion.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert 'ix_tareas_prioridad' not in indices
+    assert {'ix_tareas_prioridad_vencimiento', 'ix_tareas_vencimiento_abiertas'} <= indices
+
+
+def test_la_api_de_texto_no_cambia_tras_migrar(base_con_textos):
+    aplicar_migraciones()
+    tareas = TareaService()
+
+    assert [(t.prioridad, t.estado) for t in tareas.listar_tareas()] == [
+        ('alta', 'en_progreso'), ('urgente', 'pendiente'), ('baja', 'completada'), ('media', 'pendiente')
+    ]
+    # Roles normalizados; los que no están en el catálogo pasan a 'colaborador'
+    assert [m.rol for m in MiembroService().listar_miembros()] == ['desarrollador', 'tester', 'colaborador']
+
+    pagina = tareas.listar_tareas_filtradas(TareaFiltro(orden='prioridad'))
+    assert [t.id_tarea for t in pagina] == [2, 1, 4, 3]
+    pagina = tareas.listar_tareas_filtradas(TareaFiltro(estados=['pendiente']))
+    assert [t.id_tarea for t in pagina] == [2, 4]
+
+
+def test_recalcula_los_contadores_tras_convertir(base_con_textos):
+    aplicar_migraciones()
+
+    assert TareaService().obtener_estadisticas_proyecto(1) == {
+        'total': 4, 'pendiente': 2, 'en_progreso': 1, 'completada': 1, 'bloqueada': 0
+    }
+
+
+def test_migrar_dos_veces_no_hace_nada(base_con_textos):
+    aplicar_migraciones()
+
+    assert aplicar_migraciones() == []
+
+
+@pytest.mark.parametrize('codigo', [-1, 4, '1', 1.0, True, None])
+def test_un_codigo_fuera_del_catalogo_se_rechaza(codigo):
+    with pytest.raises(DatoInvalidoError, match='Código de prioridad desconocido'):
+        PRIORIDADES_TAREA.valor(codigo)
+
+
+def test_un_codigo_corrupto_no_se_lee_como_otro_valor(base_con_textos):
+    aplicar_migraciones()
+    with db.engine.begin() as conexion:
+        conexion.exec_driver_sql("UPDATE tareas SET prioridad = -1 WHERE id_tarea = 2")
+
+    with pytest.raises(DatoInvalidoError, match='desconocido: -1'):
+        TareaService().obtener_tarea(2)
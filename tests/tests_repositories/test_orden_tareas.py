@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.domain.consultas.tarea_filtro import TareaFiltro
+from app.domain.entities.catalogo import PRIORIDADES_TAREA
+from app.infrastructure.repositories.tarea_repository import TareaRepository
+
+PRIORIDADES = ('baja', 'urgente', 'media', 'alta')
+VENCIMIENTOS = ('2025-03-01', None, '2025-01-15', '2025-03-01', '2025-02-10')
+
+
+@pytest.fixture
+def tareas(servicios, proyecto):
+    """17 tareas con prioridades y vencimientos repetidos (algunas sin vencimiento); devuelve sus entidades"""
+    proyecto_creado, (ana, _) = proyecto
+    return [
+        servicios.tareas.crear_tarea(
+            f'Tarea {i}', proyecto_creado.id_proyecto, id_miembro_asignado=ana.id_miembro,
+            prioridad=PRIORIDADES[i % len(PRIORIDADES)],
+            fecha_vencimiento=VENCIMIENTOS[i % len(VENCIMIENTOS)]
+        )
+        for i in range(17)
+    ]
+
+
+def _clave_vencimiento(tarea):
+    return str(tarea.fecha_vencimiento) if tarea.fecha_vencimiento else '9999-12-31'
+
+
+ESPERADOS = {
+    'id': lambda t: t.id_tarea,
+    'vencimiento': lambda t: (_clave_vencimiento(t), t.id_tarea),
+    'prioridad': lambda t: (PRIORIDADES_TAREA.codigo(t.prioridad), _clave_vencimiento(t), t.id_tarea),
+}
+
+
+def _recorrer(servicios, filtro, limite=4):
+    """Ids en el orden del listado, avanzando página a página y luego retrocediendo desde la última"""
+    paginas = [servicios.tareas.listar_tareas_filtradas(filtro, limite=limite)]
+    while paginas[-1].hay_siguiente:
+        paginas.append(servicios.tareas.listar_tareas_filtradas(filtro, paginas[-1].cursor_siguiente, limite))
+    hacia_adelante = [t.id_tarea for pagina in paginas for t in pagina]
+
+    pagina = paginas[-1]
+    hacia_atras = [t.id_tarea for t in pagina]
+    while pagina.hay_anterior:
+        pagina = servicios.tareas.listar_tareas_filtradas(filtro, pagina.cursor_anterior, limite)
+        hacia_atras = [t.id_tarea for t in pagina] + hacia_atras
+    assert hacia_atras == hacia_adelante
+    return hacia_adelante
+
+
+@pytest.mark.parametrize('orden', ['id', 'vencimiento', '-vencimiento', 'prioridad', '-prioridad'])
+def test_cada_orden_pagina_igual_que_ordenar_en_memoria(servicios, tareas, orden):
+    clave = ESPERADOS[orden.lstrip('-')]
+    esperado = [t.id_tarea for t in sorted(tareas, key=clave, reverse=orden.startswith('-'))]
+
+    assert _recorrer(servicios, TareaFiltro(orden=orden)) == esperado
+
+
+@pytest.mark.parametrize('orden', ['-vencimiento', '-prioridad'])
+def test_orden_inverso_con_archivadas(servicios, proyecto, tareas, orden):
+    proyecto_creado, _ = proyecto
+    for tarea in tareas[::3]:
+        servicios.tareas.completar_tarea(tarea.id_tarea)
+    servicios.proyectos.actualizar_proyecto(proyecto_creado.id_proyecto, estado='finalizado')
+    assert servicios.tareas.archivar_tareas() == len(tareas[::3])
+
+    clave = ESPERADOS[orden.lstrip('-')]
+    esperado = [t.id_tarea for t in sorted(tareas, key=clave, reverse=True)]
+
+    assert _recorrer(servicios, TareaFiltro(orden=orden, incluir_archivadas=True)) == esperado
+
+
+@pytest.mark.parametrize('orden', ['vencimiento', '-vencimiento', 'prioridad', '-prioridad'])
+def test_el_orden_se_lee_del_indice_sin_ordenar(servicios, tareas, orden):
+    repositorio = TareaRepository()
+    primera = repositorio.obtener_pagina_filtrada(TareaFiltro(orden=orden), limite=4)
+    sentencias = []
+
+    def _escuchar(conn, cursor, statement, parameters, context, executemany):
+        sentencias.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', _escuchar)
+    try:
+        repositorio.obtener_pagina_filtrada(TareaFiltro(orden=orden), cursor=primera.cursor_siguiente, limite=4)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _escuchar)
+
+    (sql, parametros), = sentencias
+    plan = [fila[-1] for fila in db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parametros)]
+    indice = 'ix_tareas_vencimiento' if 'vencimiento' in orden else 'ix_tareas_prioridad_vencimiento'
+    assert any(indice in detalle for detalle in plan), plan
+    assert not any('TEMP B-TREE' in detalle for detalle in plan), plan
@@ -0,0 +1,40 @@
+import pytest
+
+from app.infrastructure.migraciones.migrador import aplicar_migraciones
+from app.infrastructure.models.tarea_model import TareaModel
+from app.infrastructure.queries import plan_consultas
+
+
+def _sin_indice(resultados):
+    return [(r['metodo'], r['plan']) for r in resultados if not r['usa_indice']]
+
+
+def test_las_consultas_de_repositorio_usan_indices(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    for i in range(5):
+        servicios.tareas.crear_tarea(f'Tarea {i}', proyecto_creado.id_proyecto, id_miembro_asignado=ana.id_miembro)
+
+    resultados = plan_consultas.verificar_uso_de_indices()
+
+    assert len({r['metodo'] for r in resultados}) == len(plan_consultas._casos())
+    assert _sin_indice(resultados) == []
+
+
+def test_tambien_sobre_una_base_migrada(base_con_textos):
+    aplicar_migraciones()
+
+    assert _sin_indice(plan_consultas.verificar_uso_de_indices()) == []
+
+
+@pytest.fixture
+def caso_sin_indice(monkeypatch):
+    casos = [('TareaModel por descripción', lambda: TareaModel.query.filter_by(descripcion='x').all())]
+    monkeypatch.setattr(plan_consultas, '_casos', lambda: casos)
+
+
+def test_un_recorrido_completo_se_informa_y_falla_el_comando(app, base, caso_sin_indice):
+    (resultado,) = plan_consultas.verificar_uso_de_indices()
+    assert not resultado['usa_indice'] and resultado['plan'] == ['SCAN tareas']
+
+    salida = app.test_cli_runner().invoke(args=['verificar-indices'])
+    assert salida.exit_code == 1 and '✗ TareaModel por descripción' in salida.output
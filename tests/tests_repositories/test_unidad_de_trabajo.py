@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import db
+from app.infrastructure.models.proyecto_model import ProyectoModel
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo, en_unidad_de_trabajo
+
+
+@pytest.fixture
+def commits(base):
+    """Lista con un elemento por cada COMMIT de la sesión"""
+    confirmados = []
+
+    def _contar(session):
+        confirmados.append(session)
+
+    event.listen(Session, 'after_commit', _contar)
+    yield confirmados
+    event.remove(Session, 'after_commit', _contar)
+
+
+def _crear_proyecto(servicios, nombre):
+    return servicios.proyectos.crear_proyecto(nombre, '2025-01-01', '2025-12-31')
+
+
+def _nombres_confirmados():
+    """Nombres de proyecto visibles desde otra conexión (solo lo confirmado)"""
+    with db.engine.connect() as conexion:
+        return {fila[0] for fila in conexion.exec_driver_sql("SELECT nombre FROM proyectos")}
+
+
+def test_fuera_de_una_unidad_cada_escritura_confirma(servicios, commits):
+    _crear_proyecto(servicios, 'Proyecto A')
+    _crear_proyecto(servicios, 'Proyecto B')
+
+    assert len(commits) == 2
+    assert _nombres_confirmados() == {'Proyecto A', 'Proyecto B'}
+
+
+def test_unidades_anidadas_confirman_una_vez_al_cerrar_la_externa(servicios, commits):
+    with UnidadDeTrabajo():
+        _crear_proyecto(servicios, 'Proyecto A')
+        with UnidadDeTrabajo():
+            _crear_proyecto(servicios, 'Proyecto B')
+        assert en_unidad_de_trabajo()
+        assert commits == []
+        assert _nombres_confirmados() == set()
+
+    assert not en_unidad_de_trabajo()
+    assert len(commits) == 1
+    assert _nombres_confirmados() == {'Proyecto A', 'Proyecto B'}
+
+
+def test_una_excepcion_revierte_toda_la_unidad(servicios, commits):
+    with pytest.raises(RuntimeError):
+        with UnidadDeTrabajo():
+            _crear_proyecto(servicios, 'Proyecto A')
+            raise RuntimeError('falla a mitad del caso de uso')
+
+    assert commits == []
+    assert db.session.query(ProyectoModel).count() == 0
+
+
+def test_el_fallo_de_una_unidad_interna_revierte_la_externa(servicios, commits):
+    with UnidadDeTrabajo():
+        _crear_proyecto(servicios, 'Proyecto A')
+        try:
+            with UnidadDeTrabajo():
+                _crear_proyecto(servicios, 'Proyecto B')
+                raise RuntimeError('falla la unidad interna')
+        except RuntimeError:
+            pass
+
+    assert commits == []
+    assert db.session.query(ProyectoModel).count() == 0
+
+
+def test_unidad_independiente_confirma_aunque_la_externa_falle(servicios, commits):
+    with pytest.raises(RuntimeError):
+        with UnidadDeTrabajo():
+            with UnidadDeTrabajo(independiente=True):
+                _crear_proyecto(servicios, 'Proyecto A')
+            assert len(commits) == 1
+            _crear_proyecto(servicios, 'Proyecto B')
+            raise RuntimeError('falla la unidad externa')
+
+    assert _nombres_confirmados() == {'Proyecto A'}
+
+
+def test_la_peticion_confirma_una_vez_al_final(app, servicios, proyecto, commits):
+    proyecto_creado, (miembro, _) = proyecto
+    tarea = servicios.tareas.crear_tarea('Tarea', proyecto_creado.id_proyecto)
+    del commits[:]
+
+    respuesta = app.test_client().post(f'/tareas/actualizar/{tarea.id_tarea}', data={
+        'titulo': 'Tarea renombrada',
+        'descripcion': '',
+        'prioridad': 'alta',
+        'estado': 'pendiente',
+        'fecha_vencimiento': '',
+        'id_miembro_asignado': str(miembro.id_miembro),
+    })
+
+    assert respuesta.status_code == 302
+    assert len(commits) == 1
+    actualizada = servicios.tareas.obtener_tarea(tarea.id_tarea)
+    assert (actualizada.titulo, actualizada.id_miembro_asignado) == ('Tarea renombrada', miembro.id_miembro)
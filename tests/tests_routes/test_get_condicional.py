@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.presentation import get_condicional
+
+
+@pytest.fixture
+def tarea(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    return servicios.tareas.crear_tarea('Tarea de prueba', proyecto_creado.id_proyecto, id_miembro_asignado=ana.id_miembro)
+
+
+@pytest.mark.parametrize('url', ['/tareas/', '/proyectos/', '/miembros/'])
+def test_un_listado_sin_cambios_responde_304(app, tarea, url):
+    cliente = app.test_client()
+    primera = cliente.get(url)
+
+    assert primera.status_code == 200 and primera.headers['ETag'].startswith('W/')
+    assert primera.headers['Cache-Control'] == 'no-cache'
+    segunda = cliente.get(url, headers={'If-None-Match': primera.headers['ETag']})
+    assert segunda.status_code == 304 and segunda.data == b''
+    assert segunda.headers['ETag'] == primera.headers['ETag']
+
+
+def test_una_escritura_cambia_la_etag_del_listado(app, servicios, tarea):
+    cliente = app.test_client()
+    etag = cliente.get('/tareas/').headers['ETag']
+
+    servicios.tareas.completar_tarea(tarea.id_tarea)
+
+    respuesta = cliente.get('/tareas/', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers['ETag'] != etag
+
+
+def test_la_etag_depende_de_la_url(app, tarea):
+    cliente = app.test_client()
+    etag = cliente.get('/tareas/').headers['ETag']
+
+    respuesta = cliente.get('/tareas/?estado=completada', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200
+
+
+def test_el_detalle_cambia_solo_con_lo_que_muestra(app, servicios, proyecto):
+    proyecto_creado, _ = proyecto
+    cliente = app.test_client()
+    url = f'/proyectos/{proyecto_creado.id_proyecto}'
+    etag = cliente.get(url).headers['ETag']
+
+    servicios.proyectos.crear_proyecto('Otro proyecto', '2025-01-01', '2026-12-31')
+    assert cliente.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    servicios.proyectos.actualizar_proyecto(proyecto_creado.id_proyecto, nombre='Nombre nuevo')
+    respuesta = cliente.get(url, headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200 and 'Nombre nuevo' in respuesta.get_data(as_text=True)
+
+
+def test_if_modified_since_responde_304_solo_el_mismo_dia(app, tarea, monkeypatch):
+    cliente = app.test_client()
+    ultima_modificacion = cliente.get('/tareas/').headers['Last-Modified']
+    assert cliente.get('/tareas/', headers={'If-Modified-Since': ultima_modificacion}).status_code == 304
+
+    class Manana(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr(get_condicional, 'date', Manana)
+    respuesta = cliente.get('/tareas/', headers={'If-Modified-Since': ultima_modificacion})
+    assert respuesta.status_code == 200
+    assert cliente.get('/tareas/', headers={'If-Modified-Since': respuesta.headers['Last-Modified']}).status_code == 304
+
+
+def test_con_mensajes_flash_pendientes_no_hay_304(app, tarea):
+    cliente = app.test_client()
+    etag = cliente.get('/tareas/').headers['ETag']
+    with cliente.session_transaction() as sesion:
+        sesion['_flashes'] = [('success', 'Tarea creada exitosamente')]
+
+    respuesta = cliente.get('/tareas/', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200 and b'Tarea creada exitosamente' in respuesta.data
+
+
+def test_una_entidad_inexistente_no_usa_etag(app, base):
+    respuesta = app.test_client().get('/tareas/999')
+
+    assert respuesta.status_code == 302 and 'ETag' not in respuesta.headers
@@ -0,0 +1,59 @@
+import io
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+def directorio_errores(app):
+    return os.path.join(app.instance_path, 'importaciones')
+
+
+def _importar_miembros(app, contenido: bytes):
+    return app.test_client().post('/importaciones/miembros', data={
+        'archivo': (io.BytesIO(contenido), 'miembros.csv')
+    }, content_type='multipart/form-data')
+
+
+def _archivos_errores(directorio):
+    return sorted(nombre for nombre in os.listdir(directorio) if nombre.startswith('errores_'))
+
+
+def test_las_filas_rechazadas_quedan_en_un_csv_descargable(app, base, directorio_errores):
+    contenido = (
+        "nombre,apellido,email,rol,fecha_ingreso\n"
+        "Ana,Pérez,ana@empresa.com,desarrollador,2024-01-10\n"
+        "Luis,Gómez,no-es-un-email,tester,2024-02-01\n"
+    ).encode('utf-8')
+
+    respuesta = _importar_miembros(app, contenido)
+
+    assert respuesta.status_code == 201
+    resumen = respuesta.get_json()
+    assert (resumen['creadas'], len(_archivos_errores(directorio_errores))) == (1, 1)
+    descarga = app.test_client().get(resumen['archivo_errores'])
+    assert descarga.status_code == 200 and b'no-es-un-email' in descarga.data
+
+
+def test_una_importacion_fallida_no_deja_archivo_de_errores(app, base, directorio_errores):
+    contenido = "nombre,apellido,email,rol,fecha_ingreso\nJosé,Núñez,jose@empresa.com,tester,2024-01-10\n"
+
+    respuesta = _importar_miembros(app, contenido.encode('latin-1'))
+
+    assert respuesta.status_code == 400
+    assert _archivos_errores(directorio_errores) == []
+
+
+def test_los_archivos_de_errores_vencidos_se_borran(app, base, directorio_errores):
+    os.makedirs(directorio_errores, exist_ok=True)
+    vencido = os.path.join(directorio_errores, 'errores_vencido.csv')
+    reciente = os.path.join(directorio_errores, 'errores_reciente.csv')
+    for ruta in (vencido, reciente):
+        with open(ruta, 'w') as archivo:
+            archivo.write('linea,error,registro\n')
+    hace_dos_dias = time.time() - 2 * 86400
+    os.utime(vencido, (hace_dos_dias, hace_dos_dias))
+
+    assert app.test_client().get('/importaciones/errores/errores_vencido.csv').status_code == 404
+    assert _archivos_errores(directorio_errores) == ['errores_reciente.csv']
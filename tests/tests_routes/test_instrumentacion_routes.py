@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from app import create_app, db
+from tests.conftest import ConfigPruebas
+
+
+@pytest.fixture
+def app_medida(tmp_path):
+    """App que mide todas las peticiones"""
+    class Configuracion(ConfigPruebas):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'gestion.db'}"
+        INSTRUMENTACION_SQL_MUESTREO = 1.0
+        INSTRUMENTACION_SQL_REPETIDAS = 1
+
+    app = create_app(Configuracion)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _sentencias(server_timing):
+    return int(re.search(r'db;desc="(\d+) sentencias"', server_timing).group(1))
+
+
+def _medidas(app):
+    return app.test_client().get('/estado/sql').get_json()['peticiones']
+
+
+def test_server_timing_y_estado_sql_cuentan_las_mismas_sentencias(app_medida):
+    respuesta = app_medida.test_client().get('/tareas/?estado=pendiente')
+
+    sentencias = _sentencias(respuesta.headers['Server-Timing'])
+    assert sentencias > 0
+    (medida,) = _medidas(app_medida)
+    assert (medida['ruta'], medida['estado'], medida['sentencias']) == ('/tareas/?estado=pendiente', 200, sentencias)
+    assert medida['mas_lenta']['sql'].startswith('SELECT')
+
+
+def test_las_sentencias_repetidas_se_marcan(app_medida):
+    respuesta = app_medida.test_client().get('/tareas/')
+
+    assert 'db-repetidas;desc="posible N+1: ' in respuesta.headers['Server-Timing']
+    assert _medidas(app_medida)[0]['repetidas']
+
+
+def test_sin_muestreo_no_hay_medicion(app, base):
+    assert 'Server-Timing' not in app.test_client().get('/tareas/').headers
+    assert _medidas(app) == []
+
+
+@pytest.mark.parametrize('url', ['/api/v1/tareas?formato=ndjson', '/exportaciones/tareas.csv.gz'])
+def test_en_streaming_se_mide_hasta_cerrar_la_respuesta(app_medida, url):
+    from app.application.services.proyecto_service import ProyectoService
+    from app.application.services.tarea_service import TareaService
+
+    proyecto = ProyectoService().crear_proyecto('Proyecto de prueba', '2025-01-01', '2026-12-31')
+    TareaService().crear_tarea('Tarea de prueba', proyecto.id_proyecto)
+    respuesta = app_medida.test_client().get(url)
+    assert respuesta.status_code == 200 and respuesta.data
+    respuesta.close()
+
+    assert 'Server-Timing' not in respuesta.headers
+    medida = next(m for m in _medidas(app_medida) if m['ruta'] == url)
+    assert medida['estado'] == 200 and medida['sentencias'] > 0
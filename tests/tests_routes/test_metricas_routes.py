@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from app import create_app, db
+from app.infrastructure.metricas import metricas
+from app.infrastructure.metricas.almacen import AlmacenMetricas, ArchivoMetricas
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+from tests.conftest import ConfigPruebas
+
+
+@pytest.fixture
+def app_metricas(tmp_path, monkeypatch):
+    """App con métricas habilitadas; el almacén global se restaura al terminar"""
+    monkeypatch.setattr(metricas, 'almacen', AlmacenMetricas())
+
+    class Configuracion(ConfigPruebas):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'gestion.db'}"
+        METRICAS_HABILITADAS = True
+        METRICAS_DIRECTORIO = str(tmp_path / 'metricas')
+
+    app = create_app(Configuracion)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _lineas(app):
+    respuesta = app.test_client().get('/metrics')
+    assert respuesta.status_code == 200 and respuesta.mimetype == 'text/plain'
+    return respuesta.get_data(as_text=True).splitlines()
+
+
+def test_cada_peticion_suma_en_su_endpoint(app_metricas):
+    cliente = app_metricas.test_client()
+    cliente.get('/tareas/')
+    cliente.get('/tareas/')
+
+    lineas = _lineas(app_metricas)
+
+    assert 'gestion_peticiones_total{endpoint="tareas.listar",estado="200"} 2.0' in lineas
+    assert 'gestion_peticion_duracion_segundos_bucket{endpoint="tareas.listar",metodo="GET",le="+Inf"} 2.0' in lineas
+    assert 'gestion_peticion_duracion_segundos_count{endpoint="tareas.listar",metodo="GET"} 2.0' in lineas
+    assert 'gestion_peticion_db_segundos_count{endpoint="tareas.listar",metodo="GET"} 2.0' in lineas
+    assert any(linea.startswith('gestion_peticion_sentencias_sql_total{endpoint="tareas.listar"}') for linea in lineas)
+
+
+def test_los_contadores_de_casos_de_uso_suman_solo_al_confirmar(app_metricas):
+    from app.application.services.proyecto_service import ProyectoService
+    from app.application.services.tarea_service import TareaService
+
+    proyecto = ProyectoService().crear_proyecto('Proyecto de prueba', '2025-01-01', '2026-12-31')
+    tareas = TareaService()
+    tareas.crear_tarea('Primera', proyecto.id_proyecto)
+    with pytest.raises(RuntimeError):
+        with UnidadDeTrabajo():
+            tareas.crear_tarea('Revertida', proyecto.id_proyecto)
+            raise RuntimeError('falla después de crear la tarea')
+
+    assert 'gestion_tareas_creadas_total 1.0' in _lineas(app_metricas)
+
+
+def test_suma_los_archivos_de_todos_los_procesos(app_metricas):
+    app_metricas.test_client().get('/tareas/')
+    otro_proceso = ArchivoMetricas(os.path.join(app_metricas.config['METRICAS_DIRECTORIO'], 'metricas_1.db'))
+    otro_proceso.sumar(metricas.PETICIONES._clave(
+        'gestion_peticiones_total', [('endpoint', 'tareas.listar'), ('estado', '200')]
+    ), 3)
+    otro_proceso.cerrar()
+
+    assert 'gestion_peticiones_total{endpoint="tareas.listar",estado="200"} 4.0' in _lineas(app_metricas)
+
+
+def test_en_streaming_cuenta_las_sentencias_del_cuerpo(app_metricas):
+    from app.application.services.proyecto_service import ProyectoService
+    from app.application.services.tarea_service import TareaService
+
+    proyecto = ProyectoService().crear_proyecto('Proyecto de prueba', '2025-01-01', '2026-12-31')
+    TareaService().crear_tarea('Tarea de prueba', proyecto.id_proyecto)
+    respuesta = app_metricas.test_client().get('/api/v1/tareas?formato=ndjson')
+    assert respuesta.data
+    respuesta.close()
+
+    (linea,) = [l for l in _lineas(app_metricas) if l.startswith('gestion_peticion_sentencias_sql_total{endpoint="api.')]
+    assert float(linea.split()[-1]) > 0
@@ -0,0 +1,31 @@
+import re
+
+
+def _opciones(html, nombre):
+    """Valores de las opciones del selector `nombre` del formulario de filtros"""
+    selector = re.search(rf'<select name="{nombre}".*?</select>', html, re.S).group(0)
+    return re.findall(r'<option value="(\d+)"', selector)
+
+
+def test_solo_la_primera_pagina_lista_todos_los_proyectos_y_miembros(app, servicios, proyecto):
+    from app.domain.consultas.tarea_filtro import TareaFiltro
+
+    proyecto_creado, (ana, luis) = proyecto
+    otro = servicios.proyectos.crear_proyecto('Otro proyecto', '2025-01-01', '2026-12-31')
+    for i in range(5):
+        servicios.tareas.crear_tarea(f'Tarea {i}', proyecto_creado.id_proyecto, id_miembro_asignado=ana.id_miembro)
+    cliente = app.test_client()
+
+    primera = cliente.get(f'/tareas/?proyecto={proyecto_creado.id_proyecto}&limite=2').get_data(as_text=True)
+    assert _opciones(primera, 'proyecto') == [str(proyecto_creado.id_proyecto), str(otro.id_proyecto)]
+    assert _opciones(primera, 'miembro') == [str(ana.id_miembro), str(luis.id_miembro)]
+
+    filtro = TareaFiltro(id_proyecto=proyecto_creado.id_proyecto, id_miembro=ana.id_miembro)
+    cursor = servicios.tareas.listar_tareas_filtradas(filtro, limite=2).cursor_siguiente
+    siguiente = cliente.get('/tareas/', query_string={
+        'proyecto': proyecto_creado.id_proyecto, 'miembro': ana.id_miembro, 'limite': 2, 'cursor': cursor
+    }).get_data(as_text=True)
+    assert 'Tarea 2' in siguiente
+    assert _opciones(siguiente, 'proyecto') == [str(proyecto_creado.id_proyecto)]
+    assert _opciones(siguiente, 'miembro') == [str(ana.id_miembro)]
+    assert 'selected>Proyecto de prueba</option>' in siguiente
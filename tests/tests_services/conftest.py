@@ -0,0 +1,11 @@
+import pytest
+
+from app import db
+
+
+@pytest.fixture
+def contar(base):
+    """Función que cuenta las filas de una tabla que cumplen una condición SQL"""
+    def _contar(tabla, condicion='1 = 1', **parametros):
+        return db.session.execute(db.text(f"SELECT count(*) FROM {tabla} WHERE {condicion}"), parametros).scalar()
+    return _contar
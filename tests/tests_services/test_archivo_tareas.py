@@ -0,0 +1,117 @@
+import pytest
+
+from app.domain.consultas.tarea_filtro import TareaFiltro
+from app.domain.exceptions.proyecto_exceptions import NoEncontradoError
+
+
+@pytest.fixture
+def proyecto_finalizado(servicios, proyecto):
+    """Proyecto finalizado con 4 tareas completadas (de Ana y de Luis) y 2 abiertas; devuelve (proyecto, miembros, tareas)"""
+    proyecto_creado, miembros = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    tareas = [
+        servicios.tareas.crear_tarea(f'Tarea {i}', id_proyecto, id_miembro_asignado=miembros[i % 2].id_miembro)
+        for i in range(6)
+    ]
+    for tarea in tareas[:4]:
+        servicios.tareas.completar_tarea(tarea.id_tarea)
+    servicios.proyectos.actualizar_proyecto(id_proyecto, estado='finalizado')
+    return proyecto_creado, miembros, tareas
+
+
+def test_archivar_y_restaurar(servicios, proyecto_finalizado, contar):
+    proyecto_creado, _, tareas = proyecto_finalizado
+    id_proyecto = proyecto_creado.id_proyecto
+
+    assert servicios.tareas.archivar_tareas(tamano_bloque=3) == 4
+    assert contar('tareas') == 2 and contar('tareas_archivadas') == 4
+    assert servicios.tareas.obtener_tarea_detalle(tareas[0].id_tarea)['archivada'] is True
+    assert [t.id_tarea for t in servicios.tareas.listar_tareas_filtradas(TareaFiltro())] == [
+        t.id_tarea for t in tareas[4:]
+    ]
+    assert len(servicios.tareas.listar_tareas_filtradas(TareaFiltro(incluir_archivadas=True)).elementos) == 6
+
+    assert servicios.tareas.restaurar_tareas(id_proyecto=id_proyecto, tamano_bloque=3) == 4
+    assert contar('tareas') == 6 and contar('tareas_archivadas') == 0
+    restaurada = servicios.tareas.obtener_tarea_detalle(tareas[0].id_tarea)
+    assert restaurada['archivada'] is False and restaurada['tarea'].estado == 'completada'
+    # Los triggers FTS siguen el movimiento: la tarea restaurada se encuentra una sola vez
+    assert [t.id_tarea for t in servicios.tareas.buscar('Tarea 0')] == [tareas[0].id_tarea]
+
+
+def test_eliminar_proyecto_con_tareas_archivadas(servicios, proyecto_finalizado, contar):
+    proyecto_creado, miembros, _ = proyecto_finalizado
+    id_proyecto = proyecto_creado.id_proyecto
+    servicios.tareas.archivar_tareas()
+    servicios.proyectos.TAMANO_BLOQUE_BORRADO = 1
+
+    assert servicios.proyectos.eliminar_proyecto(id_proyecto) is True
+
+    assert contar('proyectos') == 0
+    assert contar('tareas') == 0 and contar('tareas_archivadas') == 0
+    assert contar('proyecto_miembro') == 0 and contar('proyecto_estadisticas') == 0
+    assert contar('tareas_fts') == 0
+    assert contar('miembros') == len(miembros)
+    with pytest.raises(NoEncontradoError):
+        servicios.proyectos.eliminar_proyecto(id_proyecto)
+
+
+def test_eliminar_miembro_desasigna_tambien_sus_tareas_archivadas(servicios, proyecto_finalizado, contar):
+    proyecto_creado, (ana, luis), tareas = proyecto_finalizado
+    servicios.tareas.archivar_tareas()
+
+    assert servicios.miembros.eliminar_miembro(ana.id_miembro) is True
+
+    condicion = 'id_miembro_asignado = :id'
+    assert contar('tareas', condicion, id=ana.id_miembro) == 0
+    assert contar('tareas_archivadas', condicion, id=ana.id_miembro) == 0
+    assert contar('proyecto_miembro', 'id_miembro = :id', id=ana.id_miembro) == 0
+    assert contar('tareas') + contar('tareas_archivadas') == len(tareas)
+    assert contar('tareas_archivadas', condicion, id=luis.id_miembro) == 2
+    assert servicios.tareas.recalcular_estadisticas() == []
+
+
+def test_los_ids_archivados_no_se_reutilizan(servicios, proyecto_finalizado):
+    proyecto_creado, _, tareas = proyecto_finalizado
+    archivadas = tareas[:4]
+    assert servicios.tareas.archivar_tareas() == len(archivadas)
+    # Sin AUTOINCREMENT, borrar las de id más alto haría que la próxima tarea reciba el id 1
+    for tarea in tareas[4:]:
+        servicios.tareas.eliminar_tarea(tarea.id_tarea)
+    otro = servicios.proyectos.crear_proyecto('Otro proyecto', '2025-01-01', '2026-12-31')
+
+    nueva = servicios.tareas.crear_tarea('Nueva', otro.id_proyecto)
+
+    assert nueva.id_tarea == tareas[-1].id_tarea + 1
+    assert servicios.tareas.obtener_tarea_detalle(archivadas[0].id_tarea)['archivada'] is True
+    assert servicios.tareas.restaurar_tareas(id_proyecto=proyecto_creado.id_proyecto) == len(archivadas)
+    assert servicios.tareas.obtener_tarea_detalle(archivadas[0].id_tarea)['tarea'].titulo == 'Tarea 0'
+
+
+def test_las_tareas_archivadas_siguen_en_los_contadores(servicios, proyecto_finalizado):
+    proyecto_creado, _, tareas = proyecto_finalizado
+    id_proyecto = proyecto_creado.id_proyecto
+    antes = servicios.tareas.obtener_estadisticas_proyecto(id_proyecto)
+
+    assert servicios.tareas.archivar_tareas() == 4
+    assert servicios.tareas.obtener_estadisticas_proyecto(id_proyecto) == antes
+    assert servicios.tareas.recalcular_estadisticas() == []
+
+    servicios.tareas.eliminar_tarea(tareas[0].id_tarea)
+    assert servicios.tareas.obtener_estadisticas_proyecto(id_proyecto)['completada'] == antes['completada'] - 1
+    assert servicios.tareas.recalcular_estadisticas() == []
+
+
+@pytest.mark.parametrize('url', ['/proyectos/', '/tareas/?archivadas=1'])
+def test_borrar_una_tarea_archivada_cambia_la_marca_de_los_listados(app, servicios, proyecto_finalizado, url):
+    _, _, tareas = proyecto_finalizado
+    servicios.tareas.archivar_tareas()
+    cliente = app.test_client()
+    etag = cliente.get(url).headers['ETag']
+    assert cliente.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    servicios.tareas.eliminar_tarea(tareas[0].id_tarea)
+
+    respuesta = cliente.get(url, headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers['ETag'] != etag
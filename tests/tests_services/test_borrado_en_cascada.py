@@ -0,0 +1,47 @@
+import pytest
+
+from app import db
+from app.domain.exceptions.proyecto_exceptions import NoEncontradoError
+
+
+@pytest.fixture
+def tareas(servicios, proyecto):
+    """Cinco tareas del proyecto, alternando entre Ana y Luis"""
+    proyecto_creado, miembros = proyecto
+    return [
+        servicios.tareas.crear_tarea(
+            f'Tarea {i}', proyecto_creado.id_proyecto, id_miembro_asignado=miembros[i % 2].id_miembro
+        )
+        for i in range(5)
+    ]
+
+
+def test_las_claves_foraneas_estan_activas(base):
+    assert db.session.execute(db.text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_eliminar_proyecto_borra_sus_filas_por_bloques(servicios, proyecto, tareas, contar):
+    proyecto_creado, miembros = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    servicios.proyectos.TAMANO_BLOQUE_BORRADO = 2
+
+    assert servicios.proyectos.eliminar_proyecto(id_proyecto) is True
+
+    assert contar('proyectos') == 0 and contar('tareas') == 0
+    assert contar('proyecto_miembro') == 0 and contar('proyecto_estadisticas') == 0
+    assert contar('tareas_fts') == 0
+    assert contar('miembros') == len(miembros)
+    with pytest.raises(NoEncontradoError):
+        servicios.proyectos.eliminar_proyecto(id_proyecto)
+
+
+def test_eliminar_miembro_desasigna_sus_tareas(servicios, proyecto, tareas, contar):
+    _, (ana, luis) = proyecto
+
+    assert servicios.miembros.eliminar_miembro(ana.id_miembro) is True
+
+    assert contar('tareas', 'id_miembro_asignado = :id', id=ana.id_miembro) == 0
+    assert contar('tareas', 'id_miembro_asignado IS NULL') == 3
+    assert contar('tareas', 'id_miembro_asignado = :id', id=luis.id_miembro) == 2
+    assert contar('proyecto_miembro', 'id_miembro = :id', id=ana.id_miembro) == 0
+    assert servicios.tareas.recalcular_estadisticas() == []
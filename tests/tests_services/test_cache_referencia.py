@@ -0,0 +1,44 @@
+from app import db
+from app.infrastructure.cache.cache_versionado import cache_referencia
+from app.infrastructure.repositories.unidad_de_trabajo import UnidadDeTrabajo
+
+
+def _escribir_desde_otro_proceso(sql, **parametros):
+    """Escritura confirmada por otra conexión, sin pasar por la sesión (como otro worker)"""
+    with db.engine.begin() as conexion:
+        conexion.execute(db.text(sql), parametros)
+
+
+def test_las_lecturas_repetidas_salen_de_la_cache(servicios, proyecto):
+    servicios.proyectos.listar_proyectos()
+    antes = cache_referencia.estadisticas()['aciertos']
+
+    servicios.proyectos.listar_proyectos()
+
+    assert cache_referencia.estadisticas()['aciertos'] == antes + 1
+
+
+def test_una_escritura_de_otro_proceso_invalida_la_cache(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    assert servicios.proyectos.obtener_proyecto(id_proyecto).nombre == 'Proyecto de prueba'
+    assert len(servicios.miembros.listar_miembros()) == 2
+
+    _escribir_desde_otro_proceso(
+        "UPDATE proyectos SET nombre = 'Renombrado' WHERE id_proyecto = :id", id=id_proyecto
+    )
+    _escribir_desde_otro_proceso("DELETE FROM proyecto_miembro WHERE id_miembro = :id", id=ana.id_miembro)
+    _escribir_desde_otro_proceso("DELETE FROM miembros WHERE id_miembro = :id", id=ana.id_miembro)
+
+    assert servicios.proyectos.obtener_proyecto(id_proyecto).nombre == 'Renombrado'
+    assert [p.nombre for p in servicios.proyectos.listar_proyectos()] == ['Renombrado']
+    assert len(servicios.miembros.listar_miembros()) == 1
+    assert len(servicios.proyectos.obtener_miembros_del_proyecto(id_proyecto)) == 1
+
+
+def test_las_escrituras_sin_confirmar_no_usan_la_cache(servicios, proyecto):
+    servicios.proyectos.listar_proyectos()
+    with UnidadDeTrabajo():
+        servicios.proyectos.crear_proyecto('Otro proyecto', '2025-01-01', '2025-12-31')
+        assert len(servicios.proyectos.listar_proyectos()) == 2
+    assert len(servicios.proyectos.listar_proyectos()) == 2
@@ -0,0 +1,83 @@
+import pytest
+
+from app import db
+from app.infrastructure.models.proyecto_estadistica_model import ProyectoEstadisticaModel
+
+
+def _contadores(servicios, id_proyecto):
+    """Contadores guardados, comprobando que coinciden con un recálculo desde cero"""
+    assert servicios.tareas.recalcular_estadisticas() == []
+    return servicios.tareas.obtener_estadisticas_proyecto(id_proyecto)
+
+
+@pytest.fixture
+def tareas(servicios, proyecto):
+    """Una tarea sin asignar (pendiente) y dos asignadas (en_progreso)"""
+    proyecto_creado, (ana, luis) = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    return [
+        servicios.tareas.crear_tarea('Sin asignar', id_proyecto),
+        servicios.tareas.crear_tarea('De Ana', id_proyecto, id_miembro_asignado=ana.id_miembro),
+        servicios.tareas.crear_tarea('De Luis', id_proyecto, id_miembro_asignado=luis.id_miembro),
+    ]
+
+
+def test_alta_de_tareas(servicios, proyecto, tareas):
+    id_proyecto = proyecto[0].id_proyecto
+
+    assert _contadores(servicios, id_proyecto) == {
+        'total': 3, 'pendiente': 1, 'en_progreso': 2, 'completada': 0, 'bloqueada': 0
+    }
+
+
+def test_alta_en_lote(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    resultado = servicios.tareas.crear_tareas_en_lote([
+        {'titulo': 'Lote 1', 'id_proyecto': proyecto_creado.id_proyecto},
+        {'titulo': 'Lote 2', 'id_proyecto': proyecto_creado.id_proyecto, 'id_miembro_asignado': ana.id_miembro},
+        {'titulo': '', 'id_proyecto': proyecto_creado.id_proyecto},
+    ])
+
+    assert len(resultado['creadas']) == 2 and len(resultado['errores']) == 1
+    contadores = _contadores(servicios, proyecto_creado.id_proyecto)
+    assert (contadores['total'], contadores['pendiente'], contadores['en_progreso']) == (2, 1, 1)
+
+
+def test_cambios_de_estado(servicios, proyecto, tareas):
+    id_proyecto = proyecto[0].id_proyecto
+    servicios.tareas.completar_tarea(tareas[1].id_tarea)
+    servicios.tareas.bloquear_tarea(tareas[2].id_tarea)
+
+    assert _contadores(servicios, id_proyecto) == {
+        'total': 3, 'pendiente': 1, 'en_progreso': 0, 'completada': 1, 'bloqueada': 1
+    }
+
+
+def test_cambios_de_estado_en_lote(servicios, proyecto, tareas):
+    id_proyecto = proyecto[0].id_proyecto
+    servicios.tareas.actualizar_tareas_en_lote([
+        {'id_tarea': tareas[1].id_tarea, 'estado': 'completada'},
+        {'id_tarea': tareas[2].id_tarea, 'estado': 'completada'},
+    ])
+
+    contadores = _contadores(servicios, id_proyecto)
+    assert (contadores['en_progreso'], contadores['completada']) == (0, 2)
+
+
+def test_baja_de_tarea(servicios, proyecto, tareas):
+    id_proyecto = proyecto[0].id_proyecto
+    servicios.tareas.eliminar_tarea(tareas[0].id_tarea)
+
+    assert _contadores(servicios, id_proyecto) == {
+        'total': 2, 'pendiente': 0, 'en_progreso': 2, 'completada': 0, 'bloqueada': 0
+    }
+
+
+def test_la_baja_del_proyecto_borra_sus_contadores(servicios, proyecto, tareas):
+    id_proyecto = proyecto[0].id_proyecto
+    _contadores(servicios, id_proyecto)
+
+    servicios.proyectos.eliminar_proyecto(id_proyecto)
+
+    assert db.session.get(ProyectoEstadisticaModel, id_proyecto) is None
+    assert servicios.tareas.recalcular_estadisticas() == []
@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+
+from app.infrastructure.repositories.proyecto_repository import ProyectoRepository
+
+
+def test_progreso_sale_de_los_contadores_y_cuenta_las_vencidas(servicios, proyecto):
+    proyecto_creado, (ana, luis) = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    vencio = (date.today() - timedelta(days=30)).isoformat()
+    vence = (date.today() + timedelta(days=30)).isoformat()
+    servicios.tareas.crear_tarea('Sin asignar', id_proyecto)
+    bloqueada = servicios.tareas.crear_tarea('Bloqueada', id_proyecto, id_miembro_asignado=luis.id_miembro)
+    servicios.tareas.crear_tarea('Vencida', id_proyecto, id_miembro_asignado=ana.id_miembro, fecha_vencimiento=vencio)
+    cerrada = servicios.tareas.crear_tarea('Vencida y completada', id_proyecto, id_miembro_asignado=ana.id_miembro,
+                                           fecha_vencimiento=vencio)
+    servicios.tareas.crear_tarea('Por vencer', id_proyecto, fecha_vencimiento=vence)
+    servicios.tareas.completar_tarea(cerrada.id_tarea)
+    servicios.tareas.bloquear_tarea(bloqueada.id_tarea)
+    otro = servicios.proyectos.crear_proyecto('Sin tareas', '2025-01-01', '2026-12-31')
+
+    progreso = ProyectoRepository().obtener_progreso([id_proyecto, otro.id_proyecto])
+
+    assert progreso == {
+        id_proyecto: {'total': 5, 'completadas': 1, 'bloqueadas': 1, 'vencidas': 1, 'miembros': 2},
+        otro.id_proyecto: {'total': 0, 'completadas': 0, 'bloqueadas': 0, 'vencidas': 0, 'miembros': 0},
+    }
+
+    # La tarea archivada sigue contando en total y completadas
+    servicios.proyectos.actualizar_proyecto(id_proyecto, estado='finalizado')
+    assert servicios.tareas.archivar_tareas() == 1
+    assert ProyectoRepository().obtener_progreso([id_proyecto]) == {id_proyecto: progreso[id_proyecto]}
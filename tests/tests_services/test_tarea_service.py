@@ -0,0 +1,52 @@
+import pytest
+
+from app import db
+from app.domain.consultas.tarea_filtro import TareaFiltro
+from app.domain.exceptions.proyecto_exceptions import DatoInvalidoError
+from app.infrastructure.models.tarea_model import TareaModel
+
+
+def test_crear_tareas_en_lote_devuelve_el_id_de_cada_fila(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    filas = [
+        {'titulo': f'Tarea en lote {i}', 'id_proyecto': proyecto_creado.id_proyecto,
+         'id_miembro_asignado': ana.id_miembro if i % 3 == 0 else None}
+        for i in range(50)
+    ]
+    filas[7]['titulo'] = ''
+
+    resultado = servicios.tareas.crear_tareas_en_lote(filas)
+
+    assert [error['fila'] for error in resultado['errores']] == [7]
+    assert len(resultado['creadas']) == 49
+    for creada in resultado['creadas']:
+        tarea = db.session.get(TareaModel, creada['id_tarea'])
+        assert tarea.titulo == filas[creada['fila']]['titulo']
+
+
+def test_buscar_aplica_todos_los_filtros_del_listado(servicios, proyecto):
+    proyecto_creado, (ana, _) = proyecto
+    id_proyecto = proyecto_creado.id_proyecto
+    informe = servicios.tareas.crear_tarea('Informe mensual', id_proyecto, prioridad='alta', fecha_vencimiento='2025-03-10')
+    servicios.tareas.crear_tarea('Informe anual', id_proyecto, prioridad='baja', fecha_vencimiento='2025-03-10')
+    servicios.tareas.crear_tarea('Informe semanal', id_proyecto, prioridad='alta', fecha_vencimiento='2025-06-01')
+    bloqueado = servicios.tareas.crear_tarea('Informe diario', id_proyecto, id_miembro_asignado=ana.id_miembro,
+                                             prioridad='alta', fecha_vencimiento='2025-03-10')
+    servicios.tareas.bloquear_tarea(bloqueado.id_tarea)
+
+    filtro = TareaFiltro(prioridades=['alta'], sin_asignar=True, estados=['pendiente', 'bloqueada'],
+                         vence_desde='2025-03-01', vence_hasta='2025-03-31')
+
+    assert [t.id_tarea for t in servicios.tareas.buscar('informe', filtro)] == [informe.id_tarea]
+    assert [t.id_tarea for t in servicios.tareas.buscar('informe', TareaFiltro(estados=['bloqueada']))] == [
+        bloqueado.id_tarea
+    ]
+    assert [t.id_tarea for t in servicios.tareas.buscar('informe', TareaFiltro(id_miembro=ana.id_miembro))] == [
+        bloqueado.id_tarea
+    ]
+
+
+@pytest.mark.parametrize('filtro', [TareaFiltro(orden='-prioridad'), TareaFiltro(incluir_archivadas=True)])
+def test_buscar_rechaza_orden_y_archivadas(servicios, filtro):
+    with pytest.raises(DatoInvalidoError):
+        servicios.tareas.buscar('informe', filtro)